@@ -1 +1,3 @@
+__version__ = "0.1.0"
+
 __all__ = ["geometry", "materials", "physics", "rom", "solver", "electrical", "viz", "io"]
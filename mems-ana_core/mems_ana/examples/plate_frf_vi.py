@@ -4,26 +4,26 @@ from mems_ana.materials.elastic import IsoElastic
 from mems_ana.materials.piezo import PiezoMat
 from mems_ana.materials.stack import Stack
 from mems_ana.rom.plate_rom import RectPlateROM, Mode
+from mems_ana.solver.frf import adaptive_frf
 
 plate = RectPlate(a=1.5e-3, b=1.5e-3)
 si = IsoElastic(E=160e9, nu=0.22, rho=2330.0)
-pzt = PiezoMat(d31=-120e-12, eps_r=1000.0, tan_delta=0.02)
+pzt = PiezoMat(E=60e9, nu=0.31, rho=7500.0, d31=-120e-12, eps_r=1000.0, tan_delta=0.02)
 
 stack = Stack(base=si, t_base=8e-6, piezo=pzt, t_pzt=2e-6, elec_area_ratio=0.8)
 
 model = RectPlateROM(plate, stack, modes=[Mode(1,1), Mode(2,1), Mode(1,2), Mode(2,2)])
 
 V_rms = 10.0
-f_list = np.linspace(1e3, 200e3, 400)
 
-uz_list = []
-I_list = []
+# resonance-aware grid: seeded at the modal frequencies, refined at every peak
+res = adaptive_frf(model, 1e3, 200e3, V_rms=V_rms, zeta=0.02)
+uz_abs = np.abs(res.uz)
+I_abs = np.abs(res.I)
 
-for f in f_list:
-    uz, I = model.frf_center_uz_and_I(V_rms=V_rms, f_hz=float(f), zeta=0.02)
-    uz_list.append(uz)
-    I_list.append(I)
-
-i_max = int(np.argmax(np.array(uz_list)))
-print(f"Peak uz (rough) at f={f_list[i_max]:.0f} Hz : uz_peak={uz_list[i_max]:.3e} m")
-print(f"At that f, terminal current (RMS): I={I_list[i_max]:.3e} A")
+i_pk = int(np.argmax(res.peak_uz_abs))
+f_pk = res.peak_f_hz[i_pk]
+_, I_pk = model.frf_center_spectrum(V_rms=V_rms, f_hz=f_pk, zeta=0.02)
+print(f"{res.n_evals} FRF evaluations (converged={res.converged})")
+print(f"Peak uz at f={f_pk:.1f} Hz : uz_peak={res.peak_uz_abs[i_pk]:.3e} m")
+print(f"At that f, terminal current (RMS): I={abs(I_pk):.3e} A")
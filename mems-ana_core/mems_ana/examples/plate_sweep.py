@@ -0,0 +1,36 @@
+from pathlib import Path
+
+import numpy as np
+from mems_ana.io.cache import ResultCache
+from mems_ana.io.config import load_config
+from mems_ana.io.export import ColumnWriter
+from mems_ana.solver.sweep import iter_sweep, run_sweep
+
+# design, drive and sweep axes (analysis-items.md §8) live in the YAML file
+cfg = load_config(Path(__file__).parent / "configs" / "diaphragm.yaml")
+model = cfg.rom()
+out = Path("outputs") / f"sweep_{cfg.hash[:12]}"  # same config -> same directory, resumes
+
+
+def report(p):
+    print(f"\r{p.done_points:,}/{p.total_points:,} points  {p.points_per_s:,.0f} pts/s", end="")
+
+
+res = run_sweep(
+    model, cfg.sweep.axes, cfg.drive.f_hz, V_rms=cfg.drive.V_rms, zeta=cfg.drive.zeta,
+    chunk_size=cfg.sweep.chunk_size, workers=cfg.sweep.workers, checkpoint_dir=out / "ckpt",
+    store_dir=out / "store",  # columns on disk, memory-mapped in res
+    cache=ResultCache(),  # chunks any earlier sweep computed are reused ($MEMS_ANA_CACHE)
+    progress=report,
+)
+print()
+
+uz_peak = np.abs(res.uz).max(axis=1)
+i = int(np.argmax(uz_peak))
+print("Best design:", {k: float(res.values(k)[i]) for k in cfg.sweep.axes})
+print(f"  uz_peak={uz_peak[i]:.3e} m, f11={res.f_modes_hz[i, 0]:,.0f} Hz")
+
+# static stress scalars (§7) of the same grid, reduced on the fly and streamed to disk
+with ColumnWriter(out / "stress", overwrite=True) as w:
+    for rec in iter_sweep(model, cfg.sweep.axes, V_rms=cfg.drive.V_rms, sigma_th=100e6):
+        w.append(rec)
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from mems_ana.geometry.plate import RectPlate
+
+
+@dataclass(frozen=True)
+class RectElectrode:
+    """Axis-aligned rectangle [x0, x1] x [y0, y1] in fractional plate coordinates (0..1)."""
+    x0: float
+    x1: float
+    y0: float
+    y1: float
+
+    def __post_init__(self) -> None:
+        if not (0.0 <= self.x0 < self.x1 <= 1.0 and 0.0 <= self.y0 < self.y1 <= 1.0):
+            raise ValueError(f"RectElectrode must satisfy 0 <= x0 < x1 <= 1 and 0 <= y0 < y1 <= 1, got {self}.")
+
+    def area_fraction(self) -> float:
+        return (self.x1 - self.x0) * (self.y1 - self.y0)
+
+
+@dataclass(frozen=True)
+class Electrode:
+    """One independently driven electrode: a union of non-overlapping rectangles."""
+    rects: tuple[RectElectrode, ...]
+    name: str = ""
+
+    def area_fraction(self) -> float:
+        return sum(r.area_fraction() for r in self.rects)
+
+    def mask(self, nx: int, ny: int) -> np.ndarray:
+        """Coverage of the uniform (nx, ny) node grid incl. edges (as PlateGrid), float 0/1."""
+        x = np.linspace(0.0, 1.0, nx)[:, None]
+        y = np.linspace(0.0, 1.0, ny)[None, :]
+        m = np.zeros((nx, ny), dtype=bool)
+        for r in self.rects:
+            m |= (x >= r.x0 - 1e-12) & (x <= r.x1 + 1e-12) & (y >= r.y0 - 1e-12) & (y <= r.y1 + 1e-12)
+        return m.astype(float)
+
+
+@dataclass(frozen=True)
+class ElectrodePattern:
+    """
+    Segmented electrode layout; each Electrode carries its own voltage.
+    Factories cover the layouts of analysis-items §1 (full, center,
+    edge ring, split); ratios are area fractions of the plate and
+    centered rectangles scale both sides by sqrt(ratio), as
+    StaticPlateSolver.default_electrode does.
+    """
+    electrodes: tuple[Electrode, ...]
+
+    @classmethod
+    def full(cls) -> "ElectrodePattern":
+        return cls((Electrode((RectElectrode(0.0, 1.0, 0.0, 1.0),), "full"),))
+
+    @classmethod
+    def center(cls, ratio: float) -> "ElectrodePattern":
+        return cls((Electrode((_centered(ratio),), "center"),))
+
+    @classmethod
+    def edge_ring(cls, inner_ratio: float, outer_ratio: float = 1.0) -> "ElectrodePattern":
+        """Ring between the centered rectangles of inner_ratio and outer_ratio."""
+        return cls((Electrode(_ring(inner_ratio, outer_ratio), "edge"),))
+
+    @classmethod
+    def center_and_ring(cls, center_ratio: float, gap_ratio: float = 0.0, outer_ratio: float = 1.0) -> "ElectrodePattern":
+        """Center electrode plus a separately driven edge ring (ring starts at center_ratio + gap_ratio)."""
+        return cls((
+            Electrode((_centered(center_ratio),), "center"),
+            Electrode(_ring(center_ratio + gap_ratio, outer_ratio), "edge"),
+        ))
+
+    @classmethod
+    def split(cls, n: int = 2, axis: str = "x", ratio: float = 1.0) -> "ElectrodePattern":
+        """Centered rectangle of `ratio` cut into n equal strips along `axis`."""
+        if n < 1 or axis not in ("x", "y"):
+            raise ValueError("split needs n >= 1 and axis 'x' or 'y'.")
+        c = _centered(ratio)
+        lo, hi = (c.x0, c.x1) if axis == "x" else (c.y0, c.y1)
+        cuts = np.linspace(lo, hi, n + 1)
+        out = []
+        for i in range(n):
+            if axis == "x":
+                r = RectElectrode(float(cuts[i]), float(cuts[i + 1]), c.y0, c.y1)
+            else:
+                r = RectElectrode(c.x0, c.x1, float(cuts[i]), float(cuts[i + 1]))
+            out.append(Electrode((r,), f"{axis}{i}"))
+        return cls(tuple(out))
+
+    def __len__(self) -> int:
+        return len(self.electrodes)
+
+    def area_fractions(self) -> np.ndarray:
+        return np.array([e.area_fraction() for e in self.electrodes])
+
+    def masks(self, nx: int, ny: int) -> np.ndarray:
+        """Stack of electrode masks, shape (E, nx, ny), for StaticPlateSolver."""
+        return np.stack([e.mask(nx, ny) for e in self.electrodes])
+
+
+# ---------- modal overlap ----------
+def rect_overlaps(
+    m: np.ndarray,
+    n: np.ndarray,
+    plate: RectPlate,
+    x0: np.ndarray,
+    x1: np.ndarray,
+    y0: np.ndarray,
+    y1: np.ndarray,
+) -> np.ndarray:
+    """
+    Dimensionless modal forcing overlap of the simply-supported modes
+    (m, n) (index arrays of shape (K,), e.g. ModeSet.m / ModeSet.n) with
+    rectangles (fractional coordinates, broadcast to shape R):
+
+      O_k = -∫_E ∇²φ_k dA = (kx^2 + ky^2) ∫_E φ_k dA
+          = (m^2 b/a + n^2 a/b) / (m n) (cos mπx0 - cos mπx1)(cos nπy0 - cos nπy1)
+
+    Returns shape (K, *R); the modal force per volt is M_V * O_k.
+    """
+    x0, x1, y0, y1 = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (x0, x1, y0, y1)))
+    m = np.asarray(m, dtype=float).reshape((-1,) + (1,) * x0.ndim)
+    n = np.asarray(n, dtype=float).reshape((-1,) + (1,) * x0.ndim)
+    r = plate.a / plate.b
+
+    pref = (m**2 / r + n**2 * r) / (m * n)
+    cx = np.cos(m * np.pi * x0) - np.cos(m * np.pi * x1)
+    cy = np.cos(n * np.pi * y0) - np.cos(n * np.pi * y1)
+    return pref * cx * cy
+
+
+def electrode_overlap(m: np.ndarray, n: np.ndarray, plate: RectPlate, electrode: Electrode) -> np.ndarray:
+    """Overlap vector O_k of one electrode, shape (K,); cached per (modes, aspect, electrode)."""
+    return _electrode_overlap(*_mode_key(m, n), plate.a / plate.b, electrode)
+
+
+def overlap_matrix(m: np.ndarray, n: np.ndarray, plate: RectPlate, pattern: ElectrodePattern) -> np.ndarray:
+    """
+    Overlap matrix O (K, E) of a pattern. Modal force per volt for a drive
+    vector v (E,) is then M_V * O @ v; cached per (modes, aspect, pattern).
+    """
+    return _overlap_matrix(*_mode_key(m, n), plate.a / plate.b, pattern)
+
+
+def center_overlaps(m: np.ndarray, n: np.ndarray, plate: RectPlate, ratios: np.ndarray) -> np.ndarray:
+    """
+    Overlaps of centered electrodes for a coverage sweep, shape (K, R), in
+    one pass. `plate` may also be a RectPlateBatch of R designs (one aspect
+    ratio per electrode).
+    """
+    h = 0.5 * np.sqrt(np.asarray(ratios, dtype=float))
+    return rect_overlaps(m, n, plate, 0.5 - h, 0.5 + h, 0.5 - h, 0.5 + h)
+
+
+def _mode_key(m: np.ndarray, n: np.ndarray) -> tuple[bytes, bytes]:
+    """Hashable cache key of the index arrays (int32, as ModeSet stores them)."""
+    return np.asarray(m, dtype=np.int32).tobytes(), np.asarray(n, dtype=np.int32).tobytes()
+
+
+@lru_cache(maxsize=4096)
+def _electrode_overlap(m: bytes, n: bytes, aspect: float, electrode: Electrode) -> np.ndarray:
+    plate = RectPlate(a=aspect, b=1.0)  # overlaps depend on the aspect ratio only
+    R = np.array([(r.x0, r.x1, r.y0, r.y1) for r in electrode.rects]).T
+    O = rect_overlaps(np.frombuffer(m, np.int32), np.frombuffer(n, np.int32), plate, *R).sum(axis=1)
+    O.flags.writeable = False
+    return O
+
+
+@lru_cache(maxsize=1024)
+def _overlap_matrix(m: bytes, n: bytes, aspect: float, pattern: ElectrodePattern) -> np.ndarray:
+    O = np.stack([_electrode_overlap(m, n, aspect, e) for e in pattern.electrodes], axis=1)
+    O.flags.writeable = False
+    return O
+
+
+def _centered(ratio: float) -> RectElectrode:
+    if not 0.0 < ratio <= 1.0:
+        raise ValueError(f"Electrode area ratio must be in (0, 1], got {ratio}.")
+    h = 0.5 * np.sqrt(ratio)
+    return RectElectrode(0.5 - h, 0.5 + h, 0.5 - h, 0.5 + h)
+
+
+def _ring(inner_ratio: float, outer_ratio: float) -> tuple[RectElectrode, ...]:
+    if not 0.0 < inner_ratio < outer_ratio <= 1.0:
+        raise ValueError("Edge ring needs 0 < inner_ratio < outer_ratio <= 1.")
+    i, o = _centered(inner_ratio), _centered(outer_ratio)
+    return (
+        RectElectrode(o.x0, o.x1, o.y0, i.y0),  # bottom strip
+        RectElectrode(o.x0, o.x1, i.y1, o.y1),  # top strip
+        RectElectrode(o.x0, i.x0, i.y0, i.y1),  # left
+        RectElectrode(i.x1, o.x1, i.y0, i.y1),  # right
+    )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
+import numpy as np
 
 @dataclass(frozen=True)
 class RectPlate:
@@ -9,3 +10,34 @@ class RectPlate:
 
     def area(self) -> float:
         return self.a * self.b
+
+
+@dataclass(frozen=True)
+class RectPlateBatch:
+    """
+    Struct-of-arrays counterpart of RectPlate for N designs.
+    a, b are broadcast to a common 1-D shape (N,).
+    """
+    a: np.ndarray  # [m] length in x, shape (N,)
+    b: np.ndarray  # [m] length in y, shape (N,)
+
+    def __post_init__(self) -> None:
+        a, b = np.broadcast_arrays(np.atleast_1d(np.asarray(self.a, dtype=float)),
+                                   np.atleast_1d(np.asarray(self.b, dtype=float)))
+        if a.ndim != 1:
+            raise ValueError("RectPlateBatch expects 1-D parameter arrays.")
+        object.__setattr__(self, "a", np.ascontiguousarray(a))
+        object.__setattr__(self, "b", np.ascontiguousarray(b))
+
+    @classmethod
+    def from_plates(cls, plates: list[RectPlate]) -> "RectPlateBatch":
+        return cls(a=np.array([p.a for p in plates]), b=np.array([p.b for p in plates]))
+
+    def __len__(self) -> int:
+        return self.a.shape[0]
+
+    def __getitem__(self, i: int) -> RectPlate:
+        return RectPlate(a=float(self.a[i]), b=float(self.b[i]))
+
+    def area(self) -> np.ndarray:
+        return self.a * self.b
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from dataclasses import fields, is_dataclass
+import hashlib
+import os
+from pathlib import Path
+import shutil
+from typing import Any, Callable
+
+import numpy as np
+
+from mems_ana import __version__
+
+DEFAULT_MAX_BYTES = 2 * 1024**3
+
+
+class ResultCache:
+    """
+    Content-addressed on-disk cache of named-array results.
+
+    An entry is a directory <root>/<key>/ holding one .npy per array; keys
+    are hashes of the inputs plus the library version (see `key`), so a
+    changed parameter or an upgraded library never returns a stale result.
+    Hits are loaded with mmap_mode="r" and cost no copy. Entries are written
+    to a temporary directory and renamed into place, so concurrent jobs on a
+    shared cache only ever see complete entries. The total size is bounded
+    by `max_bytes`; least-recently-used entries (directory mtime, refreshed
+    on every hit) are evicted first.
+    """
+
+    def __init__(self, root: str | Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive.")
+        self.root = Path(root) if root is not None else _default_cache_dir()
+        self.max_bytes = int(max_bytes)
+        self._size: int | None = None  # running estimate, re-scanned when over budget
+
+    def key(self, *parts: Any) -> str:
+        return input_hash(*parts)
+
+    # ---------- lookup ----------
+    def get(self, key: str) -> dict[str, np.ndarray] | None:
+        """Read-only memory-mapped arrays of an entry, or None on a miss."""
+        path = self.root / key
+        try:
+            names = sorted(p for p in os.listdir(path) if p.endswith(".npy"))
+            out = {n[:-4]: np.load(path / n, mmap_mode="r") for n in names}
+            os.utime(path)
+        except FileNotFoundError:  # missing, or evicted by another process meanwhile
+            return None
+        return out
+
+    def put(self, key: str, arrays: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+        """Store `arrays` under `key` and return them memory-mapped from disk."""
+        path = self.root / key
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / f".{key}.{os.getpid()}.tmp"
+        tmp.mkdir(exist_ok=True)
+        for name, a in arrays.items():
+            np.save(tmp / f"{name}.npy", np.asarray(a), allow_pickle=False)
+        nbytes = _dir_bytes(tmp)
+        try:
+            os.replace(tmp, path)
+        except OSError:  # another process stored the same entry first
+            shutil.rmtree(tmp, ignore_errors=True)
+        else:
+            if self._size is not None:
+                self._size += nbytes
+        out = self.get(key)
+        if self._size is None or self._size > self.max_bytes:
+            self.evict(keep=key)
+        return out if out is not None else {k: np.asarray(v) for k, v in arrays.items()}
+
+    def get_or_compute(self, key: str, compute: Callable[[], dict[str, np.ndarray]]) -> dict[str, np.ndarray]:
+        out = self.get(key)
+        return out if out is not None else self.put(key, compute())
+
+    # ---------- maintenance ----------
+    def evict(self, max_bytes: int | None = None, keep: str | None = None) -> int:
+        """Drop least-recently-used entries until the cache fits; returns the bytes freed."""
+        limit = self.max_bytes if max_bytes is None else int(max_bytes)
+        entries = []
+        for p in self.root.iterdir() if self.root.exists() else ():
+            if p.is_dir() and not p.name.startswith("."):
+                try:
+                    entries.append((p.stat().st_mtime, _dir_bytes(p), p))
+                except FileNotFoundError:
+                    continue
+        total = sum(e[1] for e in entries)
+        freed = 0
+        for _, nbytes, p in sorted(entries, key=lambda e: e[0]):
+            if total - freed <= limit:
+                break
+            if p.name == keep:
+                continue
+            shutil.rmtree(p, ignore_errors=True)
+            freed += nbytes
+        self._size = total - freed
+        return freed
+
+    def size_bytes(self) -> int:
+        if not self.root.exists():
+            return 0
+        return sum(_dir_bytes(p) for p in self.root.iterdir() if p.is_dir() and not p.name.startswith("."))
+
+    def clear(self) -> None:
+        self.evict(max_bytes=0)
+
+
+def input_hash(*parts: Any) -> str:
+    """
+    SHA-256 over the library version and `parts`. Arrays hash by dtype, shape
+    and raw bytes; dataclasses by type name and fields; objects with a
+    bytes-valued key() (e.g. ModeSet) by that key.
+    """
+    h = hashlib.sha256(f"mems_ana {__version__}".encode())
+    for p in parts:
+        _feed(h, p)
+    return h.hexdigest()[:32]
+
+
+def _feed(h: Any, obj: Any) -> None:
+    if obj is None or isinstance(obj, (bool, int, float, complex, str, bytes)):
+        h.update(repr(obj).encode())
+    elif isinstance(obj, np.ndarray) or isinstance(obj, np.generic):
+        a = np.ascontiguousarray(obj)
+        h.update(repr((a.dtype.str, a.shape)).encode())
+        h.update(a.tobytes())
+    elif callable(getattr(obj, "key", None)):
+        h.update(type(obj).__name__.encode())
+        h.update(obj.key())
+    elif is_dataclass(obj) and not isinstance(obj, type):
+        h.update(type(obj).__name__.encode())
+        for f in fields(obj):
+            h.update(f.name.encode())
+            _feed(h, getattr(obj, f.name))
+    elif isinstance(obj, dict):
+        h.update(b"{")
+        for k in sorted(obj, key=str):
+            _feed(h, k)
+            _feed(h, obj[k])
+        h.update(b"}")
+    elif isinstance(obj, (list, tuple)):
+        h.update(b"(")
+        for v in obj:
+            _feed(h, v)
+        h.update(b")")
+    else:
+        raise TypeError(f"Cannot hash cache input of type {type(obj).__name__}.")
+
+
+def _dir_bytes(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.iterdir())
+
+
+def _default_cache_dir() -> Path:
+    root = os.environ.get("MEMS_ANA_CACHE")
+    return (Path(root) if root else Path.home() / ".cache" / "mems_ana") / "results"
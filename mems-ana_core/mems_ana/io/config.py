@@ -1,3 +1,247 @@
 # config.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from mems_ana.geometry.plate import RectPlate
+from mems_ana.materials.elastic import IsoElastic
+from mems_ana.materials.piezo import Piezo
+from mems_ana.materials.stack import Stack
+from mems_ana.rom.plate_rom import DEFAULT_MODES, ModeSet, RectPlateROM
+from mems_ana.solver.sweep import PLATE_AXES, ROM_AXES, STACK_AXES
 
 KW_SHAPE = 3.2e5   # ← 今出た数字
+
+CONFIG_SCHEMA = 1
+
+
+@dataclass(frozen=True)
+class DriveConfig:
+    V_rms: float        # [V]
+    zeta: float         # [-]
+    f_hz: np.ndarray    # [Hz]
+
+
+@dataclass(frozen=True)
+class SweepConfig:
+    axes: dict[str, np.ndarray]
+    chunk_size: int = 4096
+    workers: int | None = 1
+
+
+@dataclass(frozen=True, eq=False)
+class DesignConfig:
+    """
+    Validated design loaded from YAML. `normalized` is the canonical form
+    (defaults filled in, numbers as floats, ranges and mode selections
+    resolved) and `hash` its sha256, identical for configs that describe
+    the same computation.
+    """
+    plate: RectPlate
+    stack: Stack
+    modes: ModeSet
+    K_W: float
+    drive: DriveConfig | None
+    sweep: SweepConfig | None
+    normalized: dict[str, Any]
+    hash: str
+
+    def rom(self) -> RectPlateROM:
+        return RectPlateROM(self.plate, self.stack, self.modes, K_W=self.K_W)
+
+
+def load_config(path: str | Path) -> DesignConfig:
+    """Read a YAML design file (see examples/configs/diaphragm.yaml)."""
+    try:
+        import yaml
+    except ImportError as e:  # optional dependency, only needed for YAML input
+        raise ImportError("Loading YAML configs requires PyYAML (pip install pyyaml).") from e
+
+    data = yaml.safe_load(Path(path).read_text(encoding="utf-8")) or {}
+    return parse_config(data)
+
+
+def parse_config(data: dict[str, Any]) -> DesignConfig:
+    """Validate a config mapping (as parsed from YAML) into model objects."""
+    _keys(data, "", required=("plate", "base"), optional=("piezo", "electrode", "modes", "rom", "drive", "sweep"))
+
+    p = _section(data, "plate", required=("a", "b"))
+    plate = RectPlate(a=_pos(p, "plate.a"), b=_pos(p, "plate.b"))
+
+    bs = _section(data, "base", required=("E", "nu", "rho", "t"))
+    base = IsoElastic(E=_pos(bs, "base.E"), nu=_nu(bs, "base.nu"), rho=_pos(bs, "base.rho"))
+    t_base = _pos(bs, "base.t")
+
+    piezo, t_pzt, norm_piezo = None, 0.0, None
+    if data.get("piezo") is not None:
+        pz = _section(data, "piezo", required=("E", "nu", "rho", "eps_r", "d31", "t"), optional=("tan_delta",))
+        piezo = Piezo(
+            E=_pos(pz, "piezo.E"), nu=_nu(pz, "piezo.nu"), rho=_pos(pz, "piezo.rho"),
+            eps_r=_pos(pz, "piezo.eps_r"), d31=_num(pz, "piezo.d31"),
+            tan_delta=_num(pz, "piezo.tan_delta", 0.0, lo=0.0),
+        )
+        t_pzt = _pos(pz, "piezo.t")
+        norm_piezo = {**piezo.__dict__, "t": t_pzt}
+
+    el = _section(data, "electrode", optional=("area_ratio",))
+    ratio = _num(el, "electrode.area_ratio", 1.0, lo=0.0, hi=1.0)
+    stack = Stack(base=base, t_base=t_base, piezo=piezo, t_pzt=t_pzt, elec_area_ratio=ratio)
+
+    modes = _modes(_section(data, "modes", optional=("list", "count", "f_max_hz", "center_only")), plate, stack)
+
+    r = _section(data, "rom", optional=("K_W",))
+    K_W = _num(r, "rom.K_W", 8.0, lo=0.0)
+    if K_W <= 0.0:
+        raise ValueError("rom.K_W must be positive.")
+
+    drive = None
+    if data.get("drive") is not None:
+        d = _section(data, "drive", required=("f_hz",), optional=("V_rms", "zeta"))
+        drive = DriveConfig(
+            V_rms=_num(d, "drive.V_rms", 1.0, lo=0.0),
+            zeta=_num(d, "drive.zeta", 0.02, lo=0.0),
+            f_hz=_values(d["f_hz"], "drive.f_hz"),
+        )
+
+    sweep = None
+    if data.get("sweep") is not None:
+        s = _section(data, "sweep", required=("axes",), optional=("chunk_size", "workers"))
+        if not isinstance(s["axes"], dict) or not s["axes"]:
+            raise ValueError("sweep.axes must be a non-empty mapping of axis name -> values.")
+        unknown = set(s["axes"]) - set(PLATE_AXES + STACK_AXES + ROM_AXES)
+        if unknown:
+            raise ValueError(f"sweep.axes: unknown axis name(s) {sorted(unknown)}.")
+        workers = s.get("workers", 1)
+        if workers is not None and (isinstance(workers, bool) or not isinstance(workers, int) or workers < 1):
+            raise ValueError("sweep.workers must be a positive integer or null.")
+        chunk = s.get("chunk_size", 4096)
+        if isinstance(chunk, bool) or not isinstance(chunk, int) or chunk < 1:
+            raise ValueError("sweep.chunk_size must be a positive integer.")
+        sweep = SweepConfig(
+            axes={k: _values(v, f"sweep.axes.{k}") for k, v in s["axes"].items()},
+            chunk_size=chunk,
+            workers=workers,
+        )
+
+    normalized = {
+        "schema": CONFIG_SCHEMA,
+        "plate": {"a": plate.a, "b": plate.b},
+        "base": {**base.__dict__, "t": t_base},
+        "piezo": norm_piezo,
+        "electrode": {"area_ratio": ratio},
+        "modes": {"m": modes.m.tolist(), "n": modes.n.tolist()},
+        "rom": {"K_W": K_W},
+        "drive": None if drive is None else {"V_rms": drive.V_rms, "zeta": drive.zeta, "f_hz": drive.f_hz.tolist()},
+        # axis order defines the point order of run_sweep, so it is kept;
+        # chunk_size / workers do not change results and stay out of the hash
+        "sweep": None if sweep is None else {"axes": [[k, v.tolist()] for k, v in sweep.axes.items()]},
+    }
+    return DesignConfig(plate, stack, modes, K_W, drive, sweep, normalized, config_hash(normalized))
+
+
+def config_hash(normalized: dict[str, Any]) -> str:
+    """sha256 of the canonical JSON encoding (sorted keys, exact float repr)."""
+    blob = json.dumps(normalized, sort_keys=True, separators=(",", ":"), allow_nan=False)
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+# ---------- validation helpers ----------
+def _keys(d: Any, where: str, required: tuple[str, ...] = (), optional: tuple[str, ...] = ()) -> None:
+    if not isinstance(d, dict):
+        raise ValueError(f"{where or 'config'} must be a mapping.")
+    missing = [k for k in required if d.get(k) is None]
+    unknown = sorted(set(d) - set(required) - set(optional))
+    if missing:
+        raise ValueError(f"{where or 'config'}: missing key(s) {missing}.")
+    if unknown:
+        raise ValueError(f"{where or 'config'}: unknown key(s) {unknown}.")
+
+
+def _section(data: dict, name: str, required: tuple[str, ...] = (), optional: tuple[str, ...] = ()) -> dict:
+    sec = data.get(name)
+    sec = {} if sec is None else sec
+    _keys(sec, name, required, optional)
+    return sec
+
+
+def _num(d: dict, path: str, default: float | None = None, lo: float | None = None, hi: float | None = None) -> float:
+    key = path.rsplit(".", 1)[-1]
+    v = d.get(key, default)
+    if v is None:
+        raise ValueError(f"{path} is required.")
+    if isinstance(v, bool):
+        raise ValueError(f"{path} must be a number, got {v!r}.")
+    try:
+        x = float(v)  # YAML 1.1 reads '160e9' as a string
+    except (TypeError, ValueError):
+        raise ValueError(f"{path} must be a number, got {v!r}.") from None
+    if not np.isfinite(x) or (lo is not None and x < lo) or (hi is not None and x > hi):
+        raise ValueError(f"{path}={x} is out of range [{lo}, {hi}].")
+    return x
+
+
+def _pos(d: dict, path: str) -> float:
+    x = _num(d, path)
+    if x <= 0.0:
+        raise ValueError(f"{path} must be positive, got {x}.")
+    return x
+
+
+def _nu(d: dict, path: str) -> float:
+    x = _num(d, path)
+    if not -1.0 < x < 0.5:
+        raise ValueError(f"{path} must be in (-1, 0.5), got {x}.")
+    return x
+
+
+def _values(spec: Any, path: str) -> np.ndarray:
+    """A list of numbers, a scalar, {start, stop, num} (linear) or {start, stop, num, log: true}."""
+    if isinstance(spec, dict):
+        _keys(spec, path, required=("start", "stop", "num"), optional=("log",))
+        start, stop = _num(spec, f"{path}.start"), _num(spec, f"{path}.stop")
+        num = spec["num"]
+        if isinstance(num, bool) or not isinstance(num, int) or num < 1:
+            raise ValueError(f"{path}.num must be a positive integer.")
+        if spec.get("log", False):
+            if start <= 0.0 or stop <= 0.0:
+                raise ValueError(f"{path}: log ranges need positive start/stop.")
+            return np.geomspace(start, stop, num)
+        return np.linspace(start, stop, num)
+    items = spec if isinstance(spec, list) else [spec]
+    if not items:
+        raise ValueError(f"{path} must not be empty.")
+    return np.array([_num({"v": v}, f"{path}.v") for v in items])
+
+
+def _modes(spec: dict, plate: RectPlate, stack: Stack) -> ModeSet:
+    given = [k for k in ("list", "count", "f_max_hz") if spec.get(k) is not None]
+    if len(given) > 1:
+        raise ValueError(f"modes: give only one of list / count / f_max_hz, got {given}.")
+    center_only = spec.get("center_only", False)
+    if not isinstance(center_only, bool):
+        raise ValueError("modes.center_only must be true or false.")
+
+    if not given:
+        modes = DEFAULT_MODES
+    elif given[0] == "list":
+        pairs = spec["list"]
+        if not isinstance(pairs, list) or not pairs or any(
+            not isinstance(p, list) or len(p) != 2 or any(isinstance(v, bool) or not isinstance(v, int) or v < 1 for v in p)
+            for p in pairs
+        ):
+            raise ValueError("modes.list must be a list of [m, n] pairs of positive integers.")
+        modes = ModeSet(m=[p[0] for p in pairs], n=[p[1] for p in pairs])
+    elif given[0] == "count":
+        count = spec["count"]
+        if isinstance(count, bool) or not isinstance(count, int) or count < 1:
+            raise ValueError("modes.count must be a positive integer.")
+        return ModeSet.lowest(count, plate, stack, center_only=center_only)
+    else:
+        return ModeSet.below(_pos(spec, "modes.f_max_hz"), plate, stack, center_only=center_only)
+    return modes.center_only() if center_only else modes
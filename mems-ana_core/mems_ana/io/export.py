@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+SCHEMA_FILE = "schema.json"
+FORMAT_VERSION = 1
+
+
+class ColumnWriter:
+    """
+    Append-only columnar result store.
+
+    Every column is one raw little-endian file `<name>.bin` of fixed-size
+    rows (dtype and per-row shape fixed by the first append). schema.json
+    records the committed row count and is replaced atomically after the
+    column data of each append is written, so a killed job leaves at most
+    an uncommitted tail that is truncated when the store is reopened.
+
+    A new store needs an empty directory (or overwrite=True on an existing
+    store); overwriting only removes the columns its schema lists.
+    """
+
+    def __init__(self, root: str | Path, meta: dict[str, Any] | None = None, overwrite: bool = False) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        schema_path = self.root / SCHEMA_FILE
+
+        if schema_path.exists():
+            schema = json.loads(schema_path.read_text())
+            if schema.get("version") != FORMAT_VERSION:
+                raise ValueError(f"Unsupported store version in {schema_path}.")
+        elif any(self.root.iterdir()):
+            raise ValueError(f"{self.root} is not empty and holds no column store; use an empty directory.")
+        else:
+            schema = None
+
+        if schema is not None and not overwrite:
+            self._columns = {k: (np.dtype(v["dtype"]), tuple(v["shape"])) for k, v in schema["columns"].items()}
+            self._n_rows = int(schema["n_rows"])
+            self.meta = dict(schema.get("meta", {}))
+            self._truncate()
+        else:
+            if schema is not None:
+                for name in schema["columns"]:
+                    self._path(name).unlink(missing_ok=True)
+            self._columns = {}
+            self._n_rows = 0
+            self.meta = {}
+        if meta:
+            self.meta.update(meta)
+        self._commit()
+
+    def __enter__(self) -> "ColumnWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def n_rows(self) -> int:
+        return self._n_rows
+
+    def append(self, columns: dict[str, np.ndarray]) -> None:
+        """Append one chunk; every column needs the same number of rows (leading axis)."""
+        arrays = {k: np.asarray(v) for k, v in columns.items()}
+        n = {a.shape[0] if a.ndim else -1 for a in arrays.values()}
+        if len(n) != 1 or -1 in n:
+            raise ValueError("All columns of a chunk need the same leading (row) axis.")
+
+        # validate every column before touching any file: a rejected chunk leaves no trace
+        columns = self._columns
+        if not columns:
+            for k, a in arrays.items():
+                if a.dtype.hasobject:
+                    raise ValueError(f"Column {k!r} has a non-numeric dtype.")
+            columns = {k: (a.dtype.newbyteorder("<"), a.shape[1:]) for k, a in arrays.items()}
+        if set(arrays) != set(columns):
+            raise ValueError(f"Chunk columns {sorted(arrays)} do not match the store {sorted(columns)}.")
+        for k, a in arrays.items():
+            if a.shape[1:] != columns[k][1]:
+                raise ValueError(f"Column {k!r} rows have shape {a.shape[1:]}, store expects {columns[k][1]}.")
+        data = {k: np.ascontiguousarray(a, dtype=columns[k][0]).tobytes() for k, a in arrays.items()}
+
+        previous, self._columns = self._columns, columns
+        try:
+            for k, b in data.items():
+                with open(self._path(k), "ab") as fh:
+                    fh.write(b)
+        except BaseException:
+            self._truncate()  # drop the partial chunk so the next append starts clean
+            self._columns = previous
+            raise
+
+        self._n_rows += n.pop()
+        self._commit()
+
+    def close(self) -> None:
+        self._commit()
+
+    # ---------- internals ----------
+    def _path(self, name: str) -> Path:
+        return self.root / f"{name}.bin"
+
+    def _row_bytes(self, name: str) -> int:
+        dtype, shape = self._columns[name]
+        return dtype.itemsize * int(np.prod(shape, dtype=np.int64))
+
+    def _truncate(self) -> None:
+        """Cut every column back to the committed row count."""
+        for name in self._columns:
+            with open(self._path(name), "ab") as fh:
+                fh.truncate(self._n_rows * self._row_bytes(name))
+
+    def _commit(self) -> None:
+        schema = {
+            "version": FORMAT_VERSION,
+            "n_rows": self._n_rows,
+            "columns": {k: {"dtype": d.str, "shape": list(s)} for k, (d, s) in self._columns.items()},
+            "meta": self.meta,
+        }
+        tmp = self.root / f".{SCHEMA_FILE}.{os.getpid()}.tmp"
+        tmp.write_text(json.dumps(schema))
+        os.replace(tmp, self.root / SCHEMA_FILE)
+
+
+class ColumnReader:
+    """
+    Lazy reader of a ColumnWriter store. Columns are read-only np.memmap
+    arrays of shape (n_rows, *row_shape); slicing never copies.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        schema = json.loads((self.root / SCHEMA_FILE).read_text())
+        if schema.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported store version in {self.root}.")
+        self.n_rows = int(schema["n_rows"])
+        self.meta: dict[str, Any] = schema.get("meta", {})
+        self.columns = {k: (np.dtype(v["dtype"]), tuple(v["shape"])) for k, v in schema["columns"].items()}
+        self._maps: dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        if name not in self._maps:
+            dtype, shape = self.columns[name]
+            full = (self.n_rows,) + shape
+            if self.n_rows == 0 or 0 in shape:
+                self._maps[name] = np.empty(full, dtype=dtype)
+            else:
+                self._maps[name] = np.memmap(self.root / f"{name}.bin", dtype=dtype, mode="r", shape=full)
+        return self._maps[name]
+
+    def rows(self, start: int, stop: int, columns: list[str] | None = None) -> dict[str, np.ndarray]:
+        """Zero-copy views of rows [start, stop) for the selected columns."""
+        return {k: self[k][start:stop] for k in (columns or self.columns)}
+
+
+def open_store(root: str | Path) -> ColumnReader:
+    return ColumnReader(root)
@@ -1,7 +1,11 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from typing import Optional
 
+import numpy as np
+
+from mems_ana.electrical.capacitance import EPS0
 from mems_ana.materials.elastic import IsoElastic
 from mems_ana.materials.piezo import PiezoMat
 
@@ -50,7 +54,9 @@ class Stack:
 
     # ---------- bending stiffness ----------
     def D_plate(self) -> float:
-        z0 = self.neutral_axis_z0()
+        return self._D_about(self.neutral_axis_z0())
+
+    def _D_about(self, z0: float) -> float:
         Qb = self._Q(self.base.E, self.base.nu)
         zb = 0.5 * self.t_base
 
@@ -72,14 +78,229 @@ class Stack:
     def piezo_bending_moment_per_width(self, V_peak: float) -> float:
         if self.piezo is None or self.t_pzt <= 0.0:
             return 0.0
+        return self._moment_about(self.neutral_axis_z0(), V_peak) * self.elec_area_ratio
 
-        z0 = self.neutral_axis_z0()
+    def _moment_about(self, z0: float, V_peak: float) -> float:
+        """Full-coverage piezo moment per width about z0 (no elec_area_ratio)."""
         eps0 = self.piezo_eigenstrain(V_peak)
 
         Qp = self._Q(self.base.E, self.base.nu)
         zp = self.t_base + 0.5 * self.t_pzt
 
+        return Qp * eps0 * self.t_pzt * (zp - z0)
+
+    # ---------- cached snapshot ----------
+    def properties(self) -> "StackProperties":
+        """Derived laminate properties, memoized per Stack value (see stack_properties)."""
+        return stack_properties(self)
+
+
+@dataclass(frozen=True)
+class StackProperties:
+    """
+    Immutable snapshot of the derived laminate quantities of one Stack.
+    Values are identical to the corresponding Stack methods.
+    """
+    z0: float                    # [m] neutral axis
+    D: float                     # [N m] bending stiffness
+    areal_mass: float            # [kg/m^2]
+    t_total: float               # [m]
+    moment_per_volt: float       # [N/V] piezo_bending_moment_per_width(1.0)
+    moment_per_volt_full: float  # [N/V] same, full electrode coverage (no elec_area_ratio)
+    cap_per_area: float          # [F/m^2] clamped capacitance per plate area (incl. elec_area_ratio)
+    active: bool                 # piezo layer present with t_pzt > 0
+
+
+@lru_cache(maxsize=256)
+def stack_properties(stack: Stack) -> StackProperties:
+    """
+    Compute z0, D, mass, moment and capacitance of `stack` in one pass.
+    Stack / Piezo / IsoElastic are frozen dataclasses, so equal stacks share
+    one cache entry (bounded LRU).
+    """
+    z0 = stack.neutral_axis_z0()
+    active = stack.piezo is not None and stack.t_pzt > 0.0
+
+    M_full = stack._moment_about(z0, 1.0) if active else 0.0
+    cap = EPS0 * stack.piezo.eps_r * stack.elec_area_ratio / stack.t_pzt if active else 0.0
+
+    return StackProperties(
+        z0=z0,
+        D=stack._D_about(z0),
+        areal_mass=stack.areal_mass(),
+        t_total=stack.t_total(),
+        moment_per_volt=M_full * stack.elec_area_ratio,
+        moment_per_volt_full=M_full,
+        cap_per_area=cap,
+        active=active,
+    )
+
+
+@dataclass(frozen=True)
+class StackBatch:
+    """
+    Struct-of-arrays counterpart of Stack for N designs.
+
+    Every field is a float array of shape (N,) (scalars are broadcast).
+    has_piezo marks designs with a piezo layer; for the others the piezo
+    fields are ignored. All methods follow the arithmetic of Stack so that
+    results match the scalar path design by design.
+    """
+    E_base: np.ndarray
+    nu_base: np.ndarray
+    rho_base: np.ndarray
+    t_base: np.ndarray       # [m]
+    t_pzt: np.ndarray        # [m]
+    E_pzt: np.ndarray
+    nu_pzt: np.ndarray
+    rho_pzt: np.ndarray
+    eps_r: np.ndarray
+    d31: np.ndarray
+    tan_delta: np.ndarray
+    elec_area_ratio: np.ndarray
+    has_piezo: np.ndarray    # bool
+
+    def __post_init__(self) -> None:
+        names = [f.name for f in fields(self)]
+        arrays = np.broadcast_arrays(*[np.atleast_1d(np.asarray(getattr(self, k))) for k in names])
+        if arrays[0].ndim != 1:
+            raise ValueError("StackBatch expects 1-D parameter arrays.")
+        for k, arr in zip(names, arrays):
+            dtype = bool if k == "has_piezo" else float
+            object.__setattr__(self, k, np.ascontiguousarray(arr, dtype=dtype))
+
+    # ---------- construction ----------
+    @classmethod
+    def from_stacks(cls, stacks: list[Stack]) -> "StackBatch":
+        def piezo_attr(name: str) -> np.ndarray:
+            return np.array([getattr(s.piezo, name) if s.piezo else 0.0 for s in stacks])
+
+        return cls(
+            E_base=np.array([s.base.E for s in stacks]),
+            nu_base=np.array([s.base.nu for s in stacks]),
+            rho_base=np.array([s.base.rho for s in stacks]),
+            t_base=np.array([s.t_base for s in stacks]),
+            t_pzt=np.array([s.t_pzt for s in stacks]),
+            E_pzt=piezo_attr("E"),
+            nu_pzt=piezo_attr("nu"),
+            rho_pzt=piezo_attr("rho"),
+            eps_r=piezo_attr("eps_r"),
+            d31=piezo_attr("d31"),
+            tan_delta=piezo_attr("tan_delta"),
+            elec_area_ratio=np.array([s.elec_area_ratio for s in stacks]),
+            has_piezo=np.array([s.piezo is not None for s in stacks]),
+        )
+
+    @classmethod
+    def from_stack(cls, stack: Stack, **overrides: float | np.ndarray) -> "StackBatch":
+        """
+        Broadcast one Stack to a batch, replacing any field by an array, e.g.
+          StackBatch.from_stack(stack, t_pzt=np.linspace(1e-6, 3e-6, 50))
+        """
+        p = stack.piezo
+        values: dict[str, float | np.ndarray] = dict(
+            E_base=stack.base.E,
+            nu_base=stack.base.nu,
+            rho_base=stack.base.rho,
+            t_base=stack.t_base,
+            t_pzt=stack.t_pzt,
+            E_pzt=p.E if p else 0.0,
+            nu_pzt=p.nu if p else 0.0,
+            rho_pzt=p.rho if p else 0.0,
+            eps_r=p.eps_r if p else 0.0,
+            d31=p.d31 if p else 0.0,
+            tan_delta=p.tan_delta if p else 0.0,
+            elec_area_ratio=stack.elec_area_ratio,
+            has_piezo=p is not None,
+        )
+        unknown = set(overrides) - set(values)
+        if unknown:
+            raise ValueError(f"Unknown StackBatch field(s): {sorted(unknown)}")
+        values.update(overrides)
+        return cls(**values)
+
+    def __len__(self) -> int:
+        return self.t_base.shape[0]
+
+    def __getitem__(self, i: int) -> Stack:
+        base = IsoElastic(E=float(self.E_base[i]), nu=float(self.nu_base[i]), rho=float(self.rho_base[i]))
+        piezo = None
+        if self.has_piezo[i]:
+            piezo = PiezoMat(
+                E=float(self.E_pzt[i]),
+                nu=float(self.nu_pzt[i]),
+                rho=float(self.rho_pzt[i]),
+                eps_r=float(self.eps_r[i]),
+                d31=float(self.d31[i]),
+                tan_delta=float(self.tan_delta[i]),
+            )
+        return Stack(
+            base=base,
+            t_base=float(self.t_base[i]),
+            piezo=piezo,
+            t_pzt=float(self.t_pzt[i]),
+            elec_area_ratio=float(self.elec_area_ratio[i]),
+        )
+
+    # ---------- helpers ----------
+    def _active(self) -> np.ndarray:
+        """Designs with a piezo layer of positive thickness."""
+        return self.has_piezo & (self.t_pzt > 0.0)
+
+    def _Q(self) -> np.ndarray:
+        return self.E_base / (1.0 - self.nu_base**2)
+
+    def t_total(self) -> np.ndarray:
+        return self.t_base + np.where(self.has_piezo, self.t_pzt, 0.0)
+
+    def areal_mass(self) -> np.ndarray:
+        m = self.rho_base * self.t_base
+        return m + np.where(self.has_piezo & (self.rho_pzt > 0.0), self.rho_pzt * self.t_pzt, 0.0)
+
+    # ---------- neutral axis ----------
+    def neutral_axis_z0(self) -> np.ndarray:
+        Qb = self._Q()
+        zb = 0.5 * self.t_base
+
+        num = Qb * self.t_base * zb
+        den = Qb * self.t_base
+
+        active = self._active()
+        Qp = Qb  # minimal (same as Stack)
+        zp = self.t_base + 0.5 * self.t_pzt
+        num = num + np.where(active, Qp * self.t_pzt * zp, 0.0)
+        den = den + np.where(active, Qp * self.t_pzt, 0.0)
+
+        return num / den
+
+    # ---------- bending stiffness ----------
+    def D_plate(self) -> np.ndarray:
+        z0 = self.neutral_axis_z0()
+        Qb = self._Q()
+        zb = 0.5 * self.t_base
+
+        D = Qb * ((self.t_base**3) / 12.0 + self.t_base * (zb - z0) ** 2)
+
+        Qp = Qb
+        zp = self.t_base + 0.5 * self.t_pzt
+        D_p = Qp * ((self.t_pzt**3) / 12.0 + self.t_pzt * (zp - z0) ** 2)
+
+        return D + np.where(self._active(), D_p, 0.0)
+
+    # ---------- piezo actuation ----------
+    def piezo_eigenstrain(self, V_peak: float | np.ndarray) -> np.ndarray:
+        active = self._active()
+        t = np.where(active, self.t_pzt, 1.0)
+        return np.where(active, self.d31 * (V_peak / t), 0.0)
+
+    def piezo_bending_moment_per_width(self, V_peak: float | np.ndarray) -> np.ndarray:
+        z0 = self.neutral_axis_z0()
+        eps0 = self.piezo_eigenstrain(V_peak)
+
+        Qp = self._Q()
+        zp = self.t_base + 0.5 * self.t_pzt
+
         M0 = Qp * eps0 * self.t_pzt * (zp - z0)
-        M0 *= self.elec_area_ratio
+        M0 = M0 * self.elec_area_ratio
 
-        return M0
+        return np.where(self._active(), M0, 0.0)
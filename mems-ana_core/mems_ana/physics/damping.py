@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+import os
+from pathlib import Path
+from typing import Protocol
+
+import numpy as np
+
+from mems_ana.geometry.plate import RectPlate
+from mems_ana.materials.stack import Stack
+from mems_ana.rom.plate_rom import Mode, ModeSet
+
+P_ATM = 101325.0        # [Pa]
+MU_AIR = 1.85e-5        # [Pa s] at ~300 K
+MFP_AIR_ATM = 68e-9     # [m] mean free path at P_ATM
+
+# squeeze-film tables of this process, by geometry key (oldest dropped first)
+_TABLES: dict[str, np.ndarray] = {}
+_MAX_TABLES = 64
+
+
+class DampingModel(Protocol):
+    """
+    Anything that returns modal damping ratios ζ_k(ω) of shape (*S, K)
+    for modal angular frequencies omega_n (K,) and drive ω of shape S.
+    ζ may be complex: j 2 ζ ω_n ω is the full modal reaction per unit
+    modal mass, so Im(ζ) < 0 carries a frequency-dependent spring.
+    """
+
+    def modal_zeta(self, omega_n: np.ndarray, omega: np.ndarray) -> np.ndarray: ...
+
+
+@dataclass(frozen=True)
+class RayleighDamping:
+    """C = α M + β K  ->  ζ_k = α / (2 ω_k) + β ω_k / 2 (frequency independent)."""
+    alpha: float  # [1/s]
+    beta: float   # [s]
+
+    @classmethod
+    def from_two_modes(cls, f1_hz: float, zeta1: float, f2_hz: float, zeta2: float) -> "RayleighDamping":
+        """α, β that reproduce ζ1 at f1 and ζ2 at f2."""
+        w1, w2 = 2.0 * np.pi * f1_hz, 2.0 * np.pi * f2_hz
+        if w1 == w2:
+            raise ValueError("Rayleigh fit needs two distinct frequencies.")
+        beta = 2.0 * (zeta2 * w2 - zeta1 * w1) / (w2**2 - w1**2)
+        alpha = 2.0 * zeta1 * w1 - beta * w1**2
+        return cls(alpha=float(alpha), beta=float(beta))
+
+    def modal_zeta(self, omega_n: np.ndarray, omega: np.ndarray) -> np.ndarray:
+        w = np.asarray(omega_n, dtype=float)
+        zeta = self.alpha / (2.0 * w) + self.beta * w / 2.0
+        return np.broadcast_to(zeta, np.shape(omega) + w.shape)
+
+
+@dataclass(frozen=True)
+class ModalTableDamping:
+    """
+    Measured / fitted ζ versus frequency, interpolated (log f) at every
+    modal frequency and held constant outside the table.
+    """
+    f_hz: np.ndarray
+    zeta: np.ndarray
+
+    def __post_init__(self) -> None:
+        f = np.atleast_1d(np.asarray(self.f_hz, dtype=float))
+        z = np.broadcast_to(np.asarray(self.zeta, dtype=float), f.shape)
+        if f.ndim != 1 or np.any(f <= 0.0) or np.any(np.diff(f) <= 0.0):
+            raise ValueError("ModalTableDamping needs strictly increasing positive f_hz.")
+        object.__setattr__(self, "f_hz", f)
+        object.__setattr__(self, "zeta", np.array(z))
+
+    def modal_zeta(self, omega_n: np.ndarray, omega: np.ndarray) -> np.ndarray:
+        f_n = np.asarray(omega_n, dtype=float) / (2.0 * np.pi)
+        zeta = np.interp(np.log(f_n), np.log(self.f_hz), self.zeta)
+        return np.broadcast_to(zeta, np.shape(omega) + f_n.shape)
+
+
+class SqueezeFilmDamping:
+    """
+    Isothermal squeeze-film reaction of an air gap under the plate with
+    vented (p = 0) edges, per mode of `modes`.
+
+    The mode shape is expanded in the pressure eigenfunctions
+    sin(iπx/a) sin(jπy/b) and the linearized Reynolds equation is solved
+    term by term (Blech's double series, generalized to mode shapes):
+
+      ζ_k(ω) = τ G_k(σ) / (2 ω_k),   σ = 12 μ_eff ω a^2 / (p_a h^2)
+      G_k(σ) = Σ_ij α_ik^2 β_jk^2 / (k_ij^2 + j σ),   k_ij^2 = (iπ)^2 + (jπ a/b)^2
+
+    edges="C" uses clamped-clamped beam functions per direction
+    (consistent with the ROM's clamp-corrected frequencies), "S" the
+    simply-supported sines (single term, closed form).
+
+    G_k is tabulated once on a log σ grid per (aspect ratio, edges, modes,
+    n_terms) and kept in memory for the process, so the series is summed
+    once per geometry; FRF evaluation is a vectorized interpolation. With
+    cache_dir the table is also saved there as .npz and reused across
+    processes (opt-in: nothing is written without it).
+    """
+
+    SIGMA_RANGE = (1e-3, 1e6)
+    POINTS_PER_DECADE = 100
+
+    def __init__(
+        self,
+        plate: RectPlate,
+        stack: Stack,
+        modes: list[Mode] | ModeSet,
+        gap: float,
+        mu: float = MU_AIR,
+        p_a: float = P_ATM,
+        edges: str = "C",
+        n_terms: int = 64,
+        rarefaction: bool = True,
+        cache_dir: str | Path | None = None,
+    ) -> None:
+        if gap <= 0.0 or mu <= 0.0 or p_a <= 0.0:
+            raise ValueError("gap, mu and p_a must be positive.")
+        if edges not in ("C", "S"):
+            raise ValueError(f"edges must be 'C' or 'S', got {edges!r}.")
+        self.plate = plate
+        self.modes = ModeSet.from_modes(modes)
+        self.gap = float(gap)
+        self.p_a = float(p_a)
+        self.edges = edges
+        self.n_terms = int(n_terms)
+
+        # Veijola's effective viscosity for slip flow (Kn = λ / h)
+        kn = MFP_AIR_ATM * (P_ATM / self.p_a) / self.gap
+        self.mu_eff = float(mu / (1.0 + 9.638 * kn**1.159)) if rarefaction else float(mu)
+
+        props = stack.properties()
+        Nx = _norm_sq(self.modes.m, edges)
+        Ny = _norm_sq(self.modes.n, edges)
+        self.tau = 12.0 * self.mu_eff * plate.a**2 / (4.0 * self.gap**3 * props.areal_mass * Nx * Ny)  # (K,)
+
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.log_sigma, self.G = self._table()
+
+    # ---------- table ----------
+    def _table(self) -> tuple[np.ndarray, np.ndarray]:
+        lo, hi = np.log10(self.SIGMA_RANGE)
+        log_sigma = np.linspace(lo, hi, int(round((hi - lo) * self.POINTS_PER_DECADE)) + 1) * np.log(10.0)
+
+        aspect = self.plate.a / self.plate.b
+        key = hashlib.sha256(
+            repr((1, aspect, self.edges, self.n_terms, lo, hi, self.POINTS_PER_DECADE)).encode()
+            + self.modes.key()
+        ).hexdigest()[:24]
+        path = self.cache_dir / f"squeeze_{key}.npz" if self.cache_dir is not None else None
+        G = _TABLES.get(key)
+        if G is None and path is not None and path.exists():
+            with np.load(path) as z:
+                G = z["G"]
+        if G is None:
+            G = squeeze_series(self.modes, aspect, np.exp(log_sigma), self.edges, self.n_terms)
+        if path is not None and not path.exists():
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_dir / f".squeeze_{key}.{os.getpid()}.tmp.npz"
+            np.savez(tmp, G=G)
+            os.replace(tmp, path)
+
+        G.flags.writeable = False
+        if len(_TABLES) >= _MAX_TABLES:
+            _TABLES.pop(next(iter(_TABLES)))
+        _TABLES[key] = G
+        return log_sigma, G
+
+    def squeeze_number(self, omega: np.ndarray) -> np.ndarray:
+        return 12.0 * self.mu_eff * np.asarray(omega, dtype=float) * self.plate.a**2 / (self.p_a * self.gap**2)
+
+    def coefficients(self, omega: np.ndarray) -> np.ndarray:
+        """G_k(σ(ω)) interpolated from the table, shape (*S, K), complex."""
+        sigma = np.maximum(self.squeeze_number(omega), np.finfo(float).tiny)
+        x = np.log(sigma)
+        lo, hi = self.log_sigma[0], self.log_sigma[-1]
+        xc = np.clip(x, lo, hi)
+
+        # uniform grid: direct index arithmetic, linear in log σ
+        h = self.log_sigma[1] - self.log_sigma[0]
+        pos = (xc - lo) / h
+        i = np.minimum(pos.astype(np.intp), self.G.shape[0] - 2)
+        t = (pos - i)[..., None]
+        G = self.G[i] * (1.0 - t) + self.G[i + 1] * t
+
+        # σ below the table is incompressible (constant); above it G ~ 1/(jσ)
+        tail = np.exp(hi - np.maximum(x, hi))[..., None]
+        return G * tail
+
+    def modal_zeta(self, omega_n: np.ndarray, omega: np.ndarray) -> np.ndarray:
+        omega_n = np.asarray(omega_n, dtype=float)
+        if omega_n.shape != (len(self.modes),):
+            raise ValueError(f"SqueezeFilmDamping is bound to {len(self.modes)} modes, got omega_n {omega_n.shape}.")
+        return self.tau * self.coefficients(omega) / (2.0 * omega_n)
+
+
+def squeeze_series(
+    modes: ModeSet,
+    aspect: float,
+    sigma: np.ndarray,
+    edges: str = "C",
+    n_terms: int = 64,
+) -> np.ndarray:
+    """
+    Direct double-series G_k(σ) = Σ_ij α_ik^2 β_jk^2 / (k_ij^2 + j σ),
+    shape (len(sigma), K). aspect = a / b.
+    """
+    i = np.arange(1, n_terms + 1)
+    A = _sine_coefficients(modes.m, n_terms, edges) ** 2  # (K, n)
+    B = _sine_coefficients(modes.n, n_terms, edges) ** 2
+    W = (A[:, :, None] * B[:, None, :]).reshape(len(modes), -1)           # (K, n^2)
+    k2 = ((i[:, None] * np.pi) ** 2 + (i[None, :] * np.pi * aspect) ** 2).ravel()
+
+    # 1 / (k^2 + jσ) = (k^2 - jσ) / (k^4 + σ^2); real GEMMs over the terms
+    sigma = np.asarray(sigma, dtype=float)[:, None]
+    den = k2**2 + sigma**2
+    return (k2 / den) @ W.T - 1j * ((sigma / den) @ W.T)
+
+
+def _sine_coefficients(m: np.ndarray, n_terms: int, edges: str) -> np.ndarray:
+    """α_i = 2 ∫_0^1 X_m(ξ) sin(iπξ) dξ, shape (K, n_terms)."""
+    m = np.asarray(m)
+    i = np.arange(1, n_terms + 1)
+    if edges == "S":
+        return (i[None, :] == m[:, None]).astype(float)
+
+    xi, wq = np.polynomial.legendre.leggauss(max(512, 8 * n_terms))
+    xi, wq = 0.5 * (xi + 1.0), 0.5 * wq
+    X = _clamped_beam(m, xi)                                   # (K, Q)
+    return 2.0 * (X * wq) @ np.sin(np.pi * xi[:, None] * i)    # (K, n)
+
+
+def _norm_sq(m: np.ndarray, edges: str) -> np.ndarray:
+    """∫_0^1 X_m^2 dξ."""
+    if edges == "S":
+        return np.full(np.shape(m), 0.5)
+    xi, wq = np.polynomial.legendre.leggauss(512)
+    xi, wq = 0.5 * (xi + 1.0), 0.5 * wq
+    return (_clamped_beam(np.asarray(m), xi) ** 2) @ wq
+
+
+def _clamped_beam(m: np.ndarray, xi: np.ndarray) -> np.ndarray:
+    """
+    Clamped-clamped beam eigenfunctions X_m(ξ), shape (K, Q), in an
+    overflow-free form (the cosh / sinh pair is rewritten with e^{-λ}).
+    """
+    lam = (2.0 * np.asarray(m, dtype=float) + 1.0) * np.pi / 2.0
+    for _ in range(20):  # Newton on cos λ - 1 / cosh λ = 0
+        f = np.cos(lam) - 1.0 / np.cosh(lam)
+        df = -np.sin(lam) + np.tanh(lam) / np.cosh(lam)
+        lam = lam - f / df
+    lam = lam[:, None]
+
+    em = np.exp(-lam)
+    s = (1.0 + em**2 - 2.0 * np.cos(lam) * em) / (1.0 - em**2 - 2.0 * np.sin(lam) * em)
+    r = (np.cos(lam) - np.sin(lam) - em) / (1.0 - em**2 - 2.0 * np.sin(lam) * em)
+    lx = lam * xi
+    return np.exp(lam * (xi - 1.0)) * r + 0.5 * np.exp(-lx) * (1.0 + s) - np.cos(lx) + s * np.sin(lx)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from mems_ana.electrical.capacitance import EPS0, admittance_dielectric
+from mems_ana.geometry.electrode import ElectrodePattern, overlap_matrix
+from mems_ana.rom.plate_rom import RectPlateROM, sdof_frf
+
+
+@dataclass(frozen=True)
+class PiezoCoupling:
+    """
+    Two-way electromechanical coupling of a piezo plate, per mode k:
+
+      M_k (q_k'' + 2 ζ ω_k q_k' + ω_k^2 q_k) = θ_k V
+      I = Y_C V + jω Σ_k θ_k q_k  =  (Y_C + jω Σ_k θ_k^2 H_k / M_k) V
+
+    with θ_k = -M_V ∫_E ∇²φ_k dA [N/V] (M_V: piezo moment per width per
+    volt, full coverage), M_k = m_areal ∫ φ_k^2 dA and H_k the unit-mass
+    SDOF FRF. Y_C = jωC0 + ωC0 tanδ is the clamped dielectric branch.
+
+    These are physical modal quantities; the ROM's K_W only rescales uz
+    and does not enter the electrical side.
+    """
+    omega_n: np.ndarray     # [rad/s], shape (K,)
+    theta: np.ndarray       # [N/V], shape (K,)
+    modal_mass: np.ndarray  # [kg], shape (K,)
+    C0: float               # [F] clamped capacitance
+    tan_delta: float = 0.0
+
+    @classmethod
+    def from_rom(
+        cls,
+        rom: RectPlateROM,
+        electrodes: ElectrodePattern | None = None,
+        drive: np.ndarray | None = None,
+    ) -> "PiezoCoupling":
+        """
+        Simply-supported mode shapes driven through `electrodes` (default:
+        centered rectangle covering stack.elec_area_ratio, as
+        StaticPlateSolver) tied to one terminal with relative voltages
+        `drive` (E,) (default all 1): θ = M_V O @ drive, C0 = Σ drive_e^2 C_e.
+        """
+        if electrodes is None:
+            electrodes = ElectrodePattern.center(rom.stack.elec_area_ratio)
+        d = np.ones(len(electrodes)) if drive is None else np.asarray(drive, dtype=float)
+        if d.shape != (len(electrodes),):
+            raise ValueError(f"drive must have shape ({len(electrodes)},), got {d.shape}.")
+
+        props = rom.stack.properties()
+        O = overlap_matrix(rom.modes.m, rom.modes.n, rom.plate, electrodes)
+        theta = props.moment_per_volt_full * (O @ d)
+        modal_mass = np.full(len(rom.modes), props.areal_mass * rom.plate.a * rom.plate.b / 4.0)
+
+        # full-coverage capacitance per area times driven area (no elec_area_ratio)
+        cap_full = EPS0 * rom.stack.piezo.eps_r / rom.stack.t_pzt if props.active else 0.0
+        C0 = cap_full * rom.plate.area() * float(np.sum(d**2 * electrodes.area_fractions()))
+
+        tan_delta = rom.stack.piezo.tan_delta if rom.stack.piezo else 0.0
+        return cls(rom.modal_omegas(), theta, modal_mass, C0, tan_delta)
+
+    # ---------- per-mode figures ----------
+    def modal_stiffness(self) -> np.ndarray:
+        """K_k = M_k ω_k^2 [N/m]."""
+        return self.modal_mass * self.omega_n**2
+
+    def k_eff2(self) -> np.ndarray:
+        """Effective coupling factor k_k^2 = θ^2 / (K_k C0 + θ^2), shape (K,)."""
+        t2 = self.theta**2
+        den = self.modal_stiffness() * self.C0 + t2
+        return np.divide(t2, den, out=np.zeros_like(t2), where=den > 0.0)
+
+    def motional_weights(self) -> np.ndarray:
+        """θ_k^2 / M_k [F / s^2]: weights applied to the modal FRF H_k."""
+        return self.theta**2 / self.modal_mass
+
+    def free_capacitance(self) -> float:
+        """Low-frequency (ω << ω_1) capacitance C0 + Σ θ_k^2 / K_k [F]."""
+        return float(self.C0 + np.sum(self.theta**2 / self.modal_stiffness()))
+
+    # ---------- admittance ----------
+    def motional_admittance(self, omega: np.ndarray, H: np.ndarray) -> np.ndarray:
+        """
+        Σ motional branches jω Σ_k θ_k^2 H_k / M_k from an already evaluated
+        modal FRF H of shape (*S, K); returns shape S.
+        """
+        return 1j * np.asarray(omega) * (H @ self.motional_weights())
+
+    def admittance(
+        self,
+        f_hz: float | np.ndarray,
+        zeta: float | np.ndarray = 0.02,
+        H: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Coupled terminal admittance Y(f) = Y_C + motional branches [S], shape S."""
+        omega = 2.0 * np.pi * np.asarray(f_hz, dtype=float)
+        if H is None:
+            H = sdof_frf(self.omega_n, omega[..., None], np.asarray(zeta, dtype=float)[..., None])
+        return admittance_dielectric(self.C0, omega, self.tan_delta) + self.motional_admittance(omega, H)
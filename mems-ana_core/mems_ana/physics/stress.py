@@ -0,0 +1,383 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterator
+
+import numpy as np
+
+from mems_ana.geometry.electrode import ElectrodePattern
+from mems_ana.materials.stack import Stack
+from mems_ana.rom.plate_rom import RectPlateROMBatch
+from mems_ana.solver.plate_fd import PlateGrid, nodal_curvatures
+
+COMPONENTS = ("xx", "yy", "xy", "von_mises")
+STRAIN_COMPONENTS = ("xx", "yy", "xy", "zz")
+
+# voltages per metrics block: ~4 MB of float64 field data per block
+_BLOCK_VALUES = 1 << 19
+
+
+@dataclass(frozen=True)
+class StressMetrics:
+    """
+    Scalar stress metrics of analysis-items §7, one entry per voltage:
+    max|σ|, area-weighted avg|σ| and the area fraction with |σ| > σ_th
+    (shape (n_V,) for a scalar threshold, (n_V, n_th) for an array).
+    """
+    max_abs: np.ndarray        # [Pa]
+    mean_abs: np.ndarray       # [Pa]
+    area_fraction: np.ndarray  # [-]
+    sigma_th: np.ndarray       # [Pa]
+
+    @property
+    def concentration(self) -> np.ndarray:
+        """C = max|σ| / avg|σ| (0 where the field vanishes)."""
+        return np.divide(self.max_abs, self.mean_abs, out=np.zeros_like(self.max_abs), where=self.mean_abs > 0.0)
+
+
+class FieldAccumulator:
+    """
+    Online reductions of |field| for n rows (designs or drive points) fed
+    tile by tile: running max|x|, Σ w |x|, Σ w and Σ w [|x| > th] per row
+    and threshold. Memory is O(n x thresholds) whatever the field size, so
+    a sweep never has to hold a whole (nx, ny) field of any design.
+
+    Tiles may cover any subset of the points, in any order, and any slice
+    of rows; the result only depends on which points were fed.
+    """
+
+    def __init__(self, n: int, sigma_th: float | np.ndarray = ()) -> None:
+        self.sigma_th = np.asarray(sigma_th, dtype=float)
+        self._th = np.atleast_1d(self.sigma_th)
+        self.max_abs = np.zeros(n)
+        self.sum_abs = np.zeros(n)
+        self.weight = np.zeros(n)
+        self.above = np.zeros((n, self._th.shape[0]))
+
+    def update(self, values: np.ndarray, weights: np.ndarray, rows: slice = slice(None)) -> None:
+        """
+        Add one tile: values (r, p) for the r rows selected by `rows` and
+        p points with area weights (p,). Real or complex (|x| is used).
+        """
+        a = np.abs(values)
+        w = np.asarray(weights, dtype=float)
+        if a.ndim != 2 or a.shape[1] != w.shape[0]:
+            raise ValueError(f"Tile values must have shape (rows, {w.shape[0]}), got {a.shape}.")
+        if a.shape[1] == 0:
+            return
+        np.maximum(self.max_abs[rows], a.max(axis=1), out=self.max_abs[rows])
+        self.sum_abs[rows] += a @ w
+        self.weight[rows] += w.sum()
+        for j, t in enumerate(self._th):
+            self.above[rows, j] += (a > t) @ w
+
+    def result(self) -> StressMetrics:
+        """max / weighted mean / area fraction over everything fed so far."""
+        W = np.where(self.weight > 0.0, self.weight, 1.0)
+        frac = self.above / W[:, None]
+        return StressMetrics(
+            self.max_abs.copy(),
+            self.sum_abs / W,
+            frac[:, 0] if self.sigma_th.ndim == 0 else frac,
+            self.sigma_th,
+        )
+
+
+class PlateStress:
+    """
+    Stress / strain fields at one height z of the laminate for any batch of
+    drive voltages.
+
+    Kirchhoff kinematics about the neutral axis z0 of the Stack:
+      ε_xx = -(z - z0) w_xx,  ε_yy = -(z - z0) w_yy,  ε_xy = -(z - z0) w_xy
+      σ_xx = Q (ε_xx + ν ε_yy) - Q ε0,  σ_yy = Q (ε_yy + ν ε_xx) - Q ε0,
+      τ_xy = E / (1 + ν) ε_xy
+    with ε0 = d31 V χ / t_pzt the piezo eigenstrain under an electrode χ
+    (piezo layer only). As in Stack, both layers use the base modulus
+    Q = E / (1 - ν^2), and the eigenstress Q ε0 is the one whose moment
+    is Stack's actuation moment, so the stresses belong to the same model
+    as the deflection solvers.
+
+    The response is linear in the electrode voltages, so the tensor per
+    volt of every electrode is formed once; a batch of voltages is one
+    matrix product, followed by the requested component (von Mises is
+    plane stress). `metrics` evaluates blocks of voltages and reduces each
+    block to all §7 metrics while it is in cache, without keeping the
+    fields.
+
+    analysis-items writes the evaluated field as σ_zz; in the thin-plate
+    model the through-thickness normal stress vanishes, so the bending
+    stress is one of the in-plane components above (default von Mises).
+    """
+
+    def __init__(
+        self,
+        stack: Stack,
+        grid: PlateGrid,
+        unit_deflections: np.ndarray,
+        electrodes: np.ndarray | None = None,
+        z: float | str = "top",
+        component: str = "von_mises",
+    ) -> None:
+        """
+        unit_deflections: deflection per volt of every electrode [m/V],
+        shape (E, nx, ny) (or (nx, ny) for one). electrodes: matching masks
+        (E, nx, ny) (default: full coverage). z: "top", "bottom" or a height
+        [m] above the bottom of the base layer.
+        """
+        if component not in COMPONENTS:
+            raise ValueError(f"component must be one of {COMPONENTS}, got {component!r}.")
+        W = np.asarray(unit_deflections, dtype=float)
+        W = W.reshape((-1, grid.nx, grid.ny)) if W.ndim == 2 else W
+        if W.ndim != 3 or W.shape[1:] != (grid.nx, grid.ny):
+            raise ValueError(f"unit_deflections must have shape (E, {grid.nx}, {grid.ny}), got {W.shape}.")
+        if electrodes is None:
+            chi = np.ones_like(W)
+        else:
+            chi = np.asarray(electrodes, dtype=float).reshape(W.shape[0], grid.nx, grid.ny)
+
+        self.stack = stack
+        self.grid = grid
+        self.component = component
+        self.z = _height(stack, z)
+
+        props = stack.properties()
+        E, nu = stack.base.E, stack.base.nu
+        in_piezo = props.active and self.z > stack.t_base
+        self.E = E
+        self.nu = nu
+
+        # strain per volt (E, 3, nx, ny): ε_xx, ε_yy, ε_xy
+        self._strain = -(self.z - props.z0) * nodal_curvatures(grid, W)
+        eps0 = stack.piezo.d31 / stack.t_pzt * chi if in_piezo else np.zeros_like(chi)
+
+        # stress per volt, flattened to (E, 3 * nx * ny) for the voltage product
+        sig = np.stack(_plane_stress(self._strain[:, 0], self._strain[:, 1], self._strain[:, 2], eps0, E, nu), axis=1)
+        self._stress = np.ascontiguousarray(sig.reshape(W.shape[0], -1))
+        self._weights = grid.node_weights().ravel() / grid.plate.area()
+
+    @classmethod
+    def from_static(
+        cls,
+        solver,
+        electrodes: np.ndarray | ElectrodePattern | None = None,
+        z: float | str = "top",
+        component: str = "von_mises",
+    ) -> "PlateStress":
+        """Stresses of a StaticPlateSolver for its electrodes (default: solver.default_electrode())."""
+        if electrodes is None:
+            electrodes = solver.default_electrode()
+        elif isinstance(electrodes, ElectrodePattern):
+            electrodes = electrodes.masks(solver.grid.nx, solver.grid.ny)
+        chi = np.asarray(electrodes, dtype=float).reshape(-1, solver.grid.nx, solver.grid.ny)
+        return cls(solver.stack, solver.grid, solver.unit_deflections(chi), chi, z, component)
+
+    @property
+    def n_electrodes(self) -> int:
+        return self._stress.shape[0]
+
+    # ---------- fields ----------
+    def tensor(self, voltages: np.ndarray | float) -> np.ndarray:
+        """Stress components (σ_xx, σ_yy, τ_xy) [Pa], shape (n_V, 3, nx, ny)."""
+        V = self._voltages(voltages)
+        return (V @ self._stress).reshape(V.shape[0], 3, self.grid.nx, self.grid.ny)
+
+    def fields(self, voltages: np.ndarray | float, component: str | None = None) -> np.ndarray:
+        """Stress component [Pa] (default: the evaluator's component), shape (n_V, nx, ny)."""
+        V = self._voltages(voltages)
+        flat = self._component(V @ self._stress, component or self.component)
+        return flat.reshape(V.shape[0], self.grid.nx, self.grid.ny)
+
+    def strain(self, voltages: np.ndarray | float, component: str = "zz") -> np.ndarray:
+        """
+        Strain [-], shape (n_V, nx, ny): total in-plane strain for "xx",
+        "yy", "xy" (tensor shear), or the elastic through-thickness strain
+        ε_zz = -ν / E (σ_xx + σ_yy) for "zz" (no free d33 strain: Stack has no d33).
+        """
+        if component not in STRAIN_COMPONENTS:
+            raise ValueError(f"component must be one of {STRAIN_COMPONENTS}, got {component!r}.")
+        V = self._voltages(voltages)
+        if component == "zz":
+            s = (V @ self._stress).reshape(V.shape[0], 3, -1)
+            out = -self.nu / self.E * (s[:, 0] + s[:, 1])
+        else:
+            i = STRAIN_COMPONENTS.index(component)
+            out = V @ self._strain[:, i].reshape(self.n_electrodes, -1)
+        return out.reshape(V.shape[0], self.grid.nx, self.grid.ny)
+
+    # ---------- metrics ----------
+    def metrics(
+        self,
+        voltages: np.ndarray | float,
+        sigma_th: float | np.ndarray,
+        component: str | None = None,
+        mask: np.ndarray | None = None,
+    ) -> StressMetrics:
+        """
+        §7 metrics of |σ| for every voltage. `mask` (nx, ny) restricts the
+        evaluation region (e.g. excluding clamped-edge rows); areas are
+        trapezoidal node weights of the grid.
+        """
+        V = self._voltages(voltages)
+        comp = component or self.component
+        th = np.asarray(sigma_th, dtype=float)
+
+        w = self._weights
+        S = self._stress.reshape(self.n_electrodes, 3, -1)
+        if mask is not None:
+            keep = np.flatnonzero(np.asarray(mask, dtype=bool).ravel())
+            w, S = w[keep], S[:, :, keep]
+        S = S.reshape(self.n_electrodes, -1)
+
+        acc = FieldAccumulator(V.shape[0], th)
+        rows = max(1, _BLOCK_VALUES // S.shape[1])
+        for i in range(0, V.shape[0], rows):
+            acc.update(self._component(V[i:i + rows] @ S, comp), w, slice(i, i + rows))
+        return acc.result()
+
+    # ---------- helpers ----------
+    def _voltages(self, voltages: np.ndarray | float) -> np.ndarray:
+        """(n_V,) levels on every electrode or (n_V, E) per electrode -> (n_V, E)."""
+        V = np.atleast_1d(np.asarray(voltages, dtype=float))
+        if V.ndim == 1:
+            V = np.repeat(V[:, None], self.n_electrodes, axis=1)
+        if V.ndim != 2 or V.shape[1] != self.n_electrodes:
+            raise ValueError(f"voltages must have {self.n_electrodes} column(s), one per electrode.")
+        return V
+
+    @staticmethod
+    def _component(flat: np.ndarray, component: str) -> np.ndarray:
+        """(n, 3 * P) stacked tensors -> (n, P) component."""
+        s = flat.reshape(flat.shape[0], 3, -1)
+        if component == "von_mises":
+            return _von_mises(s[:, 0], s[:, 1], s[:, 2])
+        if component not in COMPONENTS:
+            raise ValueError(f"component must be one of {COMPONENTS}, got {component!r}.")
+        return s[:, COMPONENTS.index(component)].copy()
+
+
+def modal_field_tiles(
+    batch: RectPlateROMBatch,
+    V_rms: float,
+    f_hz: float = 0.0,
+    zeta: float = 0.02,
+    nx: int = 121,
+    ny: int = 121,
+    component: str = "von_mises",
+    tile_values: int = _BLOCK_VALUES,
+) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    uz and top-surface stress of N ROM designs at one drive point,
+    generated tile by tile.
+
+    uz is the ROM's field (batch.modal_coordinates, K_W-calibrated, so
+    its center equals frf_center_spectrum). The stresses need physical
+    curvatures, so they use batch.physical_modal_coordinates instead: the
+    moment-consistent forcing of the centered electrode, whose static
+    limit is PlateStress.from_static on an SSSS plate. The eigenstrain
+    acts under the same electrode, in phase with the drive. At f_hz = 0
+    both are real (in phase with the drive).
+
+    The grid is nx x ny nodes over the normalized plate (x/a, y/b), so one
+    sine table serves designs of any size; curvatures are analytic
+    (w_xx = -Σ q_k (mπ/a)^2 φ_k, ...). For dynamic drive the fields are
+    phasors σ(t) = Re(S e^{jωt}): a tensor component is reported as its
+    amplitude |S|, von Mises as its peak over the cycle (_von_mises_peak),
+    not as von Mises of the component amplitudes (those peak at different
+    times once the modes are out of phase).
+
+    Yields (weights (p,), |uz| (N, p) [m], stress (N, p) [Pa]) for tiles of
+    whole x rows holding about tile_values values per array; weights are
+    trapezoidal area fractions (all tiles sum to 1).
+    """
+    if component not in COMPONENTS:
+        raise ValueError(f"component must be one of {COMPONENTS}, got {component!r}.")
+    if np.ndim(V_rms) or np.ndim(f_hz) or np.ndim(zeta):
+        raise ValueError("modal_field_tiles evaluates one drive point: V_rms, f_hz and zeta must be scalars.")
+    q = batch.modal_coordinates(V_rms, f_hz, zeta)
+    qs = batch.physical_modal_coordinates(V_rms, f_hz, zeta)
+    if float(f_hz) == 0.0:
+        q, qs = q.real, qs.real
+    N, K = q.shape
+    V_peak = float(V_rms) * np.sqrt(2.0)
+
+    xi = np.linspace(0.0, 1.0, nx)
+    eta = np.linspace(0.0, 1.0, ny)
+    m = batch.modes.m.astype(float)
+    n = batch.modes.n.astype(float)
+    Sx, Cx = np.sin(np.pi * xi[:, None] * m), np.cos(np.pi * xi[:, None] * m)  # (nx, K)
+    Sy, Cy = np.sin(np.pi * eta[:, None] * n).T, np.cos(np.pi * eta[:, None] * n).T  # (K, ny)
+    w_row = np.full(ny, 1.0 / (ny - 1))
+    w_row[[0, -1]] *= 0.5
+    w_col = np.full(nx, 1.0 / (nx - 1))
+    w_col[[0, -1]] *= 0.5
+
+    # per-design factors (N, K) / (N, 1, 1)
+    kx = np.pi * m / batch.plate.a[:, None]
+    ky = np.pi * n / batch.plate.b[:, None]
+    q_xx, q_yy, q_xy = -qs * kx**2, -qs * ky**2, qs * kx * ky
+    stack = batch.stack
+    per = (slice(None), None, None)
+    dz = (stack.t_total() - stack.neutral_axis_z0())[per]
+    E, nu = stack.E_base[per], stack.nu_base[per]
+    active = stack._active()
+    eps0 = np.where(active, stack.d31 * V_peak / np.where(active, stack.t_pzt, 1.0), 0.0)[per]
+    half = 0.5 * np.sqrt(stack.elec_area_ratio)[:, None]
+    in_y = np.abs(eta - 0.5) <= half + 1e-12  # (N, ny)
+
+    rows = max(1, tile_values // (N * ny))
+    for i0 in range(0, nx, rows):
+        sx, cx = Sx[i0:i0 + rows], Cx[i0:i0 + rows]
+        uz = (q[:, None, :] * sx) @ Sy
+        exx = -dz * ((q_xx[:, None, :] * sx) @ Sy)
+        eyy = -dz * ((q_yy[:, None, :] * sx) @ Sy)
+        exy = -dz * ((q_xy[:, None, :] * cx) @ Cy)
+        in_x = np.abs(xi[i0:i0 + rows] - 0.5) <= half + 1e-12  # (N, r)
+        chi = in_x[:, :, None] & in_y[:, None, :]
+        s = _plane_stress(exx, eyy, exy, eps0 * chi, E, nu)
+        if component == "von_mises":
+            sig = _von_mises_peak(*s) if np.iscomplexobj(qs) else _von_mises(*s)
+        else:
+            sig = np.abs(s[COMPONENTS.index(component)])
+        weights = np.outer(w_col[i0:i0 + rows], w_row).ravel()
+        yield weights, np.abs(uz).reshape(N, -1), sig.reshape(N, -1)
+
+
+def _plane_stress(exx, eyy, exy, eps0, E, nu) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(σ_xx, σ_yy, τ_xy) from strains and in-plane eigenstrain, base-modulus laminate (see PlateStress)."""
+    Q = E / (1.0 - nu**2)
+    return Q * (exx + nu * eyy) - Q * eps0, Q * (eyy + nu * exx) - Q * eps0, E / (1.0 + nu) * exy
+
+
+def _von_mises(sxx: np.ndarray, syy: np.ndarray, txy: np.ndarray) -> np.ndarray:
+    """Plane-stress von Mises stress."""
+    return np.sqrt(sxx * sxx - sxx * syy + syy * syy + 3.0 * txy * txy)
+
+
+def _von_mises_peak(sxx: np.ndarray, syy: np.ndarray, txy: np.ndarray) -> np.ndarray:
+    """
+    Peak over one cycle of the plane-stress von Mises stress of phasors
+    S = R + jI, i.e. max_θ vm(R cos θ - I sin θ). With the quadratic form
+    vm^2 = s^T A s, a = R^T A R, b = I^T A I, c = R^T A I:
+
+      vm^2(θ) = (a + b)/2 + (a - b)/2 cos 2θ - c sin 2θ
+      max     = (a + b)/2 + sqrt(((a - b)/2)^2 + c^2)
+    """
+    rx, ry, rt = sxx.real, syy.real, txy.real
+    ix, iy, it = sxx.imag, syy.imag, txy.imag
+    a = rx * rx - rx * ry + ry * ry + 3.0 * rt * rt
+    b = ix * ix - ix * iy + iy * iy + 3.0 * it * it
+    c = rx * ix - 0.5 * (rx * iy + ry * ix) + ry * iy + 3.0 * rt * it
+    return np.sqrt(0.5 * (a + b) + np.hypot(0.5 * (a - b), c))
+
+
+def _height(stack: Stack, z: float | str) -> float:
+    if z == "top":
+        return stack.t_total()
+    if z == "bottom":
+        return 0.0
+    if isinstance(z, str):
+        raise ValueError(f"z must be 'top', 'bottom' or a height [m], got {z!r}.")
+    if not 0.0 <= z <= stack.t_total():
+        raise ValueError(f"z must lie within the stack thickness [0, {stack.t_total()}] m.")
+    return float(z)
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from mems_ana.geometry.plate import RectPlate
+from mems_ana.rom.plate_rom import Mode, ModeSet
+
+
+@dataclass(frozen=True, eq=False)
+class ModalBasis:
+    """
+    Simply-supported mode shapes sampled once at P points:
+
+      Phi[p, k] = sin(m_k π x_p / a) sin(n_k π y_p / b)
+
+    Phi is a C-contiguous (P, K) float32/float64 matrix, so a field for
+    any number of modal-coordinate vectors is one matrix product.
+    `shape` is the field shape of one vector: (nx, ny) for a grid
+    (indexing "ij", point p = i*ny + j) or (P,) for sensor points.
+    """
+    modes: ModeSet
+    Phi: np.ndarray
+    x: np.ndarray  # [m] point coordinates, shape (P,)
+    y: np.ndarray
+    shape: tuple[int, ...]
+
+    @classmethod
+    def from_grid(
+        cls,
+        plate: RectPlate,
+        modes: list[Mode] | ModeSet,
+        nx: int = 101,
+        ny: int = 101,
+        dtype: type = np.float64,
+    ) -> "ModalBasis":
+        """Uniform nx x ny grid including the edges; sines are tabulated per axis."""
+        if nx < 2 or ny < 2:
+            raise ValueError("ModalBasis grid needs nx, ny >= 2.")
+        modes = ModeSet.from_modes(modes)
+        x = np.linspace(0.0, plate.a, nx)
+        y = np.linspace(0.0, plate.b, ny)
+
+        # separable: (nx, K) and (ny, K) tables, outer product per mode
+        Sx = np.sin(np.pi * x[:, None] / plate.a * modes.m)
+        Sy = np.sin(np.pi * y[:, None] / plate.b * modes.n)
+        Phi = (Sx[:, None, :] * Sy[None, :, :]).reshape(nx * ny, len(modes))
+
+        X, Y = np.meshgrid(x, y, indexing="ij")
+        return cls(modes, np.ascontiguousarray(Phi, dtype=dtype), X.ravel(), Y.ravel(), (nx, ny))
+
+    @classmethod
+    def from_points(
+        cls,
+        plate: RectPlate,
+        modes: list[Mode] | ModeSet,
+        x: np.ndarray,
+        y: np.ndarray,
+        dtype: type = np.float64,
+    ) -> "ModalBasis":
+        """Arbitrary sensor points (x, y) [m], broadcast to a common 1-D shape."""
+        modes = ModeSet.from_modes(modes)
+        x, y = np.broadcast_arrays(np.atleast_1d(np.asarray(x, dtype=float)),
+                                   np.atleast_1d(np.asarray(y, dtype=float)))
+        if x.ndim != 1:
+            raise ValueError("ModalBasis.from_points expects 1-D coordinate arrays.")
+
+        Phi = np.sin(np.pi * x[:, None] / plate.a * modes.m) * np.sin(np.pi * y[:, None] / plate.b * modes.n)
+        return cls(modes, np.ascontiguousarray(Phi, dtype=dtype), x.copy(), y.copy(), (x.shape[0],))
+
+    def __len__(self) -> int:
+        return self.Phi.shape[0]
+
+    def field(self, q: np.ndarray) -> np.ndarray:
+        """
+        Field from modal coordinates q of shape (..., K); returns (..., *shape).
+        Complex q is split into real/imag parts so Phi is never upcast.
+        """
+        q = np.asarray(q)
+        K = self.Phi.shape[1]
+        if q.shape[-1:] != (K,):
+            raise ValueError(f"Modal coordinates must have last axis {K}, got {q.shape}.")
+
+        lead = q.shape[:-1]
+        q2 = q.reshape(-1, K)
+        if np.iscomplexobj(q2):
+            re_im = np.concatenate([q2.real, q2.imag]).astype(self.Phi.dtype, copy=False)
+            out = re_im @ self.Phi.T
+            n = q2.shape[0]
+            u = out[:n] + 1j * out[n:]
+        else:
+            u = q2.astype(self.Phi.dtype, copy=False) @ self.Phi.T
+        return u.reshape(lead + self.shape)
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+from scipy.signal import lfilter
+
+if TYPE_CHECKING:
+    from mems_ana.physics.damping import DampingModel
+
+
+@dataclass(frozen=True, eq=False)
+class ModalSystem:
+    """
+    Diagonal modal state-space model with E inputs and O outputs:
+
+      q_k'' + 2 ζ_k ω_k q_k' + ω_k^2 q_k = Σ_e B[k, e] u_e
+      y_o = Σ_k C[o, k] q_k
+
+    Only the diagonal data is stored; every transfer / response is a sum
+    over modes, O(K x F) per input-output pair.
+    """
+    omega_n: np.ndarray  # [rad/s], shape (K,)
+    zeta: np.ndarray     # [-], shape (K,)
+    B: np.ndarray        # input participation, shape (K, E)
+    C: np.ndarray        # output participation, shape (O, K)
+
+    def __post_init__(self) -> None:
+        w = np.atleast_1d(np.asarray(self.omega_n, dtype=float))
+        K = w.shape[0]
+        z = np.broadcast_to(np.asarray(self.zeta, dtype=float), (K,))
+        B = np.asarray(self.B, dtype=float)
+        C = np.asarray(self.C, dtype=float)
+        B = B.reshape(K, -1) if B.ndim < 2 else B
+        C = C.reshape(-1, K) if C.ndim < 2 else C
+        if w.ndim != 1 or B.shape[0] != K or C.shape[1] != K:
+            raise ValueError(f"ModalSystem expects omega_n (K,), B (K, E), C (O, K); got {w.shape}, {B.shape}, {C.shape}.")
+        object.__setattr__(self, "omega_n", np.ascontiguousarray(w))
+        object.__setattr__(self, "zeta", np.ascontiguousarray(z))
+        object.__setattr__(self, "B", np.ascontiguousarray(B))
+        object.__setattr__(self, "C", np.ascontiguousarray(C))
+
+    @property
+    def n_modes(self) -> int:
+        return self.omega_n.shape[0]
+
+    @property
+    def n_inputs(self) -> int:
+        return self.B.shape[1]
+
+    @property
+    def n_outputs(self) -> int:
+        return self.C.shape[0]
+
+    def select(self, keep: np.ndarray) -> "ModalSystem":
+        """Sub-system on the modes picked by a boolean mask or index array."""
+        return ModalSystem(self.omega_n[keep], self.zeta[keep], self.B[keep], self.C[:, keep])
+
+    def observable(self) -> "ModalSystem":
+        """Drop modes that no input drives or no output sees."""
+        return self.select(np.any(self.B != 0.0, axis=1) & np.any(self.C != 0.0, axis=0))
+
+    # ---------- frequency domain ----------
+    def modal_frf(self, f_hz: float | np.ndarray, zeta: float | np.ndarray | DampingModel | None = None) -> np.ndarray:
+        """
+        Per-mode H_k(f), shape (*S, K). zeta=None uses the per-mode damping;
+        an array is a uniform ratio broadcast against f_hz (shape S); a
+        damping model supplies ζ_k(ω) for every mode.
+        """
+        omega = 2.0 * np.pi * np.asarray(f_hz, dtype=float)[..., None]
+        if zeta is None:
+            z = self.zeta
+        elif hasattr(zeta, "modal_zeta"):
+            z = zeta.modal_zeta(self.omega_n, omega[..., 0])
+        else:
+            z = np.asarray(zeta, dtype=float)[..., None]
+        return sdof_frf(self.omega_n, omega, z)
+
+    def transfer(self, f_hz: float | np.ndarray, zeta: float | np.ndarray | DampingModel | None = None) -> np.ndarray:
+        """Transfer matrix G(f) = C diag(H(f)) B, shape (*S, O, E)."""
+        H = self.modal_frf(f_hz, zeta)
+        return (H[..., None, :] * self.C) @ self.B
+
+    def response(
+        self,
+        f_hz: float | np.ndarray,
+        u: np.ndarray,
+        zeta: float | np.ndarray | DampingModel | None = None,
+    ) -> np.ndarray:
+        """
+        Output phasors for input phasors u of shape (*S, E) (or (E,)),
+        shape (*S, O). Never forms the (O, E) matrix per frequency.
+        """
+        H = self.modal_frf(f_hz, zeta)
+        force = np.asarray(u) @ self.B.T
+        return (H * force) @ self.C.T
+
+    # ---------- time domain ----------
+    def to_discrete(self, dt: float) -> "DiscreteModalSystem":
+        """Exact zero-order-hold discretization, one 2nd-order section per mode."""
+        if dt <= 0.0:
+            raise ValueError("dt must be positive.")
+        b, a = _zoh_sections(self.omega_n, self.zeta, float(dt))
+        return DiscreteModalSystem(self, float(dt), b, a)
+
+
+@dataclass(frozen=True, eq=False)
+class DiscreteModalSystem:
+    """ZOH-discretized ModalSystem: q_k[z] / f_k[z] = b_k(z^-1) / a_k(z^-1)."""
+    system: ModalSystem
+    dt: float
+    b: np.ndarray  # (K, 3)
+    a: np.ndarray  # (K, 3)
+
+    def initial_state(self) -> np.ndarray:
+        return np.zeros((self.b.shape[0], 2))
+
+    def simulate(self, u: np.ndarray, zi: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Outputs y (n, O) for input samples u (n, E), starting from filter
+        state zi (K, 2) (rest if None). Returns (y, final state).
+
+        The recurrence is sequential in time, so the vectorized axis is
+        time: every mode is one compiled lfilter pass over its contiguous
+        force row, and the outputs are one (n, K) x (K, O) product. A
+        recurrence stepped over all modes at once costs one Python-level
+        step per sample and only pays off for chunks shorter than about
+        the number of modes, which the streaming chunk sizes never are.
+        """
+        u = np.asarray(u, dtype=float).reshape(-1, self.system.n_inputs)
+        zi = self.initial_state() if zi is None else np.array(zi, dtype=float)
+
+        force = self.system.B @ u.T  # (K, n), one contiguous row per mode
+        q = np.empty_like(force)
+        for k in range(self.b.shape[0]):
+            q[k], zi[k] = lfilter(self.b[k], self.a[k], force[k], zi=zi[k])
+        return q.T @ self.system.C.T, zi
+
+
+def sdof_frf(w_n: np.ndarray, omega: np.ndarray, zeta: np.ndarray | float) -> np.ndarray:
+    """
+    SDOF FRF (unit-normalized) with viscous damping, broadcast over inputs:
+      H = 1 / ((w_n^2 - ω^2) + j 2ζ w_n ω)
+    """
+    return 1.0 / ((w_n**2 - omega**2) + 1j * (2.0 * zeta * w_n * omega))
+
+
+def _zoh_sections(w: np.ndarray, zeta: np.ndarray, dt: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Exact ZOH transfer function q[k]/f[k] of every unit-input mode, as (K, 3) b and a:
+      Φ = exp(A dt),  Γ = A^-1 (Φ - I) [0, 1]^T
+      q/f = (Γ1 z^-1 + (Φ12 Γ2 - Φ22 Γ1) z^-2) / (1 - tr(Φ) z^-1 + det(Φ) z^-2)
+    Valid for under-, critically and over-damped modes.
+    """
+    sigma = zeta * w
+    wd = w * np.sqrt(1.0 - zeta**2 + 0j)
+    e = np.exp(-sigma * dt)
+    c = np.cos(wd * dt).real
+    s_over_wd = (dt * np.sinc(wd * dt / np.pi)).real  # sin(wd dt) / wd, finite at wd = 0
+
+    P11 = e * (c + sigma * s_over_wd)
+    P12 = e * s_over_wd
+    P21 = -e * w**2 * s_over_wd
+    P22 = e * (c - sigma * s_over_wd)
+
+    G1 = (1.0 - P22 - 2.0 * sigma * P12) / w**2
+    G2 = P12
+
+    b = np.stack([np.zeros_like(w), G1, P12 * G2 - P22 * G1], axis=1)
+    a = np.stack([np.ones_like(w), -(P11 + P22), P11 * P22 - P12 * P21], axis=1)
+    return b, a
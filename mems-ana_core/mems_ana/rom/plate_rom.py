@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
 import numpy as np
 
-from mems_ana.geometry.plate import RectPlate
-from mems_ana.materials.stack import Stack
+from mems_ana.geometry.electrode import center_overlaps
+from mems_ana.geometry.plate import RectPlate, RectPlateBatch
+from mems_ana.materials.stack import Stack, StackBatch
 from mems_ana.physics.plate_theory import omega_mn_simply_supported, clamp_correction_factor
-from mems_ana.electrical.capacitance import capacitance_parallel_plate
-from mems_ana.electrical.terminal import terminal_current_rms
+from mems_ana.electrical.capacitance import EPS0, admittance_dielectric
+from mems_ana.rom.modal_system import ModalSystem, sdof_frf
+
+if TYPE_CHECKING:
+    from mems_ana.physics.damping import DampingModel
+    from mems_ana.physics.piezo_coupling import PiezoCoupling
 
 
 @dataclass(frozen=True)
@@ -16,6 +23,134 @@ class Mode:
     n: int
 
 
+@dataclass(frozen=True, eq=False)
+class ModeSet:
+    """
+    Array-backed set of simply-supported (m, n) modes.
+
+    m, n are read-only int32 arrays of shape (K,). Iterating or indexing
+    yields Mode objects, so a ModeSet can be used wherever list[Mode] was.
+    """
+    m: np.ndarray
+    n: np.ndarray
+
+    def __post_init__(self) -> None:
+        m, n = np.broadcast_arrays(np.atleast_1d(np.asarray(self.m)), np.atleast_1d(np.asarray(self.n)))
+        m = np.array(m, dtype=np.int32)
+        n = np.array(n, dtype=np.int32)
+        if m.ndim != 1:
+            raise ValueError("ModeSet expects 1-D index arrays.")
+        if m.size and (m.min() < 1 or n.min() < 1):
+            raise ValueError("Mode indices m, n must be >= 1.")
+        m.flags.writeable = False
+        n.flags.writeable = False
+        object.__setattr__(self, "m", m)
+        object.__setattr__(self, "n", n)
+
+    # ---------- construction ----------
+    @classmethod
+    def from_modes(cls, modes: "list[Mode] | ModeSet") -> "ModeSet":
+        if isinstance(modes, ModeSet):
+            return modes
+        return cls(m=[md.m for md in modes], n=[md.n for md in modes])
+
+    @classmethod
+    def below(cls, f_max_hz: float, plate: RectPlate, stack: Stack, center_only: bool = False) -> "ModeSet":
+        """
+        Every (m, n) whose clamp-corrected frequency is below f_max_hz,
+        sorted by frequency (ties by m, then n). With center_only, only
+        odd-odd modes (non-zero center participation) are returned.
+        """
+        q_max = f_max_hz / _freq_coefficient_hz(stack)
+        return cls._enumerate(q_max, plate, center_only)
+
+    @classmethod
+    def lowest(cls, count: int, plate: RectPlate, stack: Stack | None = None, center_only: bool = False) -> "ModeSet":
+        """The `count` lowest modes, sorted by frequency (stack only scales frequencies)."""
+        if count <= 0:
+            return cls(m=np.empty(0, dtype=np.int32), n=np.empty(0, dtype=np.int32))
+
+        # (K-th mode along x) bounds the K-th lowest mode from above; the bound
+        # is inclusive (that mode itself may be the K-th), with a margin for rounding
+        j = 2 * count - 1 if center_only else count
+        q_bound = min((j / plate.a) ** 2 + (1.0 / plate.b) ** 2, (1.0 / plate.a) ** 2 + (j / plate.b) ** 2)
+        return cls._enumerate(q_bound * (1.0 + 1e-9), plate, center_only)[:count]
+
+    @classmethod
+    def _enumerate(cls, q_max: float, plate: RectPlate, center_only: bool) -> "ModeSet":
+        # f_mn ∝ q_mn = (m/a)^2 + (n/b)^2
+        a, b = plate.a, plate.b
+        step = 2 if center_only else 1
+
+        m_top = int(np.floor(a * np.sqrt(max(q_max - (1.0 / b) ** 2, 0.0))))
+        ms = np.arange(1, m_top + 1, step, dtype=np.int64)
+        n_top = np.floor(b * np.sqrt(np.maximum(q_max - (ms / a) ** 2, 0.0))).astype(np.int64)
+        counts = (n_top + step - 1) // step  # number of n in 1, 1+step, ... <= n_top
+
+        m = np.repeat(ms, counts)
+        first = np.repeat(np.cumsum(counts) - counts, counts)
+        n = 1 + step * (np.arange(m.size) - first)
+
+        q = (m / a) ** 2 + (n / b) ** 2
+        keep = q < q_max
+        m, n, q = m[keep], n[keep], q[keep]
+
+        order = np.lexsort((n, m, q))
+        return cls(m=m[order], n=n[order])
+
+    # ---------- list-like access ----------
+    def __len__(self) -> int:
+        return self.m.shape[0]
+
+    def __iter__(self):
+        return (Mode(int(m), int(n)) for m, n in zip(self.m, self.n))
+
+    def __getitem__(self, i):
+        if isinstance(i, (int, np.integer)):
+            return Mode(int(self.m[i]), int(self.n[i]))
+        return ModeSet(m=self.m[i], n=self.n[i])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ModeSet):
+            return NotImplemented
+        return np.array_equal(self.m, other.m) and np.array_equal(self.n, other.n)
+
+    def __hash__(self) -> int:
+        return hash(self.key())
+
+    def key(self) -> bytes:
+        """Compact hashable identity of the mode set."""
+        return self.m.tobytes() + b"|" + self.n.tobytes()
+
+    # ---------- derived ----------
+    def center_participation(self) -> np.ndarray:
+        """
+        Simply-supported mode shapes at the center, shape (K,):
+          phi(x,y) = sin(mπx/a) sin(nπy/b) -> sin(mπ/2) sin(nπ/2)
+        which is ±1 for odd-odd modes and exactly 0 otherwise.
+        """
+        odd = (self.m % 2 == 1) & (self.n % 2 == 1)
+        sign = 1.0 - 2.0 * (((self.m - 1) // 2 + (self.n - 1) // 2) % 2)
+        return np.where(odd, sign, 0.0)
+
+    def center_only(self) -> "ModeSet":
+        """Drop modes with zero center participation."""
+        return self[(self.m % 2 == 1) & (self.n % 2 == 1)]
+
+
+DEFAULT_MODES = ModeSet(m=[1, 2, 1, 2], n=[1, 1, 2, 2])
+
+
+def _freq_coefficient_hz(stack: Stack) -> float:
+    """f_mn = coeff * ((m/a)^2 + (n/b)^2) for the clamp-corrected SS plate."""
+    props = stack.properties()
+    return clamp_correction_factor() * np.pi * np.sqrt(props.D / props.areal_mass) / 2.0
+
+
+# max number of (mode, point) FRF terms held in memory at once
+_FRF_BLOCK = 1 << 22
+
+
 class RectPlateROM:
     """
     Rectangular plate ROM (plate + piezo unimorph)
@@ -32,12 +167,12 @@ class RectPlateROM:
         self,
         plate: RectPlate,
         stack: Stack,
-        modes: list[Mode] | None = None,
+        modes: list[Mode] | ModeSet | None = None,
         K_W: float = 8.0,  # shape factor (calibrate once)
     ) -> None:
         self.plate = plate
         self.stack = stack
-        self.modes = modes if modes else [Mode(1, 1), Mode(2, 1), Mode(1, 2), Mode(2, 2)]
+        self.modes = ModeSet.from_modes(modes) if modes is not None and len(modes) else DEFAULT_MODES
         self.K_W = float(K_W)
 
         if self.K_W <= 0.0:
@@ -45,29 +180,154 @@ class RectPlateROM:
 
     # ---------- eigen ----------
     def modal_freqs_hz(self) -> dict[tuple[int, int], float]:
-        D = self.stack.D_plate()
-        m_areal = self.stack.areal_mass()
-        k = clamp_correction_factor()
-
-        out: dict[tuple[int, int], float] = {}
-        for md in self.modes:
-            w = k * omega_mn_simply_supported(D, m_areal, self.plate.a, self.plate.b, md.m, md.n)
-            out[(md.m, md.n)] = w / (2.0 * np.pi)
-        return out
+        f = self.modal_omegas() / (2.0 * np.pi)
+        return {(md.m, md.n): float(fk) for md, fk in zip(self.modes, f)}
 
     # ---------- electrical ----------
     def capacitance(self) -> float:
-        if self.stack.piezo is None or self.stack.t_pzt <= 0.0:
+        return self.stack.properties().cap_per_area * self.plate.area()
+
+    # ---------- modal data ----------
+    def modal_omegas(self) -> np.ndarray:
+        """Clamp-corrected modal angular frequencies [rad/s], shape (K,)."""
+        props = self.stack.properties()
+        k = clamp_correction_factor()
+
+        m = self.modes.m.astype(float)
+        n = self.modes.n.astype(float)
+        return k * omega_mn_simply_supported(props.D, props.areal_mass, self.plate.a, self.plate.b, m, n)
+
+    def center_participation(self) -> np.ndarray:
+        return self.modes.center_participation()
+
+    def center_scale_per_volt(self) -> float:
+        """
+        Center displacement scale per peak volt [m/V]:
+          K_W * (M0 / D) * a^2 with M0 evaluated at V_peak = 1 V.
+        Returns 0.0 when the stack has no active piezo layer.
+        """
+        props = self.stack.properties()
+        if not props.active or props.D <= 0.0:
             return 0.0
 
-        return capacitance_parallel_plate(
-            eps_r=self.stack.piezo.eps_r,
-            area=self.plate.area(),
-            t_pzt=self.stack.t_pzt,
-            area_ratio=self.stack.elec_area_ratio,
-        )
+        # Piezo-induced bending moment per width -> curvature
+        kappa = props.moment_per_volt / props.D  # [1/(m V)]
+
+        # Curvature -> center displacement scale
+        # IMPORTANT:
+        #   If K_W is a "shape factor" that you calibrate to match FEM/measurement,
+        #   center deflection should scale proportionally with K_W.
+        #   (If you keep division here, increasing K_W would shrink uz, which is counter-intuitive.)
+        return self.K_W * kappa * (self.plate.a ** 2)
+
+    def modal_system(self, zeta: float | np.ndarray = 0.02) -> ModalSystem:
+        """
+        Diagonal modal model of the center response per peak volt:
+          B[k, 0] = center_scale_per_volt * |φ_c,k|  (centered electrode drive)
+          C[0, k] = φ_c,k                            (center uz sensor)
+        so that uz_center = Σ_k φ_c,k scale H_k V_peak as in frf_center_spectrum().
+        """
+        phi_c = self.center_participation()
+        B = self.center_scale_per_volt() * np.abs(phi_c)
+        return ModalSystem(self.modal_omegas(), zeta, B[:, None], phi_c[None, :])
+
+    def coupling(self) -> "PiezoCoupling":
+        """Two-way electromechanical modal coupling (physics.piezo_coupling)."""
+        from mems_ana.physics.piezo_coupling import PiezoCoupling  # physics builds on rom
+
+        return PiezoCoupling.from_rom(self)
 
     # ---------- FRF ----------
+    def modal_coordinates(
+        self,
+        V_rms: float | np.ndarray,
+        f_hz: float | np.ndarray,
+        zeta: float | np.ndarray | DampingModel = 0.02,
+    ) -> np.ndarray:
+        """
+        Complex modal amplitudes q [m] (peak), shape (*S, K) with S the
+        broadcast shape of V_rms, f_hz and zeta (a damping model from
+        physics.damping gives per-mode ζ_k(f)). With a ModalBasis of the
+        same modes, uz(x, y) = basis.field(q); at the center this equals
+        frf_center_spectrum()'s uz.
+
+        Forcing follows the ROM's centered-electrode assumption: every
+        odd-odd mode is driven with unit weight, all other modes not at all.
+        """
+        V_rms_a = np.asarray(V_rms, dtype=float)
+        omega = 2.0 * np.pi * np.asarray(f_hz, dtype=float)
+        model = zeta if hasattr(zeta, "modal_zeta") else None
+        zeta_a = np.asarray(0.0 if model else zeta, dtype=float)
+        shape = np.broadcast_shapes(V_rms_a.shape, omega.shape, zeta_a.shape)
+
+        sys = self.modal_system()
+        H = sys.modal_frf(np.broadcast_to(omega / (2.0 * np.pi), shape), model or np.broadcast_to(zeta_a, shape))
+        return H * sys.B[:, 0] * (V_rms_a * np.sqrt(2.0))[..., None]
+
+    def frf_center_spectrum(
+        self,
+        V_rms: float | np.ndarray,
+        f_hz: float | np.ndarray,
+        zeta: float | np.ndarray | DampingModel = 0.02,
+        coupled: bool = False,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized FRF at the plate center.
+
+        Return:
+          - uz_center [m] complex phasor (peak amplitude)
+          - I [A] complex terminal current phasor (RMS)
+
+        V_rms, f_hz and zeta are broadcast against each other; both outputs
+        have the broadcast shape. Modal quantities are computed once and the
+        response is summed from a single (modes x points) array.
+        zeta may also be a damping model (physics.damping) giving ζ_k(f).
+
+        coupled=True adds the motional branches of PiezoCoupling to the
+        terminal current, reusing the modal FRF evaluated for uz.
+        """
+        V_rms_a = np.asarray(V_rms, dtype=float)
+        omega = 2.0 * np.pi * np.asarray(f_hz, dtype=float)
+        model = zeta if hasattr(zeta, "modal_zeta") else None
+        zeta_a = np.asarray(0.0 if model else zeta, dtype=float)
+        shape = np.broadcast_shapes(V_rms_a.shape, omega.shape, zeta_a.shape)
+
+        # ---- electrical (terminal V–I) ----
+        C = self.capacitance()
+        tan_delta = self.stack.piezo.tan_delta if self.stack.piezo else 0.0
+        Y = admittance_dielectric(C, omega, tan_delta)
+        I = np.broadcast_to(Y * V_rms_a, shape)
+
+        # ---- mechanical (center uz) ----
+        scale = self.center_scale_per_volt()
+        if scale == 0.0:
+            return np.zeros(shape, dtype=complex), np.array(I, dtype=complex)
+
+        # center response only: modes with zero participation are skipped
+        # (a damping model / the coupling is bound to the full mode set, so they keep them)
+        sys = self.modal_system() if model or coupled else self.modal_system().observable()
+        uz_weights = sys.B[:, 0] * sys.C[0]
+        if coupled:
+            coupling = self.coupling()
+            Y_mot = np.empty(int(np.prod(shape)), dtype=complex)
+
+        # (points, K) blocks over the flattened points keep memory bounded for large K
+        f = np.broadcast_to(omega / (2.0 * np.pi), shape).reshape(-1)
+        ze = np.broadcast_to(zeta_a, shape).reshape(-1)
+        uz = np.empty(f.size, dtype=complex)
+        step = max(1, _FRF_BLOCK // max(1, sys.n_modes))
+        for s in range(0, f.size, step):
+            H = sys.modal_frf(f[s:s + step], model or ze[s:s + step])
+            uz[s:s + step] = H @ uz_weights
+            if coupled:
+                Y_mot[s:s + step] = coupling.motional_admittance(2.0 * np.pi * f[s:s + step], H)
+
+        if coupled:
+            I = I + Y_mot.reshape(shape) * V_rms_a
+
+        V_peak = V_rms_a * np.sqrt(2.0)
+        return uz.reshape(shape) * V_peak, np.array(I, dtype=complex)
+
     def frf_center_uz_and_I(self, V_rms: float, f_hz: float, zeta: float = 0.02) -> tuple[float, float]:
         """
         Return:
@@ -78,54 +338,175 @@ class RectPlateROM:
           - V_rms [V]
           - f_hz  [Hz]
           - zeta  [-] modal damping ratio (uniform)
+
+        Scalar convenience wrapper around frf_center_spectrum().
         """
-        omega = 2.0 * np.pi * f_hz
+        uz, I = self.frf_center_spectrum(V_rms, f_hz, zeta)
+        return float(abs(uz)), float(abs(I))
 
-        # ---- electrical (terminal V–I) ----
-        C = self.capacitance()
-        tan_delta = self.stack.piezo.tan_delta if self.stack.piezo else 0.0
-        I_rms = terminal_current_rms(V_rms, omega, C, tan_delta)
 
-        # ---- mechanical (center uz) ----
-        if self.stack.piezo is None or self.stack.t_pzt <= 0.0:
-            return 0.0, float(I_rms)
+class RectPlateROMBatch:
+    """
+    Batched RectPlateROM: N designs sharing one mode set.
+
+    Plate and stack are struct-of-arrays (RectPlateBatch / StackBatch);
+    K_W may be a scalar or an (N,) array. Every method returns arrays with
+    the design axis first and reproduces RectPlateROM design by design.
+    """
+
+    def __init__(
+        self,
+        plate: RectPlateBatch,
+        stack: StackBatch,
+        modes: list[Mode] | ModeSet | None = None,
+        K_W: float | np.ndarray = 8.0,
+    ) -> None:
+        n = np.broadcast_shapes(plate.a.shape, stack.t_base.shape)
+        self.plate = RectPlateBatch(a=np.broadcast_to(plate.a, n), b=np.broadcast_to(plate.b, n))
+        self.stack = stack if stack.t_base.shape == n else StackBatch(
+            **{k: np.broadcast_to(getattr(stack, k), n) for k in stack.__dataclass_fields__}
+        )
+        self.modes = ModeSet.from_modes(modes) if modes is not None and len(modes) else DEFAULT_MODES
+        self.K_W = np.ascontiguousarray(np.broadcast_to(np.asarray(K_W, dtype=float), n))
+
+        if np.any(self.K_W <= 0.0):
+            raise ValueError("K_W must be positive.")
+
+    def __len__(self) -> int:
+        return self.K_W.shape[0]
 
-        V_peak = V_rms * np.sqrt(2.0)
+    def __getitem__(self, i: int) -> RectPlateROM:
+        return RectPlateROM(self.plate[i], self.stack[i], modes=self.modes, K_W=float(self.K_W[i]))
 
+    # ---------- modal data ----------
+    def modal_omegas(self) -> np.ndarray:
+        """Clamp-corrected modal angular frequencies [rad/s], shape (N, K)."""
+        D = self.stack.D_plate()[:, None]
+        m_areal = self.stack.areal_mass()[:, None]
+        k = clamp_correction_factor()
+
+        m = self.modes.m.astype(float)
+        n = self.modes.n.astype(float)
+        a = self.plate.a[:, None]
+        b = self.plate.b[:, None]
+        return k * omega_mn_simply_supported(D, m_areal, a, b, m, n)
+
+    def modal_freqs_hz(self) -> np.ndarray:
+        """Modal frequencies [Hz], shape (N, K), columns in self.modes order."""
+        return self.modal_omegas() / (2.0 * np.pi)
+
+    def center_participation(self) -> np.ndarray:
+        return self.modes.center_participation()
+
+    def center_scale_per_volt(self) -> np.ndarray:
+        """Center displacement scale per peak volt [m/V], shape (N,)."""
         D = self.stack.D_plate()
-        if D <= 0.0:
-            return 0.0, float(I_rms)
+        ok = self.stack._active() & (D > 0.0)
 
-        # Piezo-induced bending moment per width -> curvature
-        M0 = self.stack.piezo_bending_moment_per_width(V_peak)  # [N]
-        kappa = M0 / D  # [1/m]
+        M0 = self.stack.piezo_bending_moment_per_width(1.0)
+        kappa = M0 / np.where(ok, D, 1.0)
+        return np.where(ok, self.K_W * kappa * (self.plate.a ** 2), 0.0)
 
-        # Curvature -> center displacement scale
-        # IMPORTANT:
-        #   If K_W is a "shape factor" that you calibrate to match FEM/measurement,
-        #   center deflection should scale proportionally with K_W.
-        #   (If you keep division here, increasing K_W would shrink uz, which is counter-intuitive.)
-        w_scale = self.K_W * kappa * (self.plate.a ** 2)  # [m] scale
+    # ---------- electrical ----------
+    def capacitance(self) -> np.ndarray:
+        active = self.stack._active()
+        t = np.where(active, self.stack.t_pzt, 1.0)
+        cap_per_area = EPS0 * self.stack.eps_r * self.stack.elec_area_ratio / t
+        return np.where(active, cap_per_area, 0.0) * self.plate.area()
+
+    # ---------- FRF ----------
+    def modal_coordinates(
+        self,
+        V_rms: float | np.ndarray,
+        f_hz: float | np.ndarray,
+        zeta: float | np.ndarray = 0.02,
+    ) -> np.ndarray:
+        """
+        Complex modal amplitudes q [m] (peak) of every design, shape
+        (N, *S, K) with S the broadcast shape of V_rms, f_hz and zeta;
+        design by design equal to RectPlateROM.modal_coordinates.
+        """
+        V_rms_a = np.asarray(V_rms, dtype=float)
+        omega = 2.0 * np.pi * np.asarray(f_hz, dtype=float)
+        zeta_a = np.asarray(zeta, dtype=float)
+        shape = np.broadcast_shapes(V_rms_a.shape, omega.shape, zeta_a.shape)
+        per_design = (slice(None),) + (None,) * len(shape) + (slice(None),)
+
+        B = self.center_scale_per_volt()[:, None] * np.abs(self.center_participation())  # (N, K)
+        H = sdof_frf(self.modal_omegas()[per_design], omega[..., None], zeta_a[..., None])
+        return H * B[per_design] * (V_rms_a * np.sqrt(2.0))[..., None]
+
+    def physical_modal_coordinates(
+        self,
+        V_rms: float | np.ndarray,
+        f_hz: float | np.ndarray,
+        zeta: float | np.ndarray = 0.02,
+    ) -> np.ndarray:
+        """
+        Modal amplitudes q [m] (peak) of the physical plate, shape (N, *S, K)
+        as modal_coordinates, for curvatures and stresses. The piezo moment
+        under the centered electrode (elec_area_ratio) drives each mode
+        through its overlap O_k (geometry.electrode, as PiezoCoupling):
+
+          q_k = M_V O_k V_peak / K_k * ω_k^2 H_k(ω),  K_k = D (ab/4) (kx^2 + ky^2)^2
+
+        The static limit is the moment-consistent simply-supported plate
+        (StaticPlateSolver with edges="SSSS"); resonances sit at
+        modal_omegas(). K_W does not enter: it only calibrates the center
+        displacement of modal_coordinates.
+        """
+        V_rms_a = np.asarray(V_rms, dtype=float)
+        omega = 2.0 * np.pi * np.asarray(f_hz, dtype=float)
+        zeta_a = np.asarray(zeta, dtype=float)
+        shape = np.broadcast_shapes(V_rms_a.shape, omega.shape, zeta_a.shape)
+        per_design = (slice(None),) + (None,) * len(shape) + (slice(None),)
 
-        uz = 0.0 + 0.0j
-        m_areal = self.stack.areal_mass()
-        k_clamp = clamp_correction_factor()
+        ratio = self.stack.elec_area_ratio
+        M_full = self.stack.piezo_bending_moment_per_width(1.0) / np.where(ratio > 0.0, ratio, 1.0)
+        O = center_overlaps(self.modes.m, self.modes.n, self.plate, ratio).T  # (N, K)
+        a, b = self.plate.a[:, None], self.plate.b[:, None]
+        k2 = (np.pi * self.modes.m / a) ** 2 + (np.pi * self.modes.n / b) ** 2
+        K = self.stack.D_plate()[:, None] * (a * b / 4.0) * k2**2
 
-        # Modal superposition at center (x=a/2, y=b/2)
-        for md in self.modes:
-            w_mn = k_clamp * omega_mn_simply_supported(
-                D, m_areal, self.plate.a, self.plate.b, md.m, md.n
-            )
+        w_mn = self.modal_omegas()
+        H = sdof_frf(w_mn[per_design], omega[..., None], zeta_a[..., None]) * (w_mn**2)[per_design]
+        return H * (M_full[:, None] * O / K)[per_design] * (V_rms_a * np.sqrt(2.0))[..., None]
 
-            # simply-supported mode shape at center:
-            # phi(x,y) = sin(mπx/a) sin(nπy/b), at center -> sin(mπ/2) sin(nπ/2)
-            phi_c = np.sin(md.m * np.pi * 0.5) * np.sin(md.n * np.pi * 0.5)
-            if abs(phi_c) < 1e-12:
-                continue
+    def frf_center_spectrum(
+        self,
+        V_rms: float | np.ndarray,
+        f_hz: float | np.ndarray,
+        zeta: float | np.ndarray = 0.02,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Center FRF for all designs at once.
+
+        V_rms, f_hz and zeta are shared by all designs and broadcast against
+        each other (shape S); outputs are complex arrays of shape (N, *S).
+        """
+        V_rms_a = np.asarray(V_rms, dtype=float)
+        omega = 2.0 * np.pi * np.asarray(f_hz, dtype=float)
+        zeta_a = np.asarray(zeta, dtype=float)
+        shape = np.broadcast_shapes(V_rms_a.shape, omega.shape, zeta_a.shape)
+        N = len(self)
+        per_design = (slice(None),) + (None,) * len(shape)
+
+        # ---- electrical (terminal V–I) ----
+        C = self.capacitance()[per_design]
+        tan_delta = np.where(self.stack.has_piezo, self.stack.tan_delta, 0.0)[per_design]
+        Y = admittance_dielectric(C, omega, tan_delta)
+        I = np.array(np.broadcast_to(Y * V_rms_a, (N,) + shape), dtype=complex)
+
+        # ---- mechanical (center uz) ----
+        phi_c = self.center_participation()
+        active = phi_c != 0.0
+        w_mn = self.modal_omegas()[:, active]                           # (N, K)
+        gain = self.center_scale_per_volt()[:, None] * phi_c[active]    # (N, K)
 
-            # SDOF FRF (unit-normalized) with damping
-            H = 1.0 / ((w_mn**2 - omega**2) + 1j * (2.0 * zeta * w_mn * omega))
+        expand = (slice(None), slice(None)) + (None,) * len(shape)
+        H = sdof_frf(w_mn[expand], omega, zeta_a)                        # (N, K, *S)
 
-            uz += (w_scale * phi_c) * H
+        V_peak = V_rms_a * np.sqrt(2.0)
+        uz = np.einsum("nk,nk...->n...", gain, H) * V_peak
+        return np.array(np.broadcast_to(uz, (N,) + shape), dtype=complex), I
 
-        return float(abs(uz)), float(I_rms)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import scipy.sparse.linalg as sla
+
+from mems_ana.geometry.plate import RectPlate
+from mems_ana.materials.stack import Stack
+from mems_ana.physics.plate_theory import omega_mn_simply_supported
+from mems_ana.solver.plate_fd import PlateGrid, assemble_plate
+
+
+@dataclass(frozen=True)
+class PlateModes:
+    """Lowest modes of the discretized plate, sorted by frequency."""
+    grid: PlateGrid
+    freqs_hz: np.ndarray  # (K,)
+    shapes: np.ndarray    # (K, nx, ny), max |phi| = 1, largest entry positive
+
+    def ratio_to_simply_supported(self, stack: Stack, m: int = 1, n: int = 1, k: int = 0) -> float:
+        """
+        f_k / f_mn(simply supported) — e.g. the clamp correction factor that
+        RectPlateROM applies to the SS formula, calibrated for these edges.
+        """
+        props = stack.properties()
+        plate = self.grid.plate
+        w_ss = omega_mn_simply_supported(props.D, props.areal_mass, plate.a, plate.b, m, n)
+        return float(2.0 * np.pi * self.freqs_hz[k] / w_ss)
+
+
+class PlateEigenSolver:
+    """
+    Kirchhoff plate eigen solver for RectPlate + Stack on an (nx, ny) grid.
+
+    K and M are assembled once (sparse, energy-consistent finite differences,
+    see solver.plate_fd). Eigenpairs come from shift-invert Lanczos
+    (scipy eigsh); the LU factorization of K - σM is cached per shift and
+    reused for any later shift within `shift_rtol` of a cached one.
+
+    Edges (x=0, x=a, y=0, y=b): "C" clamped, "S" simply supported, "F" free.
+    """
+
+    def __init__(
+        self,
+        plate: RectPlate,
+        stack: Stack,
+        nx: int = 101,
+        ny: int = 101,
+        edges: str = "CCCC",
+        shift_rtol: float = 0.25,
+    ) -> None:
+        self.grid = PlateGrid(plate, nx, ny, edges)
+        self.stack = stack
+        self.shift_rtol = float(shift_rtol)
+
+        props = stack.properties()
+        self.ops = assemble_plate(self.grid, props.D, props.areal_mass, stack.base.nu)
+
+        # default shift: slightly below zero so rigid-body modes of free plates
+        # are still captured without factorizing a singular matrix
+        w_ref = omega_mn_simply_supported(props.D, props.areal_mass, plate.a, plate.b, 1, 1)
+        self._default_sigma = -1e-3 * w_ref**2
+        self._factors: dict[float, sla.SuperLU] = {}
+
+    # ---------- factorization cache ----------
+    @property
+    def cached_shifts(self) -> tuple[float, ...]:
+        """Shifts σ [(rad/s)^2] whose factorization of K - σM is cached, in creation order."""
+        return tuple(self._factors)
+
+    def _factor(self, sigma: float) -> tuple[float, sla.SuperLU]:
+        for s, lu in self._factors.items():
+            if abs(sigma - s) <= self.shift_rtol * abs(s):
+                return s, lu
+        A = (self.ops.K - sigma * self.ops.M).tocsc()
+        lu = sla.splu(A, permc_spec="MMD_AT_PLUS_A")
+        self._factors[sigma] = lu
+        return sigma, lu
+
+    # ---------- solve ----------
+    def solve(self, k: int = 6, f_target_hz: float | None = None) -> PlateModes:
+        """
+        k modes nearest to f_target_hz (default: the k lowest, including any
+        rigid-body modes of free plates at ~0 Hz).
+        """
+        sigma = self._default_sigma if f_target_hz is None else (2.0 * np.pi * f_target_hz) ** 2
+        sigma, lu = self._factor(sigma)
+
+        n = self.ops.K.shape[0]
+        OPinv = sla.LinearOperator((n, n), matvec=lu.solve, dtype=float)
+        vals, vecs = sla.eigsh(self.ops.K, k=k, M=self.ops.M, sigma=sigma, which="LM", OPinv=OPinv)
+
+        order = np.argsort(vals)
+        omega = np.sqrt(np.maximum(vals[order], 0.0))
+        shapes = self.grid.expand(vecs[:, order])
+
+        # normalize: max |phi| = 1 and the largest-magnitude entry positive
+        flat = shapes.reshape(k, -1)
+        idx = np.argmax(np.abs(flat), axis=1)
+        shapes /= flat[np.arange(k), idx][:, None, None]
+
+        return PlateModes(grid=self.grid, freqs_hz=omega / (2.0 * np.pi), shapes=shapes)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from mems_ana.rom.plate_rom import RectPlateROM
+
+# seed offsets around every modal frequency, in units of the half-power half-width ζ f_n
+_SEED_OFFSETS = np.array([-8.0, -3.0, -1.5, -0.75, 0.0, 0.75, 1.5, 3.0, 8.0])
+
+
+@dataclass(frozen=True)
+class AdaptiveFRF:
+    """
+    Non-uniform FRF sweep. f_hz is sorted; uz / I are the complex phasors of
+    RectPlateROM.frf_center_spectrum at those frequencies.
+    Peaks are the parabolic-vertex estimates of every resolved |uz| maximum.
+    """
+    f_hz: np.ndarray
+    uz: np.ndarray
+    I: np.ndarray
+    peak_f_hz: np.ndarray
+    peak_uz_abs: np.ndarray
+    n_evals: int
+    converged: bool
+
+
+def adaptive_frf(
+    rom: RectPlateROM,
+    f_min_hz: float,
+    f_max_hz: float,
+    V_rms: float = 1.0,
+    zeta: float = 0.02,
+    *,
+    amp_rtol: float = 1e-4,
+    freq_rtol: float = 1e-5,
+    max_step_db: float = 1.0,
+    n_base: int = 32,
+    max_iter: int = 40,
+) -> AdaptiveFRF:
+    """
+    FRF sweep on a grid seeded from the modal frequencies and refined
+    until every interior |uz| peak meets the tolerances:
+
+      - peak frequency: vertex moves less than freq_rtol * f_peak
+      - peak amplitude: predicted vertex value within amp_rtol of the sample
+
+    The vertex comes from a 3-point parabola in (f^2, 1/|uz|^2), which is
+    exact for an isolated mode. Between samples |uz| changes by at most
+    max_step_db so the curve shape is resolved too.
+    """
+    if not 0.0 < f_min_hz < f_max_hz:
+        raise ValueError("Require 0 < f_min_hz < f_max_hz.")
+
+    f_n = rom.modal_omegas() / (2.0 * np.pi)
+    seeds = [np.geomspace(f_min_hz, f_max_hz, n_base)]
+    seeds.append((f_n[:, None] * (1.0 + zeta * _SEED_OFFSETS[None, :])).ravel())
+    f = _merge(np.empty(0), np.concatenate(seeds), f_min_hz, f_max_hz)
+
+    uz, I = rom.frf_center_spectrum(V_rms, f, zeta)
+    n_evals = f.size
+    converged = False
+    peak_f = peak_amp = np.empty(0)
+
+    for _ in range(max_iter):
+        amp = np.abs(uz)
+        new: list[float] = []
+
+        peak_f, peak_amp, done = _peak_vertices(f, amp, amp_rtol, freq_rtol)
+        i_max = _interior_maxima(amp)
+        for i in np.flatnonzero(~done):
+            i_pk = i_max[i]
+            new.append(peak_f[i])
+            new.append(0.5 * (f[i_pk - 1] + f[i_pk]))
+            new.append(0.5 * (f[i_pk] + f[i_pk + 1]))
+
+        step_db = 20.0 * np.abs(np.diff(np.log10(np.maximum(amp, np.finfo(float).tiny))))
+        coarse = np.flatnonzero(step_db > max_step_db)
+        new.extend(np.sqrt(f[coarse] * f[coarse + 1]))
+
+        f_new = _merge(f, np.asarray(new, dtype=float), f_min_hz, f_max_hz)
+        if f_new.size == 0:
+            converged = bool(done.all())
+            break
+
+        uz_new, I_new = rom.frf_center_spectrum(V_rms, f_new, zeta)
+        n_evals += f_new.size
+        order = np.argsort(np.concatenate([f, f_new]), kind="stable")
+        f = np.concatenate([f, f_new])[order]
+        uz = np.concatenate([uz, uz_new])[order]
+        I = np.concatenate([I, I_new])[order]
+    else:
+        # max_iter exhausted: the last refinement is merged, so re-estimate the peaks on the final grid
+        peak_f, peak_amp, _ = _peak_vertices(f, np.abs(uz), amp_rtol, freq_rtol)
+
+    return AdaptiveFRF(
+        f_hz=f,
+        uz=uz,
+        I=I,
+        peak_f_hz=peak_f,
+        peak_uz_abs=peak_amp,
+        n_evals=n_evals,
+        converged=converged,
+    )
+
+
+def _interior_maxima(amp: np.ndarray) -> np.ndarray:
+    """Indices of strict-left / non-strict-right interior local maxima."""
+    i = np.arange(1, amp.size - 1)
+    return i[(amp[i] > amp[i - 1]) & (amp[i] >= amp[i + 1])]
+
+
+def _peak_vertices(
+    f: np.ndarray, amp: np.ndarray, amp_rtol: float, freq_rtol: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vertex (f, |uz|) of every interior maximum and whether it has converged."""
+    i = _interior_maxima(amp)
+    x = f[np.stack([i - 1, i, i + 1])] ** 2     # (3, P)
+    y = amp[np.stack([i - 1, i, i + 1])] ** -2.0
+
+    # Newton form: y = y0 + d01 (x - x0) + c2 (x - x0)(x - x1)
+    d01 = (y[1] - y[0]) / (x[1] - x[0])
+    d12 = (y[2] - y[1]) / (x[2] - x[1])
+    c2 = (d12 - d01) / (x[2] - x[0])
+    ok = c2 > 0.0
+    x_v = np.where(ok, 0.5 * (x[0] + x[1]) - d01 / (2.0 * np.where(ok, c2, 1.0)), x[1])
+    x_v = np.clip(x_v, x[0], x[2])
+    y_v = y[0] + d01 * (x_v - x[0]) + c2 * (x_v - x[0]) * (x_v - x[1])
+    y_v = np.where(ok & (y_v > 0.0), y_v, y[1])
+
+    f_v = np.sqrt(x_v)
+    amp_v = y_v ** -0.5
+    done = (np.abs(f_v - f[i]) <= freq_rtol * f[i]) & (np.abs(amp_v - amp[i]) <= amp_rtol * amp[i])
+    return f_v, amp_v, done
+
+
+def _merge(f: np.ndarray, f_new: np.ndarray, f_min: float, f_max: float) -> np.ndarray:
+    """Sorted unique candidates in range that are not (numerically) already in f."""
+    f_new = np.unique(f_new[(f_new >= f_min) & (f_new <= f_max)])
+    if f.size:
+        j = np.clip(np.searchsorted(f, f_new), 1, f.size - 1)
+        near = np.minimum(np.abs(f[j - 1] - f_new), np.abs(f[j] - f_new))
+        f_new = f_new[near > 1e-12 * f_new]
+    return f_new
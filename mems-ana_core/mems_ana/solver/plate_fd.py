@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import scipy.sparse as sp
+
+from mems_ana.geometry.plate import RectPlate
+
+# edge order in `edges`: x=0, x=a, y=0, y=b
+EDGE_TYPES = ("C", "S", "F")  # clamped / simply supported / free
+
+
+@dataclass(frozen=True)
+class PlateGrid:
+    """
+    Node grid on a RectPlate for the finite-difference Kirchhoff plate.
+
+    Nodal fields are (nx, ny) arrays (indexing="ij"); the flat node index is
+    i * ny + j. `edges` gives the boundary type of x=0, x=a, y=0, y=b, each
+    one of "C" (clamped), "S" (simply supported) or "F" (free).
+    """
+    plate: RectPlate
+    nx: int
+    ny: int
+    edges: str = "CCCC"
+
+    def __post_init__(self) -> None:
+        edges = self.edges.upper()
+        if len(edges) != 4 or any(e not in EDGE_TYPES for e in edges):
+            raise ValueError("edges must be 4 characters from 'C', 'S', 'F' (x=0, x=a, y=0, y=b).")
+        if self.nx < 4 or self.ny < 4:
+            raise ValueError("nx and ny must be at least 4.")
+        object.__setattr__(self, "edges", edges)
+
+    @property
+    def x(self) -> np.ndarray:
+        return np.linspace(0.0, self.plate.a, self.nx)
+
+    @property
+    def y(self) -> np.ndarray:
+        return np.linspace(0.0, self.plate.b, self.ny)
+
+    @property
+    def hx(self) -> float:
+        return self.plate.a / (self.nx - 1)
+
+    @property
+    def hy(self) -> float:
+        return self.plate.b / (self.ny - 1)
+
+    def node_weights(self) -> np.ndarray:
+        """Trapezoidal area weight of every node, shape (nx, ny)."""
+        return np.outer(_trapezoid(self.nx, self.hx), _trapezoid(self.ny, self.hy))
+
+    def free_dofs(self) -> np.ndarray:
+        """Flat indices of unconstrained nodes (w = 0 on C and S edges)."""
+        fixed = np.zeros((self.nx, self.ny), dtype=bool)
+        x0, x1, y0, y1 = self.edges
+        fixed[0, :] |= x0 != "F"
+        fixed[-1, :] |= x1 != "F"
+        fixed[:, 0] |= y0 != "F"
+        fixed[:, -1] |= y1 != "F"
+        return np.flatnonzero(~fixed.ravel())
+
+    def expand(self, w_free: np.ndarray) -> np.ndarray:
+        """Scatter free-DOF vectors (n_free, ...) back to nodal fields (..., nx, ny)."""
+        w_free = np.asarray(w_free)
+        out = np.zeros((self.nx * self.ny,) + w_free.shape[1:], dtype=w_free.dtype)
+        out[self.free_dofs()] = w_free
+        return np.moveaxis(out, 0, -1).reshape(w_free.shape[1:] + (self.nx, self.ny))
+
+
+@dataclass(frozen=True)
+class PlateOperators:
+    """Assembled sparse operators on the free DOFs of a PlateGrid."""
+    grid: PlateGrid
+    K: sp.csc_matrix        # bending stiffness [N/m]
+    M: sp.csc_matrix        # lumped mass [kg]
+    curv: sp.csr_matrix     # free DOFs -> (w_xx + w_yy) at every node, shape (nx*ny, n_free)
+    dofs: np.ndarray        # flat node index of every free DOF
+
+
+def assemble_plate(grid: PlateGrid, D: float, m_areal: float, nu: float) -> PlateOperators:
+    """
+    Energy-consistent finite-difference discretization of
+
+      U = D/2 ∫ (w_xx^2 + w_yy^2 + 2ν w_xx w_yy + 2(1-ν) w_xy^2) dA,  T = m/2 ∫ w_t^2 dA
+
+    Curvatures are central differences at the nodes (ghost nodes mirror the
+    clamped / simply-supported edges), the twist is taken at cell centers,
+    and the integral uses trapezoidal weights. Free-edge conditions are the
+    natural boundary conditions of the discrete energy.
+    """
+    x0, x1, y0, y1 = grid.edges
+    Lx = _second_difference(grid.nx, grid.hx, x0, x1)
+    Ly = _second_difference(grid.ny, grid.hy, y0, y1)
+    Gx = _first_difference(grid.nx, grid.hx)
+    Gy = _first_difference(grid.ny, grid.hy)
+
+    Ix = sp.identity(grid.nx, format="csr")
+    Iy = sp.identity(grid.ny, format="csr")
+    Wxx = sp.kron(Lx, Iy, format="csr")
+    Wyy = sp.kron(Ix, Ly, format="csr")
+    Wxy = sp.kron(Gx, Gy, format="csr")
+
+    dofs = grid.free_dofs()
+    Wxx = Wxx[:, dofs]
+    Wyy = Wyy[:, dofs]
+    Wxy = Wxy[:, dofs]
+
+    w_node = sp.diags(grid.node_weights().ravel())
+    w_cell = grid.hx * grid.hy
+
+    K = D * (
+        Wxx.T @ w_node @ Wxx
+        + Wyy.T @ w_node @ Wyy
+        + nu * (Wxx.T @ w_node @ Wyy + Wyy.T @ w_node @ Wxx)
+        + 2.0 * (1.0 - nu) * w_cell * (Wxy.T @ Wxy)
+    )
+    M = sp.diags(m_areal * grid.node_weights().ravel()[dofs])
+
+    return PlateOperators(grid=grid, K=K.tocsc(), M=M.tocsc(), curv=(Wxx + Wyy).tocsr(), dofs=dofs)
+
+
+def nodal_curvatures(grid: PlateGrid, w: np.ndarray) -> np.ndarray:
+    """
+    Curvatures (w_xx, w_yy, w_xy) at every node of nodal fields w of shape
+    (..., nx, ny); returns (..., 3, nx, ny). w_xx / w_yy use the same edge
+    stencils as assemble_plate; the twist is a central difference (one-sided
+    at the edges). A whole batch of fields is one sparse product per axis.
+    """
+    w = np.asarray(w, dtype=float)
+    nx, ny = grid.nx, grid.ny
+    if w.shape[-2:] != (nx, ny):
+        raise ValueError(f"Nodal fields must end with shape ({nx}, {ny}), got {w.shape}.")
+    lead = w.shape[:-2]
+    W = w.reshape(-1, nx, ny)
+    n = W.shape[0]
+
+    x0, x1, y0, y1 = grid.edges
+    Lx = _second_difference(nx, grid.hx, x0, x1)
+    Ly = _second_difference(ny, grid.hy, y0, y1)
+
+    out = np.empty((n, 3, nx, ny))
+    out[:, 0] = (Lx @ W.transpose(1, 0, 2).reshape(nx, -1)).reshape(nx, n, ny).transpose(1, 0, 2)
+    out[:, 1] = (Ly @ W.transpose(2, 0, 1).reshape(ny, -1)).reshape(ny, n, nx).transpose(1, 2, 0)
+    out[:, 2] = np.gradient(np.gradient(W, grid.hx, axis=1, edge_order=2), grid.hy, axis=2, edge_order=2)
+    return out.reshape(lead + (3, nx, ny))
+
+
+# ---------- 1-D stencils ----------
+def _trapezoid(n: int, h: float) -> np.ndarray:
+    w = np.full(n, h)
+    w[[0, -1]] = 0.5 * h
+    return w
+
+
+def _first_difference(n: int, h: float) -> sp.csr_matrix:
+    """(w[i+1] - w[i]) / h at the n-1 cell centers."""
+    return sp.diags([-np.ones(n - 1), np.ones(n - 1)], [0, 1], shape=(n - 1, n), format="csr") / h
+
+
+def _second_difference(n: int, h: float, left: str, right: str) -> sp.csr_matrix:
+    """
+    w'' at every node. Boundary rows:
+      C: ghost w[-1] = w[1]           -> 2 (w[1] - w[0]) / h^2
+      S: ghost w[-1] = 2 w[0] - w[1]  -> 0
+      F: one-sided, copies the first interior row
+    """
+    L = sp.lil_matrix((n, n))
+    for i in range(1, n - 1):
+        L[i, i - 1] = 1.0
+        L[i, i] = -2.0
+        L[i, i + 1] = 1.0
+
+    for row, inner, edge in ((0, 1, left), (n - 1, n - 2, right)):
+        if edge == "C":
+            L[row, row] = -2.0
+            L[row, inner] = 2.0
+        elif edge == "F":
+            L[row, :] = L[inner, :]
+    return L.tocsr() / h**2
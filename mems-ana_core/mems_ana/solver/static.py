@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import numpy as np
+import scipy.sparse.linalg as sla
+
+from mems_ana.geometry.electrode import ElectrodePattern
+from mems_ana.geometry.plate import RectPlate
+from mems_ana.materials.stack import Stack
+from mems_ana.solver.plate_fd import PlateGrid, assemble_plate
+
+
+class StaticPlateSolver:
+    """
+    Static piezo-actuated deflection w(x, y) on an (nx, ny) grid.
+
+    The stiffness operator (solver.plate_fd) is assembled and LU-factorized
+    once per geometry. Each electrode is a load case: a mask χ(x, y) over
+    which the full-coverage piezo moment per volt acts, giving the load
+      f = -M_V ∫ χ (w_xx + w_yy) dA
+    All electrode cases are solved together as one multi-RHS
+    back-substitution (unit voltage); any batch of voltage levels /
+    per-electrode drive patterns is then a matrix product, since the
+    response is linear in V.
+
+    Edges (x=0, x=a, y=0, y=b): "C" clamped, "S" simply supported, "F" free.
+    Note: with full coverage on an all-clamped plate the net moment load
+    vanishes (∮ ∂w/∂n = 0), so useful cases use partial electrodes.
+    """
+
+    def __init__(
+        self,
+        plate: RectPlate,
+        stack: Stack,
+        nx: int = 101,
+        ny: int = 101,
+        edges: str = "CCCC",
+    ) -> None:
+        self.grid = PlateGrid(plate, nx, ny, edges)
+        self.stack = stack
+
+        props = stack.properties()
+        self.ops = assemble_plate(self.grid, props.D, props.areal_mass, stack.base.nu)
+        self.moment_per_volt = props.moment_per_volt_full  # [N/V]
+
+        try:
+            self._lu = sla.splu(self.ops.K.tocsc(), permc_spec="MMD_AT_PLUS_A")
+        except RuntimeError as e:  # singular: not enough supports (e.g. all edges free)
+            raise ValueError(f"Stiffness matrix is singular for edges={self.grid.edges!r}.") from e
+
+    # ---------- electrodes ----------
+    def default_electrode(self) -> np.ndarray:
+        """Centered rectangle covering stack.elec_area_ratio of the plate, shape (nx, ny)."""
+        r = np.sqrt(self.stack.elec_area_ratio)
+        x = self.grid.x / self.grid.plate.a
+        y = self.grid.y / self.grid.plate.b
+        in_x = np.abs(x - 0.5) <= 0.5 * r + 1e-12
+        in_y = np.abs(y - 0.5) <= 0.5 * r + 1e-12
+        return np.outer(in_x, in_y).astype(float)
+
+    def electrode_loads(self, electrodes: np.ndarray) -> np.ndarray:
+        """Unit-voltage load vectors on the free DOFs, shape (n_free, E)."""
+        chi = np.asarray(electrodes, dtype=float).reshape(-1, self.grid.nx * self.grid.ny)
+        weighted = chi * self.grid.node_weights().ravel()
+        return -self.moment_per_volt * (self.ops.curv.T @ weighted.T)
+
+    # ---------- solve ----------
+    def unit_deflections(self, electrodes: np.ndarray | ElectrodePattern | None = None) -> np.ndarray:
+        """
+        Deflection per volt [m/V] for every electrode, shape (E, nx, ny).
+        `electrodes` is one mask (nx, ny), a stack (E, nx, ny) or an
+        ElectrodePattern; default is default_electrode().
+        """
+        if electrodes is None:
+            electrodes = self.default_electrode()
+        elif isinstance(electrodes, ElectrodePattern):
+            electrodes = electrodes.masks(self.grid.nx, self.grid.ny)
+        F = self.electrode_loads(electrodes)
+        W = self._lu.solve(np.asfortranarray(F))
+        return self.grid.expand(W)
+
+    def solve(self, voltages: np.ndarray | float, electrodes: np.ndarray | ElectrodePattern | None = None) -> np.ndarray:
+        """
+        Static deflection [m] for a batch of drives.
+
+        voltages: (n_V,) levels applied to every electrode, or (n_V, E) one
+        voltage per electrode (polarity patterns, segmented drive).
+        Returns (n_V, nx, ny).
+        """
+        W = self.unit_deflections(electrodes)           # (E, nx, ny)
+        V = np.atleast_1d(np.asarray(voltages, dtype=float))
+        if V.ndim == 1:
+            V = np.repeat(V[:, None], W.shape[0], axis=1)
+        if V.shape[1] != W.shape[0]:
+            raise ValueError(f"voltages must have {W.shape[0]} column(s), one per electrode.")
+        return (V @ W.reshape(W.shape[0], -1)).reshape((V.shape[0],) + W.shape[1:])
@@ -0,0 +1,381 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor, Future
+from dataclasses import dataclass, fields
+import hashlib
+import itertools
+import json
+import os
+from pathlib import Path
+import time
+from typing import Callable, Iterable, Iterator
+
+import numpy as np
+
+from mems_ana.geometry.plate import RectPlateBatch
+from mems_ana.io.cache import ResultCache, input_hash
+from mems_ana.io.export import ColumnWriter, open_store
+from mems_ana.materials.stack import StackBatch
+from mems_ana.physics.stress import FieldAccumulator, modal_field_tiles
+from mems_ana.rom.plate_rom import RectPlateROM, RectPlateROMBatch
+
+PLATE_AXES = ("a", "b")
+STACK_AXES = tuple(f.name for f in fields(StackBatch) if f.name != "has_piezo")
+ROM_AXES = ("K_W",)
+
+
+@dataclass(frozen=True)
+class SweepProgress:
+    """Snapshot passed to the progress callback after every finished chunk."""
+    done_points: int
+    total_points: int
+    chunks_done: int
+    n_chunks: int
+    elapsed_s: float
+    points_per_s: float  # points evaluated in this run / elapsed
+
+
+@dataclass
+class SweepResult:
+    """
+    Flattened sweep output. Point i corresponds to np.unravel_index(i, shape)
+    over the axes in insertion order.
+    """
+    axes: dict[str, np.ndarray]
+    shape: tuple[int, ...]
+    f_hz: np.ndarray
+    f_modes_hz: np.ndarray  # (N, K)
+    uz: np.ndarray          # (N, F) complex, center uz phasor [m]
+    I: np.ndarray           # (N, F) complex, terminal current phasor [A]
+
+    def values(self, name: str) -> np.ndarray:
+        """Axis value of every point, shape (N,)."""
+        return _axis_values(self.axes, self.shape, 0, int(np.prod(self.shape)))[name]
+
+
+def run_sweep(
+    rom: RectPlateROM,
+    axes: dict[str, np.ndarray | list[float]],
+    f_hz: np.ndarray,
+    V_rms: float = 1.0,
+    zeta: float = 0.02,
+    *,
+    chunk_size: int = 4096,
+    workers: int | None = 1,
+    checkpoint_dir: str | Path | None = None,
+    store_dir: str | Path | None = None,
+    cache: ResultCache | None = None,
+    progress: Callable[[SweepProgress], None] | None = None,
+) -> SweepResult:
+    """
+    Evaluate the ROM over the Cartesian product of `axes`.
+
+    Axis names are RectPlate fields (a, b), StackBatch fields (t_pzt, d31,
+    eps_r, elec_area_ratio, ...) or K_W; parameters without an axis are
+    taken from `rom`. The grid is split into fixed chunks of `chunk_size`
+    points that are evaluated as RectPlateROMBatch on a process pool
+    (`workers=None` uses all cores, 1 runs in-process). Chunking does not
+    depend on the worker count, so results are identical for any `workers`.
+
+    With `checkpoint_dir`, every finished chunk is written to disk and a
+    re-run with the same inputs only evaluates the missing chunks.
+
+    With `store_dir`, results are streamed in point order into a columnar
+    store (io.export) instead of being held in memory; the returned
+    SweepResult then holds read-only memory-mapped columns. The directory
+    must be empty or an earlier store, which is overwritten.
+
+    With `cache`, every chunk is looked up by a hash of its design values,
+    frequencies and drive (io.cache) before it is evaluated, so chunks that
+    any earlier sweep already computed are read back memory-mapped.
+    """
+    axes_a = {k: np.atleast_1d(np.asarray(v, dtype=float)) for k, v in axes.items()}
+    unknown = set(axes_a) - set(PLATE_AXES + STACK_AXES + ROM_AXES)
+    if unknown:
+        raise ValueError(f"Unknown sweep axis name(s): {sorted(unknown)}")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive.")
+
+    f = np.atleast_1d(np.asarray(f_hz, dtype=float))
+    shape = tuple(len(v) for v in axes_a.values())
+    total = int(np.prod(shape))
+    bounds = [(s, min(s + chunk_size, total)) for s in range(0, total, chunk_size)]
+    n_modes = len(rom.modes)
+
+    store = None
+    if checkpoint_dir is not None:
+        key = _sweep_key(rom, axes_a, f, V_rms, zeta, chunk_size)
+        store = _ChunkStore(Path(checkpoint_dir), key, len(bounds))
+
+    if store_dir is None:
+        f_modes = np.empty((total, n_modes))
+        uz = np.empty((total, f.size), dtype=complex)
+        I = np.empty((total, f.size), dtype=complex)
+
+        def emit(ci: int, out: tuple[np.ndarray, np.ndarray, np.ndarray]) -> None:
+            s, e = bounds[ci]
+            f_modes[s:e], uz[s:e], I[s:e] = out
+    else:
+        writer = ColumnWriter(store_dir, overwrite=True, meta={
+            "axes": {k: v.tolist() for k, v in axes_a.items()},
+            "shape": list(shape),
+            "f_hz": f.tolist(),
+        })
+        ready: dict[int, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        next_ci = 0
+
+        def emit(ci: int, out: tuple[np.ndarray, np.ndarray, np.ndarray] | None) -> None:
+            # rows are appended strictly in point order; checkpointed chunks are read when reached
+            nonlocal next_ci
+            if out is not None:
+                ready[ci] = out
+            while next_ci < len(bounds):
+                out = ready.pop(next_ci, None)
+                if out is None and store and next_ci not in todo_set:
+                    out = store.load(next_ci)
+                if out is None:
+                    break
+                s, e = bounds[next_ci]
+                writer.append({**_axis_values(axes_a, shape, s, e), "f_modes_hz": out[0], "uz": out[1], "I": out[2]})
+                next_ci += 1
+
+    todo: list[int] = []
+    hits: dict[int, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+    done_points = 0
+    for ci, (s, e) in enumerate(bounds):
+        if store is None or not store.has(ci):
+            hit = cache.get(_chunk_key(rom, axes_a, shape, s, e, f, V_rms, zeta)) if cache else None
+            if hit is None:
+                todo.append(ci)
+                continue
+            hits[ci] = (hit["f_modes_hz"], hit["uz"], hit["I"])
+        elif store_dir is None:
+            emit(ci, store.load(ci))
+        done_points += e - s
+    todo_set = set(todo)
+    for ci, out in hits.items():
+        if store:
+            store.save(ci, out)
+        emit(ci, out)
+
+    t0 = time.perf_counter()
+    evaluated = 0
+    n_finished = 0
+
+    def finish(ci: int, out: tuple[np.ndarray, np.ndarray, np.ndarray]) -> None:
+        nonlocal done_points, evaluated
+        s, e = bounds[ci]
+        if store:
+            store.save(ci, out)
+        if cache:
+            cache.put(_chunk_key(rom, axes_a, shape, s, e, f, V_rms, zeta),
+                      {"f_modes_hz": out[0], "uz": out[1], "I": out[2]})
+        emit(ci, out)
+        done_points += e - s
+        evaluated += e - s
+        if progress:
+            dt = time.perf_counter() - t0
+            progress(SweepProgress(
+                done_points=done_points,
+                total_points=total,
+                chunks_done=len(bounds) - len(todo) + n_finished,
+                n_chunks=len(bounds),
+                elapsed_s=dt,
+                points_per_s=evaluated / dt if dt > 0.0 else float("inf"),
+            ))
+
+    def task(ci: int) -> tuple:
+        s, e = bounds[ci]
+        return (rom, axes_a, shape, s, e, f, V_rms, zeta)
+
+    if workers == 1 or len(todo) <= 1:
+        for ci in todo:
+            n_finished += 1
+            finish(ci, _evaluate_chunk(task(ci)))
+    else:
+        n_workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            max_in_flight = 2 * n_workers
+            pending: dict[int, Future] = {}
+            queue = list(todo)
+            while queue or pending:
+                while queue and len(pending) < max_in_flight:
+                    ci = queue.pop(0)
+                    pending[ci] = pool.submit(_evaluate_chunk, task(ci))
+                # collect in submission order (keeps memory bounded and output deterministic)
+                ci = next(iter(pending))
+                out = pending.pop(ci).result()
+                n_finished += 1
+                finish(ci, out)
+
+    if store_dir is None:
+        return SweepResult(axes=axes_a, shape=shape, f_hz=f, f_modes_hz=f_modes, uz=uz, I=I)
+
+    emit(-1, None)
+    writer.close()
+    cols = open_store(store_dir)
+    return SweepResult(axes=axes_a, shape=shape, f_hz=f, f_modes_hz=cols["f_modes_hz"], uz=cols["uz"], I=cols["I"])
+
+
+def iter_sweep(
+    rom: RectPlateROM,
+    designs: dict[str, np.ndarray | list[float]] | Iterable[dict[str, float]],
+    V_rms: float = 1.0,
+    f_hz: float = 0.0,
+    zeta: float = 0.02,
+    *,
+    sigma_th: float | np.ndarray = 100e6,
+    component: str = "von_mises",
+    nx: int = 121,
+    ny: int = 121,
+    batch_size: int = 1024,
+    tile_values: int = 1 << 19,
+) -> Iterator[dict[str, np.ndarray]]:
+    """
+    Lazy per-design scalar sweep over uz(x, y) and stress fields.
+
+    `designs` is either a dict of axes (Cartesian product, generated lazily
+    in run_sweep's point order) or any iterable of {axis name: value}
+    dicts, e.g. a generator reading a design list. It is consumed
+    batch_size designs at a time; every batch yields one record of (n,)
+    columns, ready for io.export.ColumnWriter.append:
+
+      <axis names>           design values
+      f11_hz                 frequency of the (1, 1) mode
+      uz_peak                max |uz(x, y)| [m] at f_hz (f_hz=0: static)
+      sigma_max, sigma_mean  max / area-averaged |σ| on the top surface [Pa]
+      sigma_C                concentration factor max / mean
+      sigma_area_fraction    area fraction with |σ| > sigma_th ((n, n_th) for an array)
+
+    The fields come from physics.stress.modal_field_tiles and go straight
+    into online accumulators (physics.stress.FieldAccumulator) tile by
+    tile. No (nx, ny) field of any design is ever held, so peak memory is
+    O(batch x tile), independent of the number of designs.
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive.")
+    idx = np.flatnonzero((rom.modes.m == 1) & (rom.modes.n == 1))
+    if idx.size == 0:
+        raise ValueError("iter_sweep needs the (1, 1) mode in rom.modes for f11_hz.")
+
+    if isinstance(designs, dict):
+        names = list(designs)
+        values = [np.atleast_1d(np.asarray(v, dtype=float)) for v in designs.values()]
+        designs = (dict(zip(names, p)) for p in itertools.product(*values))
+    it = iter(designs)
+
+    while True:
+        chunk = list(itertools.islice(it, batch_size))
+        if not chunk:
+            return
+        names = list(chunk[0])
+        unknown = set(names) - set(PLATE_AXES + STACK_AXES + ROM_AXES)
+        if unknown:
+            raise ValueError(f"Unknown sweep axis name(s): {sorted(unknown)}")
+        if any(d.keys() != chunk[0].keys() for d in chunk):
+            raise ValueError("All designs must set the same axis names.")
+        vals = {k: np.array([d[k] for d in chunk], dtype=float) for k in names}
+        n = len(chunk)
+
+        batch = _rom_batch(rom, vals, n)
+        uz_acc = FieldAccumulator(n)
+        sig_acc = FieldAccumulator(n, sigma_th)
+        for w, uz, sig in modal_field_tiles(batch, V_rms, f_hz, zeta, nx, ny, component, tile_values):
+            uz_acc.update(uz, w)
+            sig_acc.update(sig, w)
+        m = sig_acc.result()
+
+        yield {
+            **vals,
+            "f11_hz": batch.modal_freqs_hz()[:, idx[0]],
+            "uz_peak": uz_acc.max_abs,
+            "sigma_max": m.max_abs,
+            "sigma_mean": m.mean_abs,
+            "sigma_C": m.concentration,
+            "sigma_area_fraction": m.area_fraction,
+        }
+
+
+# ---------- chunk evaluation ----------
+def _axis_values(axes: dict[str, np.ndarray], shape: tuple[int, ...], start: int, stop: int) -> dict[str, np.ndarray]:
+    idx = np.unravel_index(np.arange(start, stop), shape)
+    return {k: v[i] for (k, v), i in zip(axes.items(), idx)}
+
+
+def _rom_batch(rom: RectPlateROM, vals: dict[str, np.ndarray], n: int) -> RectPlateROMBatch:
+    """`rom` with the swept parameters replaced by the (n,) design values in `vals`."""
+    plate = RectPlateBatch(
+        a=np.broadcast_to(vals.get("a", rom.plate.a), n),
+        b=np.broadcast_to(vals.get("b", rom.plate.b), n),
+    )
+    stack = StackBatch.from_stack(rom.stack, **{k: v for k, v in vals.items() if k in STACK_AXES})
+    return RectPlateROMBatch(plate, stack, modes=rom.modes, K_W=vals.get("K_W", rom.K_W))
+
+
+def _evaluate_chunk(task: tuple) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rom, axes, shape, start, stop, f, V_rms, zeta = task
+    batch = _rom_batch(rom, _axis_values(axes, shape, start, stop), stop - start)
+
+    uz, I = batch.frf_center_spectrum(V_rms, f, zeta)
+    return batch.modal_freqs_hz(), uz, I
+
+
+# ---------- checkpointing ----------
+def _sweep_key(rom: RectPlateROM, axes: dict[str, np.ndarray], f: np.ndarray,
+               V_rms: float, zeta: float, chunk_size: int) -> str:
+    h = hashlib.sha256()
+    h.update(repr((rom.plate, rom.stack, rom.K_W)).encode())
+    h.update(rom.modes.key())
+    for k, v in axes.items():
+        h.update(k.encode())
+        h.update(np.ascontiguousarray(v).tobytes())
+    h.update(np.ascontiguousarray(f).tobytes())
+    h.update(repr((float(V_rms), float(zeta), int(chunk_size))).encode())
+    return h.hexdigest()
+
+
+def _chunk_key(rom: RectPlateROM, axes: dict[str, np.ndarray], shape: tuple[int, ...], start: int, stop: int,
+               f: np.ndarray, V_rms: float, zeta: float) -> str:
+    # keyed on the point values, not the chunk index: any sweep covering the same designs hits
+    return input_hash("sweep_chunk", rom.plate, rom.stack, rom.K_W, rom.modes,
+                      _axis_values(axes, shape, start, stop), f, float(V_rms), float(zeta))
+
+
+class _ChunkStore:
+    """One .npz per finished chunk plus a manifest binding the directory to one sweep."""
+
+    def __init__(self, root: Path, key: str, n_chunks: int) -> None:
+        self.root = root
+        self.root.mkdir(parents=True, exist_ok=True)
+        manifest = self.root / "manifest.json"
+        meta = {"key": key, "n_chunks": n_chunks}
+        if manifest.exists():
+            old = json.loads(manifest.read_text())
+            if old != meta:
+                raise ValueError(
+                    f"Checkpoint directory {self.root} belongs to a different sweep; "
+                    "use a new directory or delete it."
+                )
+        else:
+            tmp = self.root / f".manifest.json.{os.getpid()}.tmp"
+            tmp.write_text(json.dumps(meta))
+            os.replace(tmp, manifest)
+
+    def _path(self, ci: int) -> Path:
+        return self.root / f"chunk_{ci:06d}.npz"
+
+    def has(self, ci: int) -> bool:
+        return self._path(ci).exists()
+
+    def load(self, ci: int) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+        p = self._path(ci)
+        if not p.exists():
+            return None
+        with np.load(p) as z:
+            return z["f_modes_hz"], z["uz"], z["I"]
+
+    def save(self, ci: int, out: tuple[np.ndarray, np.ndarray, np.ndarray]) -> None:
+        # write-then-rename: a killed job never leaves a truncated chunk behind
+        tmp = self.root / f".chunk_{ci:06d}.{os.getpid()}.tmp.npz"
+        np.savez(tmp, f_modes_hz=out[0], uz=out[1], I=out[2])
+        os.replace(tmp, self._path(ci))
@@ -0,0 +1,71 @@
+import numpy as np
+
+from mems_ana.geometry.plate import RectPlate, RectPlateBatch
+from mems_ana.materials.stack import Stack, StackBatch
+from mems_ana.materials.elastic import IsoElastic
+from mems_ana.materials.piezo import PiezoMaterial
+from mems_ana.rom.plate_rom import RectPlateROM, RectPlateROMBatch
+
+
+def make_designs(n: int = 40) -> tuple[list[RectPlate], list[Stack]]:
+    rng = np.random.default_rng(1)
+    si = IsoElastic(E=170e9, nu=0.28, rho=2330)
+
+    plates, stacks = [], []
+    for i in range(n):
+        pzt = PiezoMaterial(
+            E=60e9,
+            nu=0.31,
+            rho=7500,
+            eps_r=rng.uniform(800, 1400),
+            d31=-180e-12 * rng.uniform(0.9, 1.1),   # d31 ±10%
+            tan_delta=0.02,
+        )
+        plates.append(RectPlate(a=rng.uniform(1e-3, 2e-3), b=rng.uniform(1e-3, 2e-3)))
+        stacks.append(Stack(
+            si,
+            rng.uniform(5e-6, 10e-6),
+            pzt if i % 7 else None,                  # a few passive designs
+            rng.uniform(1e-6, 3e-6),
+            rng.uniform(0.3, 1.0),
+        ))
+    return plates, stacks
+
+
+def test_stack_batch_matches_scalar():
+    _, stacks = make_designs()
+    sb = StackBatch.from_stacks(stacks)
+
+    for name in ("neutral_axis_z0", "D_plate", "areal_mass", "t_total"):
+        ref = np.array([getattr(s, name)() for s in stacks])
+        assert np.allclose(getattr(sb, name)(), ref, rtol=1e-12, atol=0.0)
+
+    ref = np.array([s.piezo_bending_moment_per_width(14.0) for s in stacks])
+    assert np.allclose(sb.piezo_bending_moment_per_width(14.0), ref, rtol=1e-12, atol=0.0)
+
+
+def test_rom_batch_matches_scalar():
+    plates, stacks = make_designs()
+    batch = RectPlateROMBatch(RectPlateBatch.from_plates(plates), StackBatch.from_stacks(stacks))
+    f = np.linspace(1e3, 200e3, 101)
+
+    f_modes = batch.modal_freqs_hz()
+    uz, I = batch.frf_center_spectrum(10.0, f, zeta=0.02)
+
+    for i, (p, s) in enumerate(zip(plates, stacks)):
+        rom = RectPlateROM(p, s)
+        uz_ref, I_ref = rom.frf_center_spectrum(10.0, f, zeta=0.02)
+
+        assert np.allclose(f_modes[i], list(rom.modal_freqs_hz().values()), rtol=1e-12)
+        assert np.allclose(uz[i], uz_ref, rtol=1e-12, atol=0.0)
+        assert np.allclose(I[i], I_ref, rtol=1e-12, atol=0.0)
+
+
+def test_stack_batch_from_stack_overrides():
+    _, stacks = make_designs(1)
+    t = np.linspace(1e-6, 3e-6, 5)
+    sb = StackBatch.from_stack(stacks[0], t_pzt=t)
+
+    assert len(sb) == 5
+    assert sb[2].t_pzt == t[2]
+    assert sb[2].base == stacks[0].base
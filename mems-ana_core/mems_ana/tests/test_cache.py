@@ -0,0 +1,76 @@
+import os
+
+import numpy as np
+
+from mems_ana.geometry.plate import RectPlate
+from mems_ana.io.cache import ResultCache, input_hash
+from mems_ana.materials.stack import Stack
+from mems_ana.materials.elastic import IsoElastic
+from mems_ana.materials.piezo import PiezoMaterial
+from mems_ana.rom.plate_rom import RectPlateROM
+from mems_ana.solver.sweep import run_sweep
+
+
+def make_test_rom() -> RectPlateROM:
+    plate = RectPlate(a=1.5e-3, b=1.5e-3)
+    si = IsoElastic(E=170e9, nu=0.28, rho=2330)
+    pzt = PiezoMaterial(E=60e9, nu=0.31, rho=7500, eps_r=1200, d31=-180e-12, tan_delta=0.02)
+    return RectPlateROM(plate=plate, stack=Stack(si, 8e-6, pzt, 2e-6, 1.0))
+
+
+def test_hit_is_memory_mapped_and_key_tracks_inputs(tmp_path):
+    """
+    同じ入力は同じキー・ヒット時は mmap で返る
+    """
+    cache = ResultCache(tmp_path)
+    rom = make_test_rom()
+    k = cache.key(rom.plate, rom.stack, rom.modes, np.arange(3.0))
+    assert k == input_hash(rom.plate, rom.stack, rom.modes, np.arange(3.0))
+    assert k != cache.key(rom.plate, rom.stack, rom.modes, np.arange(3.0) + 1e-12)
+
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"uz": np.arange(6, dtype=complex).reshape(2, 3)}
+
+    first = cache.get_or_compute(k, compute)
+    second = cache.get_or_compute(k, compute)
+    assert len(calls) == 1
+    assert isinstance(second["uz"], np.memmap) and not second["uz"].flags.writeable
+    assert np.array_equal(first["uz"], second["uz"])
+
+
+def test_lru_eviction_respects_size_bound(tmp_path):
+    """
+    上限超過時は最も古く使われたエントリから削除
+    """
+    a = np.zeros(1000)  # 8 kB + header per entry
+    cache = ResultCache(tmp_path, max_bytes=20_000)
+    cache.put("k0", {"a": a})
+    cache.put("k1", {"a": a})
+    os.utime(tmp_path / "k0", (0, 0))
+    os.utime(tmp_path / "k1", (1, 1))
+    assert cache.get("k0") is not None  # refreshes k0, k1 is now the oldest
+
+    cache.put("k2", {"a": a})
+    assert cache.get("k1") is None
+    assert cache.get("k0") is not None and cache.get("k2") is not None
+    assert cache.size_bytes() <= 20_000
+
+
+def test_sweep_reuses_cached_chunks(tmp_path):
+    """
+    キャッシュ済みチャンクは再評価しない
+    """
+    rom = make_test_rom()
+    cache = ResultCache(tmp_path)
+    seen = []
+    axes = dict(a=np.linspace(1e-3, 2e-3, 5), t_pzt=np.linspace(1e-6, 3e-6, 4))
+    f_hz = np.linspace(1e3, 200e3, 20)
+    first = run_sweep(rom, axes, f_hz, chunk_size=8, cache=cache, progress=seen.append)
+    again = run_sweep(rom, axes, f_hz, chunk_size=8, cache=cache, progress=seen.append)
+
+    assert len(seen) == 3  # only the first run evaluates
+    assert np.array_equal(first.uz, again.uz)
+    assert np.array_equal(first.f_modes_hz, again.f_modes_hz)
@@ -0,0 +1,46 @@
+import math
+
+from mems_ana.geometry.plate import RectPlate
+from mems_ana.materials.stack import Stack, stack_properties
+from mems_ana.materials.elastic import IsoElastic
+from mems_ana.materials.piezo import PiezoMaterial
+from mems_ana.electrical.capacitance import capacitance_parallel_plate
+from mems_ana.rom.plate_rom import RectPlateROM
+
+
+def make_stack(elec_area_ratio: float = 0.8) -> Stack:
+    si = IsoElastic(E=170e9, nu=0.28, rho=2330)
+    pzt = PiezoMaterial(E=60e9, nu=0.31, rho=7500, eps_r=1200, d31=-180e-12, tan_delta=0.02)
+    return Stack(si, 8e-6, pzt, 2e-6, elec_area_ratio)
+
+
+def test_rom_capacitance_parallel_plate():
+    plate = RectPlate(a=1.5e-3, b=1.5e-3)
+    stack = make_stack()
+
+    C_ref = capacitance_parallel_plate(eps_r=1200, area=plate.area(), t_pzt=2e-6, area_ratio=0.8)
+    assert math.isclose(RectPlateROM(plate, stack).capacitance(), C_ref, rel_tol=1e-12)
+
+
+def test_stack_properties_match_methods_and_are_memoized():
+    stack = make_stack()
+    props = stack_properties(stack)
+
+    assert props.z0 == stack.neutral_axis_z0()
+    assert props.D == stack.D_plate()
+    assert props.areal_mass == stack.areal_mass()
+    assert props.moment_per_volt == stack.piezo_bending_moment_per_width(1.0)
+    assert math.isclose(props.moment_per_volt_full * 0.8, props.moment_per_volt, rel_tol=1e-15)
+
+    # equal (frozen) values share one cache entry
+    assert make_stack().properties() is props
+    assert make_stack(0.5).properties() is not props
+
+
+def test_stack_properties_without_piezo():
+    si = IsoElastic(E=170e9, nu=0.28, rho=2330)
+    props = Stack(si, 8e-6).properties()
+
+    assert not props.active
+    assert props.moment_per_volt == 0.0
+    assert props.cap_per_area == 0.0
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from mems_ana.io.config import load_config, parse_config
+
+BASE = {
+    "plate": {"a": 1.5e-3, "b": 1.0e-3},
+    "base": {"E": "170e9", "nu": 0.28, "rho": 2330, "t": "8e-6"},
+    "piezo": {"E": 60e9, "nu": 0.31, "rho": 7500, "eps_r": 1200, "d31": "-180e-12", "tan_delta": 0.02, "t": 2e-6},
+    "electrode": {"area_ratio": 0.8},
+    "modes": {"count": 6},
+    "drive": {"V_rms": 10, "f_hz": {"start": 1e3, "stop": 2e3, "num": 3}},
+    "sweep": {"axes": {"t_pzt": [1e-6, 2e-6], "K_W": 4}},
+}
+
+
+def test_parse_builds_validated_objects():
+    cfg = parse_config(BASE)
+    assert cfg.stack.base.E == 170e9 and cfg.stack.piezo.d31 == -180e-12
+    assert cfg.stack.elec_area_ratio == 0.8
+    # 1.5 x 1.0 mm: q = (m/a)^2 + (n/b)^2 in mm^-2 = 1.44, 2.78, 4.44, 5.00, 5.78, 8.00
+    assert len(cfg.modes) == 6
+    assert [(md.m, md.n) for md in cfg.modes] == [(1, 1), (2, 1), (1, 2), (3, 1), (2, 2), (3, 2)]
+    assert [(md.m, md.n) for md in parse_config({**BASE, "modes": {"count": 1}}).modes] == [(1, 1)]
+    assert np.array_equal(cfg.drive.f_hz, [1e3, 1.5e3, 2e3])
+    assert list(cfg.sweep.axes) == ["t_pzt", "K_W"]
+    assert cfg.rom().K_W == 8.0
+
+
+def test_hash_is_canonical():
+    """
+    同じ計算を表す設定は同じハッシュ、内容が変われば別ハッシュ
+    """
+    h = parse_config(BASE).hash
+    same = {**BASE,
+            "base": {"t": 8e-6, "rho": 2330.0, "nu": 0.28, "E": 170e9},
+            "drive": {"f_hz": [1000, 1500, 2000], "V_rms": 10.0, "zeta": 0.02},
+            "sweep": {"axes": {"t_pzt": [1e-6, 2e-6], "K_W": [4.0]}, "workers": 4}}
+    assert parse_config(same).hash == h
+
+    assert parse_config({**BASE, "electrode": {"area_ratio": 0.7}}).hash != h
+    swapped = {**BASE, "sweep": {"axes": {"K_W": 4, "t_pzt": [1e-6, 2e-6]}}}
+    assert parse_config(swapped).hash != h  # axis order changes the point order
+
+
+@pytest.mark.parametrize("patch", [
+    {"plate": {"a": -1.0, "b": 1e-3}},
+    {"base": {"E": 170e9, "nu": 0.28, "rho": 2330, "t": 8e-6, "thickness": 1}},
+    {"modes": {"count": 6, "f_max_hz": 1e5}},
+    {"sweep": {"axes": {"t_pztt": [1e-6]}}},
+    {"electrode": {"area_ratio": 1.5}},
+])
+def test_invalid_configs_raise(patch):
+    with pytest.raises(ValueError):
+        parse_config({**BASE, **patch})
+
+
+def test_example_yaml_loads():
+    from pathlib import Path
+
+    path = Path(__file__).resolve().parents[1] / "examples" / "configs" / "diaphragm.yaml"
+    cfg = load_config(path)
+    assert len(cfg.modes) == 4 and cfg.sweep is not None and cfg.drive.f_hz.size == 400
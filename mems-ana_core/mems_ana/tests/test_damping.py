@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+import mems_ana.physics.damping as damping
+from mems_ana.geometry.plate import RectPlate
+from mems_ana.materials.stack import Stack
+from mems_ana.materials.elastic import IsoElastic
+from mems_ana.materials.piezo import PiezoMaterial
+from mems_ana.rom.plate_rom import RectPlateROM, ModeSet
+from mems_ana.physics.damping import ModalTableDamping, RayleighDamping, SqueezeFilmDamping, squeeze_series
+
+
+def make_test_rom() -> RectPlateROM:
+    plate = RectPlate(a=1.5e-3, b=1.0e-3)
+    si = IsoElastic(E=170e9, nu=0.28, rho=2330)
+    pzt = PiezoMaterial(E=60e9, nu=0.31, rho=7500, eps_r=1200, d31=-180e-12, tan_delta=0.02)
+    stack = Stack(si, 8e-6, pzt, 2e-6, 0.8)
+    return RectPlateROM(plate, stack, ModeSet.below(500e3, plate, stack))
+
+
+def test_simply_supported_series_is_single_term():
+    """
+    S 辺: モード形状 = 圧力固有関数なので級数は 1 項 1/(k_mn^2 + jσ)
+    """
+    modes = ModeSet(m=[1, 2, 3], n=[1, 1, 2])
+    sigma = np.geomspace(1e-2, 1e4, 50)
+    G = squeeze_series(modes, 1.5, sigma, edges="S", n_terms=16)
+
+    k2 = (modes.m * np.pi) ** 2 + (modes.n * np.pi * 1.5) ** 2
+    assert np.allclose(G, 1.0 / (k2 + 1j * sigma[:, None]), rtol=1e-12)
+
+
+def test_table_matches_series_and_persists(tmp_path, monkeypatch):
+    rom = make_test_rom()
+    sq = SqueezeFilmDamping(rom.plate, rom.stack, rom.modes, gap=20e-6, cache_dir=tmp_path)
+    assert len(list(tmp_path.glob("squeeze_*.npz"))) == 1
+
+    omega = 2.0 * np.pi * np.geomspace(1e2, 1e6, 301)
+    G_ref = squeeze_series(rom.modes, rom.plate.a / rom.plate.b, sq.squeeze_number(omega), "C", sq.n_terms)
+    assert np.allclose(sq.coefficients(omega), G_ref, rtol=2e-4, atol=0)
+
+    # damping is positive and the film stiffens the modes (Im ζ < 0)
+    zeta = sq.modal_zeta(rom.modal_omegas(), omega)
+    assert zeta.shape == (301, len(rom.modes))
+    assert np.all(zeta.real > 0.0) and np.all(zeta.imag <= 0.0)
+
+    # second instance for the same geometry reads the table instead of summing the series
+    def no_series(*args, **kwargs):
+        raise AssertionError("series re-evaluated")
+
+    monkeypatch.setattr(damping, "squeeze_series", no_series)
+    monkeypatch.setattr(damping, "_TABLES", {})  # as in a new process: only the .npz is left
+    sq2 = SqueezeFilmDamping(rom.plate, rom.stack, rom.modes, gap=10e-6, cache_dir=tmp_path)
+    assert np.array_equal(sq2.G, sq.G)
+
+
+def test_table_without_cache_dir_stays_in_memory(tmp_path, monkeypatch):
+    """
+    cache_dir 未指定: ディスク（ホーム / MEMS_ANA_CACHE）には何も書かず、
+    同一プロセス内ではテーブルを再利用する
+    """
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("MEMS_ANA_CACHE", str(tmp_path / "cache"))
+    monkeypatch.setattr(damping, "_TABLES", {})
+    rom = make_test_rom()
+    sq = SqueezeFilmDamping(rom.plate, rom.stack, rom.modes, gap=20e-6)
+    assert sq.cache_dir is None
+    assert list(tmp_path.iterdir()) == []
+
+    def no_series(*args, **kwargs):
+        raise AssertionError("series re-evaluated")
+
+    monkeypatch.setattr(damping, "squeeze_series", no_series)
+    sq2 = SqueezeFilmDamping(rom.plate, rom.stack, rom.modes, gap=5e-6)
+    assert sq2.G is sq.G
+
+
+def test_models_plug_into_frf():
+    rom = make_test_rom()
+    f = np.linspace(1e3, 300e3, 500)
+    uz_ref, I_ref = rom.frf_center_spectrum(1.0, f, 0.02)
+
+    uz, I = rom.frf_center_spectrum(1.0, f, ModalTableDamping([1e3, 1e6], [0.02, 0.02]))
+    assert np.allclose(uz, uz_ref, rtol=1e-12) and np.allclose(I, I_ref)
+
+    w = rom.modal_omegas()
+    ray = RayleighDamping.from_two_modes(w[0] / (2 * np.pi), 0.01, w[-1] / (2 * np.pi), 0.03)
+    z = ray.modal_zeta(w, 0.0)
+    assert np.isclose(z[0], 0.01) and np.isclose(z[-1], 0.03)
+    with pytest.raises(ValueError):
+        RayleighDamping.from_two_modes(1e3, 0.01, 1e3, 0.02)
@@ -0,0 +1,53 @@
+import numpy as np
+
+from mems_ana.geometry.plate import RectPlate
+from mems_ana.materials.stack import Stack
+from mems_ana.materials.elastic import IsoElastic
+from mems_ana.physics.plate_theory import omega_mn_simply_supported
+from mems_ana.solver.eigen import PlateEigenSolver
+
+
+def make_test_stack() -> Stack:
+    si = IsoElastic(E=170e9, nu=0.3, rho=2330)
+    return Stack(si, 10e-6)
+
+
+def test_simply_supported_matches_closed_form():
+    plate = RectPlate(a=1.5e-3, b=1.0e-3)
+    stack = make_test_stack()
+    modes = PlateEigenSolver(plate, stack, 61, 41, edges="SSSS").solve(k=3)
+
+    props = stack.properties()
+    for k, (m, n) in enumerate([(1, 1), (2, 1), (1, 2)]):
+        w = omega_mn_simply_supported(props.D, props.areal_mass, plate.a, plate.b, m, n)
+        assert np.isclose(modes.freqs_hz[k], w / (2.0 * np.pi), rtol=2e-3)
+
+
+def test_clamped_square_plate_leissa():
+    """
+    CCCC 正方形: ω a^2 sqrt(ρh/D) = 35.99 (Leissa) -> SS 比 35.99 / 2π^2
+    """
+    plate = RectPlate(a=1.5e-3, b=1.5e-3)
+    modes = PlateEigenSolver(plate, make_test_stack(), 61, 61, edges="CCCC").solve(k=1)
+
+    ratio = modes.ratio_to_simply_supported(make_test_stack())
+    assert np.isclose(ratio, 35.99 / (2.0 * np.pi**2), rtol=3e-3)
+    assert modes.shapes[0, 30, 30] == 1.0
+
+
+def test_free_plate_rigid_modes_and_shift_reuse():
+    plate = RectPlate(a=1.5e-3, b=1.5e-3)
+    solver = PlateEigenSolver(plate, make_test_stack(), 41, 41, edges="FFFF")
+    modes = solver.solve(k=4)
+
+    # three rigid-body modes, then the first elastic mode (λ = 13.47 for ν = 0.3)
+    assert np.all(modes.freqs_hz[:3] < 1e-3 * modes.freqs_hz[3])
+    assert np.isclose(modes.ratio_to_simply_supported(make_test_stack(), k=3), 13.47 / (2.0 * np.pi**2), rtol=5e-3)
+
+    # a nearby target reuses the factorization of the first shift: same elastic mode
+    f1 = modes.freqs_hz[3]
+    near = solver.solve(k=2, f_target_hz=f1)
+    again = solver.solve(k=2, f_target_hz=1.05 * f1)
+    assert len(solver.cached_shifts) == 2
+    assert np.isclose(again.freqs_hz[-1], near.freqs_hz[-1], rtol=1e-9)
+    assert np.isclose(near.freqs_hz[-1], f1, rtol=1e-9)
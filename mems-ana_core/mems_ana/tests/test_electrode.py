@@ -0,0 +1,98 @@
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import mems_ana
+
+from mems_ana.geometry.plate import RectPlate
+from mems_ana.geometry.electrode import ElectrodePattern, center_overlaps, overlap_matrix
+from mems_ana.materials.stack import Stack
+from mems_ana.materials.elastic import IsoElastic
+from mems_ana.materials.piezo import PiezoMaterial
+from mems_ana.rom.plate_rom import RectPlateROM, ModeSet
+from mems_ana.physics.plate_theory import omega_mn_simply_supported
+from mems_ana.solver.static import StaticPlateSolver
+
+
+def make_test_rom(n_modes: int = 12) -> RectPlateROM:
+    plate = RectPlate(a=1.5e-3, b=1.0e-3)
+    si = IsoElastic(E=170e9, nu=0.28, rho=2330)
+    pzt = PiezoMaterial(E=60e9, nu=0.31, rho=7500, eps_r=1200, d31=-180e-12, tan_delta=0.02)
+    stack = Stack(si, 8e-6, pzt, 2e-6, 0.6)
+    return RectPlateROM(plate, stack, ModeSet.lowest(n_modes, plate, stack))
+
+
+def test_overlaps_match_quadrature():
+    """
+    解析的な重なり積分 (kx²+ky²)∫_E φ dA が中点則の数値積分と一致すること
+    """
+    rom = make_test_rom()
+    pattern = ElectrodePattern(ElectrodePattern.center_and_ring(0.3, 0.1).electrodes
+                               + ElectrodePattern.split(3, "y", 0.8).electrodes)
+    O = overlap_matrix(rom.modes.m, rom.modes.n, rom.plate, pattern)
+    assert O.shape == (len(rom.modes), 5)
+
+    n = 800
+    x = (np.arange(n) + 0.5) / n
+    X, Y = np.meshgrid(x, x, indexing="ij")
+    for e, el in enumerate(pattern.electrodes):
+        inside = np.zeros_like(X, dtype=bool)
+        for r in el.rects:
+            inside |= (X >= r.x0) & (X <= r.x1) & (Y >= r.y0) & (Y <= r.y1)
+        for k, md in enumerate(rom.modes):
+            kx, ky = md.m * np.pi / rom.plate.a, md.n * np.pi / rom.plate.b
+            lap = (kx**2 + ky**2) * np.sin(md.m * np.pi * X) * np.sin(md.n * np.pi * Y)
+            ref = np.sum(lap * inside) * rom.plate.area() / n**2
+            assert np.isclose(O[k, e], ref, rtol=2e-3, atol=2e-3 * np.abs(O).max())
+
+
+def test_cache_and_coverage_sweep():
+    rom = make_test_rom()
+    pattern = ElectrodePattern.center(0.5)
+    O1 = overlap_matrix(rom.modes.m, rom.modes.n, rom.plate, pattern)
+    assert overlap_matrix(rom.modes.m, rom.modes.n, rom.plate, ElectrodePattern.center(0.5)) is O1
+    assert not O1.flags.writeable
+
+    ratios = np.linspace(0.1, 1.0, 10)
+    O_sweep = center_overlaps(rom.modes.m, rom.modes.n, rom.plate, ratios)
+    for i, r in enumerate(ratios):
+        assert np.allclose(O_sweep[:, i], overlap_matrix(rom.modes.m, rom.modes.n, rom.plate, ElectrodePattern.center(r))[:, 0])
+
+    # default coupling = centered elec_area_ratio electrode, same C0 as the ROM
+    c = rom.coupling()
+    assert np.isclose(c.C0, rom.capacitance(), rtol=1e-12)
+
+    with pytest.raises(ValueError):
+        ElectrodePattern.edge_ring(0.8, 0.5)
+
+
+def test_segmented_static_deflection_matches_fd():
+    """
+    中央+リング電極それぞれの静的たわみ (モード和) が有限差分 SSSS 解と一致すること
+    """
+    rom = make_test_rom(n_modes=300)
+    pattern = ElectrodePattern.center_and_ring(0.4, 0.1)
+
+    props = rom.stack.properties()
+    w_ss = omega_mn_simply_supported(props.D, props.areal_mass, rom.plate.a, rom.plate.b,
+                                     rom.modes.m.astype(float), rom.modes.n.astype(float))
+    K = props.areal_mass * rom.plate.area() / 4.0 * w_ss**2
+    O = overlap_matrix(rom.modes.m, rom.modes.n, rom.plate, pattern)
+    w_modal = props.moment_per_volt_full * (O.T / K) @ rom.center_participation()
+
+    w_fd = StaticPlateSolver(rom.plate, rom.stack, 81, 81, edges="SSSS").unit_deflections(pattern)[:, 40, 40]
+    assert np.allclose(w_modal, w_fd, rtol=4e-2)
+
+
+def test_geometry_does_not_import_rom():
+    """
+    層構造: geometry は rom に依存しない（rom が geometry の上に乗る）
+    """
+    code = "import sys, mems_ana.geometry.electrode; print(sorted(m for m in sys.modules if m.startswith('mems_ana.rom')))"
+    env = dict(os.environ, PYTHONPATH=str(Path(mems_ana.__file__).resolve().parents[1]))
+    out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from mems_ana.io.export import ColumnWriter, open_store
+
+
+def make_chunk(start: int, n: int) -> dict[str, np.ndarray]:
+    i = np.arange(start, start + n)
+    return {
+        "t_pzt": 1e-6 * (1.0 + i),
+        "f_modes_hz": np.outer(i, [1.0, 2.0, 3.0]),
+        "uz": (i[:, None] + 1j * np.arange(5)).astype(np.complex64),
+        "ok": i % 2 == 0,
+    }
+
+
+def test_append_and_zero_copy_read(tmp_path):
+    """
+    チャンク追記 → memmap による遅延・ゼロコピー読み出し
+    """
+    with ColumnWriter(tmp_path, meta={"f_hz": [1.0, 2.0]}) as w:
+        for s in range(0, 100, 30):
+            w.append(make_chunk(s, min(30, 100 - s)))
+
+    r = open_store(tmp_path)
+    assert len(r) == 100 and r.meta["f_hz"] == [1.0, 2.0]
+    assert r["uz"].dtype == np.complex64 and r["uz"].shape == (100, 5)
+
+    ref = make_chunk(0, 100)
+    part = r.rows(40, 55, ["uz", "ok"])
+    assert set(part) == {"uz", "ok"}
+    assert np.array_equal(part["uz"], ref["uz"][40:55])
+    assert np.shares_memory(part["uz"], r["uz"])
+    assert not r["uz"].flags.writeable
+    for k in ref:
+        assert np.array_equal(r[k], ref[k])
+
+
+def test_reopen_truncates_uncommitted_tail_and_validates(tmp_path):
+    w = ColumnWriter(tmp_path)
+    w.append(make_chunk(0, 10))
+    with open(tmp_path / "uz.bin", "ab") as fh:  # killed mid-append: data without schema commit
+        fh.write(b"\0" * 37)
+
+    w2 = ColumnWriter(tmp_path)
+    assert w2.n_rows == 10
+    w2.append(make_chunk(10, 5))
+    r = open_store(tmp_path)
+    assert np.array_equal(r["uz"], make_chunk(0, 15)["uz"])
+
+    with pytest.raises(ValueError):
+        w2.append({"t_pzt": np.zeros(3)})
+    with pytest.raises(ValueError):
+        w2.append({**make_chunk(0, 3), "uz": np.zeros((3, 4), dtype=np.complex64)})
+
+    # 拒否されたチャンクは何も残さない: 次の正しい追記がそのまま続く
+    w2.append(make_chunk(100, 3))
+    r = open_store(tmp_path)
+    assert len(r) == 18
+    for k, v in make_chunk(100, 3).items():
+        assert np.array_equal(r[k][15:], v)
+    assert np.array_equal(r["t_pzt"][:15], make_chunk(0, 15)["t_pzt"])
+
+
+def test_rejected_first_append_leaves_writer_usable(tmp_path):
+    w = ColumnWriter(tmp_path)
+    with pytest.raises(ValueError):
+        w.append({"a": np.arange(3), "b": np.array([None, 1, 2], dtype=object)})
+    w.append({"a": np.arange(3), "b": np.zeros((3, 2))})
+    r = open_store(tmp_path)
+    assert set(r.columns) == {"a", "b"} and np.array_equal(r["a"], [0, 1, 2])
+
+
+def test_overwrite_only_removes_store_columns(tmp_path):
+    """
+    overwrite は schema に載っている列だけを消す。schema の無い非空ディレクトリは拒否
+    """
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "user.bin").write_bytes(b"keep")
+    with pytest.raises(ValueError):
+        ColumnWriter(tmp_path / "data", overwrite=True)
+    assert (tmp_path / "data" / "user.bin").read_bytes() == b"keep"
+
+    store = tmp_path / "store"
+    with ColumnWriter(store) as w:
+        w.append(make_chunk(0, 4))
+    (store / "other.bin").write_bytes(b"keep")
+    with ColumnWriter(store, overwrite=True) as w:
+        assert w.n_rows == 0
+        w.append({"x": np.arange(2)})
+    assert not (store / "uz.bin").exists()
+    assert (store / "other.bin").read_bytes() == b"keep"
+    assert np.array_equal(open_store(store)["x"], [0, 1])
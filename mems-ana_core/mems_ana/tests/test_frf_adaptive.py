@@ -0,0 +1,68 @@
+import numpy as np
+from scipy.optimize import minimize_scalar
+
+from mems_ana.geometry.plate import RectPlate
+from mems_ana.materials.stack import Stack
+from mems_ana.materials.elastic import IsoElastic
+from mems_ana.materials.piezo import PiezoMaterial
+from mems_ana.rom.plate_rom import RectPlateROM, ModeSet
+from mems_ana.solver.frf import adaptive_frf
+
+
+def make_test_rom() -> RectPlateROM:
+    plate = RectPlate(a=1.5e-3, b=1.5e-3)
+    si = IsoElastic(E=170e9, nu=0.28, rho=2330)
+    pzt = PiezoMaterial(E=60e9, nu=0.31, rho=7500, eps_r=1200, d31=-180e-12, tan_delta=0.02)
+    stack = Stack(si, 8e-6, pzt, 2e-6, 0.8)
+    return RectPlateROM(plate, stack, ModeSet.below(500e3, plate, stack))
+
+
+def test_peaks_match_brute_force_optimum():
+    """
+    適応グリッドのピーク (周波数・振幅) が数値最適化の結果と一致し、
+    密な等間隔掃引より大幅に少ない評価回数で済むこと
+    """
+    rom = make_test_rom()
+    res = adaptive_frf(rom, 1e3, 300e3, V_rms=10.0, zeta=0.02)
+    assert res.converged
+    assert np.all(np.diff(res.f_hz) > 0.0)
+    assert len(res.peak_f_hz) >= 2
+
+    for f_pk, uz_pk in zip(res.peak_f_hz, res.peak_uz_abs):
+        opt = minimize_scalar(
+            lambda f: -abs(rom.frf_center_spectrum(10.0, f, 0.02)[0]),
+            bracket=(0.999 * f_pk, f_pk, 1.001 * f_pk),
+            tol=1e-12,
+        )
+        assert np.isclose(f_pk, opt.x, rtol=1e-5)
+        assert np.isclose(uz_pk, -opt.fun, rtol=1e-4)
+
+    # a uniform grid needs ~ (f_max - f_min) / (freq_rtol f_1) points for the same peak accuracy
+    f_1 = res.peak_f_hz[0]
+    assert res.n_evals * 50 < (300e3 - 1e3) / (1e-5 * f_1)
+
+
+def test_uz_matches_direct_evaluation():
+    rom = make_test_rom()
+    res = adaptive_frf(rom, 1e3, 300e3, V_rms=2.0)
+    uz, I = rom.frf_center_spectrum(2.0, res.f_hz, 0.02)
+    assert np.allclose(res.uz, uz, rtol=1e-12)
+    assert np.allclose(res.I, I, rtol=1e-12)
+
+
+def test_peaks_belong_to_the_returned_grid_when_not_converged():
+    """
+    max_iter で打ち切った場合も、ピークは返したグリッド上の極大から推定される
+    （最後の細分化の前の推定値を返さない）
+    """
+    rom = make_test_rom()
+    for max_iter in range(4):
+        res = adaptive_frf(rom, 1e3, 300e3, V_rms=10.0, max_iter=max_iter)
+        assert not res.converged
+
+        amp = np.abs(res.uz)
+        i = np.flatnonzero((amp[1:-1] > amp[:-2]) & (amp[1:-1] >= amp[2:])) + 1
+        assert len(res.peak_f_hz) == len(i)
+        # the parabola through the maximum and its neighbours peaks at or above the sampled maximum
+        assert np.all(res.peak_uz_abs >= amp[i])
+        assert np.all((res.f_hz[i - 1] <= res.peak_f_hz) & (res.peak_f_hz <= res.f_hz[i + 1]))
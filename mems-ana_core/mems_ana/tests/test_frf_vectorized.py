@@ -0,0 +1,74 @@
+import numpy as np
+
+from mems_ana.electrical.capacitance import EPS0
+from mems_ana.geometry.plate import RectPlate
+from mems_ana.materials.stack import Stack
+from mems_ana.materials.elastic import IsoElastic
+from mems_ana.materials.piezo import PiezoMaterial
+from mems_ana.rom.plate_rom import RectPlateROM
+
+
+def make_test_rom() -> RectPlateROM:
+    plate = RectPlate(a=1.5e-3, b=1.5e-3)
+    si = IsoElastic(E=170e9, nu=0.28, rho=2330)
+    pzt = PiezoMaterial(E=60e9, nu=0.31, rho=7500, eps_r=1200, d31=-180e-12, tan_delta=0.02)
+    stack = Stack(si, 8e-6, pzt, 2e-6, 0.8)
+    return RectPlateROM(plate=plate, stack=stack)
+
+
+def reference_center_frf(rom: RectPlateROM, V_rms: float, f_hz: float, zeta: float) -> tuple[complex, complex]:
+    """Per-mode loop of the original scalar implementation (independent of the vectorized path)."""
+    omega = 2.0 * np.pi * f_hz
+    stack, plate = rom.stack, rom.plate
+    C = EPS0 * stack.piezo.eps_r * plate.area() * stack.elec_area_ratio / stack.t_pzt
+    I = (1j * omega * C + omega * C * stack.piezo.tan_delta) * V_rms
+
+    V_peak = V_rms * np.sqrt(2.0)
+    D = stack.D_plate()
+    w_scale = rom.K_W * stack.piezo_bending_moment_per_width(V_peak) / D * plate.a**2
+    uz = 0.0 + 0.0j
+    for md in rom.modes:
+        kx, ky = md.m * np.pi / plate.a, md.n * np.pi / plate.b
+        w_mn = 1.25 * np.sqrt(D / stack.areal_mass()) * (kx**2 + ky**2)
+        phi_c = np.sin(md.m * np.pi * 0.5) * np.sin(md.n * np.pi * 0.5)
+        if abs(phi_c) < 1e-12:
+            continue
+        uz += w_scale * phi_c / ((w_mn**2 - omega**2) + 1j * (2.0 * zeta * w_mn * omega))
+    return uz, I
+
+
+def test_spectrum_matches_scalar_reference():
+    """
+    配列版 FRF = 元のモードごとのスカラー実装（テスト内に展開）
+    """
+    rom = make_test_rom()
+    f = np.linspace(1e3, 200e3, 64)
+
+    uz, I = rom.frf_center_spectrum(10.0, f, zeta=0.02)
+
+    for k, fk in enumerate(f):
+        uz_ref, I_ref = reference_center_frf(rom, 10.0, float(fk), 0.02)
+        assert np.isclose(uz[k], uz_ref, rtol=1e-12)
+        assert np.isclose(I[k], I_ref, rtol=1e-12)
+        uz_k, I_k = rom.frf_center_uz_and_I(10.0, float(fk), zeta=0.02)
+        assert np.isclose(uz_k, abs(uz_ref), rtol=1e-12)
+        assert np.isclose(I_k, abs(I_ref), rtol=1e-12)
+
+
+def test_spectrum_broadcasts_over_V_and_zeta():
+    rom = make_test_rom()
+    f = np.linspace(1e3, 200e3, 50)
+    V = np.array([1.0, 10.0])[:, None, None]
+    zeta = np.array([0.01, 0.02, 0.05])[None, :, None]
+
+    uz, I = rom.frf_center_spectrum(V, f, zeta)
+
+    assert uz.shape == (2, 3, 50)
+    assert I.shape == (2, 3, 50)
+
+    # linear in V, electrical independent of zeta
+    assert np.allclose(uz[1], 10.0 * uz[0], rtol=1e-12)
+    assert np.allclose(I[:, 0], I[:, 2], rtol=1e-12)
+
+    uz_ref, _ = rom.frf_center_spectrum(10.0, f, 0.05)
+    assert np.allclose(uz[1, 2], uz_ref, rtol=1e-12)
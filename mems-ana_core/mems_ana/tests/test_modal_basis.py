@@ -0,0 +1,49 @@
+import numpy as np
+
+from mems_ana.geometry.plate import RectPlate
+from mems_ana.materials.stack import Stack
+from mems_ana.materials.elastic import IsoElastic
+from mems_ana.materials.piezo import PiezoMaterial
+from mems_ana.rom.plate_rom import RectPlateROM, ModeSet
+from mems_ana.rom.modal_basis import ModalBasis
+
+
+def make_test_rom() -> RectPlateROM:
+    plate = RectPlate(a=1.5e-3, b=1.0e-3)
+    si = IsoElastic(E=170e9, nu=0.28, rho=2330)
+    pzt = PiezoMaterial(E=60e9, nu=0.31, rho=7500, eps_r=1200, d31=-180e-12, tan_delta=0.02)
+    stack = Stack(si, 8e-6, pzt, 2e-6, 0.8)
+    return RectPlateROM(plate, stack, ModeSet.below(1e6, plate, stack))
+
+
+def test_grid_field_center_matches_center_frf():
+    """
+    全面 uz(x, y, f) の中心値が frf_center_spectrum と一致すること
+    """
+    rom = make_test_rom()
+    f = np.linspace(1e3, 400e3, 200)
+    basis = ModalBasis.from_grid(rom.plate, rom.modes, 41, 31)
+
+    uz = basis.field(rom.modal_coordinates(10.0, f))
+    uz_c, _ = rom.frf_center_spectrum(10.0, f)
+
+    assert uz.shape == (200, 41, 31)
+    assert basis.Phi.flags.c_contiguous
+    assert np.allclose(uz[:, 20, 15], uz_c, rtol=0, atol=1e-12 * np.abs(uz_c).max())
+    assert np.allclose(uz[:, 0, :], 0.0, atol=1e-12 * np.abs(uz_c).max())
+
+
+def test_points_match_direct_sines_and_float32():
+    rom = make_test_rom()
+    x = np.array([0.2e-3, 0.9e-3, 1.3e-3])
+    y = np.array([0.1e-3, 0.5e-3, 0.7e-3])
+    q = rom.modal_coordinates(1.0, [10e3, 95e3])
+
+    u = ModalBasis.from_points(rom.plate, rom.modes, x, y).field(q)
+    m, n = rom.modes.m, rom.modes.n
+    phi = np.sin(m * np.pi * x[:, None] / rom.plate.a) * np.sin(n * np.pi * y[:, None] / rom.plate.b)
+    assert np.allclose(u, q @ phi.T, rtol=1e-12)
+
+    u32 = ModalBasis.from_points(rom.plate, rom.modes, x, y, dtype=np.float32).field(q)
+    assert u32.dtype == np.complex64
+    assert np.allclose(u32, u, rtol=0, atol=1e-5 * np.abs(u).max())
@@ -0,0 +1,54 @@
+import numpy as np
+from scipy.signal import cont2discrete, dlsim
+
+from mems_ana.rom.modal_system import ModalSystem
+
+
+def make_test_system() -> ModalSystem:
+    rng = np.random.default_rng(1)
+    omega_n = 2.0 * np.pi * np.array([20e3, 55e3, 90e3, 140e3])
+    zeta = np.array([0.01, 0.02, 0.05, 1.5])
+    return ModalSystem(omega_n, zeta, rng.normal(size=(4, 2)), rng.normal(size=(3, 4)))
+
+
+def dense_state_space(sys: ModalSystem) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """2K 状態の密な (A, B, C) — 検証用"""
+    K = sys.n_modes
+    A = np.zeros((2 * K, 2 * K))
+    A[:K, K:] = np.eye(K)
+    A[K:, :K] = -np.diag(sys.omega_n**2)
+    A[K:, K:] = -np.diag(2.0 * sys.zeta * sys.omega_n)
+    B = np.vstack([np.zeros_like(sys.B), sys.B])
+    C = np.hstack([sys.C, np.zeros_like(sys.C)])
+    return A, B, C
+
+
+def test_mimo_transfer_matches_dense_state_space():
+    sys = make_test_system()
+    A, B, C = dense_state_space(sys)
+    f = np.array([1e3, 20e3, 54e3, 120e3])
+
+    G = sys.transfer(f)
+    assert G.shape == (4, 3, 2)
+    for i, fi in enumerate(f):
+        G_ref = C @ np.linalg.solve(2j * np.pi * fi * np.eye(A.shape[0]) - A, B)
+        assert np.allclose(G[i], G_ref, rtol=1e-10)
+
+    u = np.array([1.0, -0.5j])
+    assert np.allclose(sys.response(f, u), G @ u, rtol=1e-12)
+
+
+def test_discrete_matches_zoh_of_dense_model():
+    sys = make_test_system()
+    A, B, C = dense_state_space(sys)
+    dt = 2e-7
+    u = np.random.default_rng(2).normal(size=(3000, 2))
+
+    Ad, Bd, Cd, Dd, _ = cont2discrete((A, B, C, np.zeros((3, 2))), dt, method="zoh")
+    _, y_ref, _ = dlsim((Ad, Bd, Cd, Dd, dt), u)
+
+    disc = sys.to_discrete(dt)
+    y1, z = disc.simulate(u[:1234])
+    y2, _ = disc.simulate(u[1234:], z)
+    y = np.vstack([y1, y2])
+    assert np.allclose(y, y_ref, rtol=0, atol=1e-9 * np.abs(y_ref).max())
@@ -0,0 +1,80 @@
+import numpy as np
+
+from mems_ana.geometry.plate import RectPlate
+from mems_ana.materials.stack import Stack
+from mems_ana.materials.elastic import IsoElastic
+from mems_ana.materials.piezo import PiezoMaterial
+from mems_ana.rom.plate_rom import RectPlateROM, Mode, ModeSet
+
+
+def make_test_stack() -> Stack:
+    si = IsoElastic(E=170e9, nu=0.28, rho=2330)
+    pzt = PiezoMaterial(E=60e9, nu=0.31, rho=7500, eps_r=1200, d31=-180e-12, tan_delta=0.02)
+    return Stack(si, 8e-6, pzt, 2e-6, 1.0)
+
+
+def brute_force_freqs(plate: RectPlate, stack: Stack, n_max: int = 80) -> tuple[np.ndarray, np.ndarray]:
+    modes = [Mode(m, n) for m in range(1, n_max + 1) for n in range(1, n_max + 1)]
+    f = RectPlateROM(plate, stack, modes=modes).modal_omegas() / (2.0 * np.pi)
+    odd = np.array([md.m % 2 == 1 and md.n % 2 == 1 for md in modes])
+    return f, odd
+
+
+def test_mode_set_below_cutoff():
+    plate = RectPlate(a=1.5e-3, b=0.9e-3)
+    stack = make_test_stack()
+    f_all, _ = brute_force_freqs(plate, stack)
+
+    f_max = 3e6
+    ms = ModeSet.below(f_max, plate, stack)
+    f = RectPlateROM(plate, stack, modes=ms).modal_omegas() / (2.0 * np.pi)
+
+    assert ms.m.dtype == np.int32
+    assert len(ms) == np.count_nonzero(f_all < f_max)
+    assert np.all(f < f_max)
+    assert np.allclose(f, np.sort(f), rtol=1e-12)
+
+
+def test_mode_set_lowest_center_only():
+    plate = RectPlate(a=1.5e-3, b=0.9e-3)
+    stack = make_test_stack()
+    f_all, odd = brute_force_freqs(plate, stack)
+
+    ms = ModeSet.lowest(50, plate, center_only=True)
+    f = RectPlateROM(plate, stack, modes=ms).modal_omegas() / (2.0 * np.pi)
+
+    assert len(ms) == 50
+    assert np.all(ms.center_participation() != 0.0)
+    assert np.allclose(f, np.sort(f_all[odd])[:50], rtol=1e-12)
+
+
+def test_mode_set_lowest_returns_exactly_count():
+    """
+    lowest(count) は境界のモード自身も含めて、ちょうど count 個返す
+    """
+    stack = make_test_stack()
+    for plate in (RectPlate(a=1.5e-3, b=1.5e-3), RectPlate(a=1e-3, b=5e-3), RectPlate(a=5e-3, b=1e-3)):
+        f_all, odd = brute_force_freqs(plate, stack)
+        for count in range(1, 7):
+            for center_only in (False, True):
+                ms = ModeSet.lowest(count, plate, stack, center_only=center_only)
+                f = RectPlateROM(plate, stack, modes=ms).modal_omegas() / (2.0 * np.pi)
+                ref = np.sort(f_all[odd] if center_only else f_all.ravel())[:count]
+                assert len(ms) == count
+                assert np.allclose(f, ref, rtol=1e-12)
+
+    square = ModeSet.lowest(2, RectPlate(a=1.5e-3, b=1.5e-3))
+    assert [(md.m, md.n) for md in square] == [(1, 1), (1, 2)]
+
+
+def test_even_modes_do_not_change_center_frf():
+    plate = RectPlate(a=1.5e-3, b=1.5e-3)
+    stack = make_test_stack()
+    f = np.linspace(1e3, 500e3, 200)
+
+    full = RectPlateROM(plate, stack, modes=ModeSet.lowest(30, plate))
+    center = RectPlateROM(plate, stack, modes=full.modes.center_only())
+
+    uz_full, _ = full.frf_center_spectrum(10.0, f)
+    uz_center, _ = center.frf_center_spectrum(10.0, f)
+    assert np.allclose(uz_full, uz_center, rtol=1e-12)
@@ -0,0 +1,48 @@
+import numpy as np
+
+from mems_ana.geometry.plate import RectPlate
+from mems_ana.materials.stack import Stack
+from mems_ana.materials.elastic import IsoElastic
+from mems_ana.materials.piezo import PiezoMaterial
+from mems_ana.solver.static import StaticPlateSolver
+
+
+def make_test_stack(elec_area_ratio: float = 1.0) -> Stack:
+    si = IsoElastic(E=170e9, nu=0.28, rho=2330)
+    pzt = PiezoMaterial(E=60e9, nu=0.31, rho=7500, eps_r=1200, d31=-180e-12, tan_delta=0.02)
+    return Stack(si, 8e-6, pzt, 2e-6, elec_area_ratio)
+
+
+def test_simply_supported_full_electrode_navier():
+    """
+    SSSS + 全面電極: Navier 級数 w_c = 16 M/(π^2 D) Σ ±1 / (m n (kx^2 + ky^2))
+    """
+    plate = RectPlate(a=1.5e-3, b=1.0e-3)
+    stack = make_test_stack()
+    w = StaticPlateSolver(plate, stack, 41, 41, edges="SSSS").unit_deflections()[0]
+
+    props = stack.properties()
+    m = np.arange(1, 400, 2)[:, None]
+    n = np.arange(1, 400, 2)[None, :]
+    kx, ky = m * np.pi / plate.a, n * np.pi / plate.b
+    sign = (-1.0) ** ((m - 1) // 2 + (n - 1) // 2)
+    w_ref = 16.0 * props.moment_per_volt_full / (np.pi**2 * props.D) * np.sum(sign / (m * n * (kx**2 + ky**2)))
+
+    assert np.isclose(w[20, 20], w_ref, rtol=1e-3)
+
+
+def test_voltage_batch_is_linear_and_clamped_full_coverage_vanishes():
+    plate = RectPlate(a=1.5e-3, b=1.5e-3)
+    solver = StaticPlateSolver(plate, make_test_stack(0.5), 31, 31, edges="CCCC")
+
+    center = solver.default_electrode()
+    ring = 1.0 - center
+    V = np.array([[0.0, 0.0], [15.0, 0.0], [30.0, 0.0], [0.0, 30.0], [30.0, 30.0]])
+    W = solver.solve(V, np.stack([center, ring]))
+
+    assert W.shape == (5, 31, 31)
+    assert np.all(W[0] == 0.0)
+    assert np.allclose(W[2], 2.0 * W[1], rtol=1e-12, atol=0.0)
+    assert abs(W[2, 15, 15]) > 0.0
+    # center + ring = full coverage: no net moment on a clamped plate
+    assert np.allclose(W[4], 0.0, atol=1e-9 * np.abs(W[2]).max())
@@ -0,0 +1,149 @@
+import numpy as np
+
+import mems_ana.physics.stress as stress_mod
+from mems_ana.geometry.plate import RectPlate, RectPlateBatch
+from mems_ana.materials.stack import Stack, StackBatch
+from mems_ana.materials.elastic import IsoElastic
+from mems_ana.materials.piezo import PiezoMaterial
+from mems_ana.physics.stress import PlateStress, modal_field_tiles
+from mems_ana.rom.plate_rom import ModeSet, RectPlateROMBatch
+from mems_ana.solver.static import StaticPlateSolver
+
+
+def make_test_stack(elec_area_ratio: float = 1.0) -> Stack:
+    si = IsoElastic(E=170e9, nu=0.28, rho=2330)
+    pzt = PiezoMaterial(E=60e9, nu=0.31, rho=7500, eps_r=1200, d31=-180e-12, tan_delta=0.02)
+    return Stack(si, 8e-6, pzt, 2e-6, elec_area_ratio)
+
+
+def test_simply_supported_full_electrode_stress_trace():
+    """
+    SSSS + 全面電極: 内部で ∇²w = -M/D（一様モーメント）なので
+    上面の σ_xx + σ_yy = Q(1+ν)(z-z0) M/D - 2 Q ε0 が解析的に決まる
+    """
+    plate = RectPlate(a=1.5e-3, b=1.0e-3)
+    stack = make_test_stack()
+    solver = StaticPlateSolver(plate, stack, 41, 41, edges="SSSS")
+    ps = PlateStress.from_static(solver, np.ones((41, 41)), z="top")
+
+    props = stack.properties()
+    Q = stack.base.E / (1.0 - stack.base.nu**2)
+    V = 10.0
+    M = props.moment_per_volt_full * V
+    eps0 = stack.piezo.d31 * V / stack.t_pzt
+    trace_ref = Q * (1.0 + stack.base.nu) * (stack.t_total() - props.z0) * M / props.D - 2.0 * Q * eps0
+
+    s = ps.tensor(V)[0]
+    trace = s[0] + s[1]
+    assert np.allclose(trace[5:-5, 5:-5], trace_ref, rtol=1e-3)
+    # 中心は対称: τ_xy = 0
+    assert abs(s[2, 20, 20]) < 1e-9 * abs(trace_ref)
+
+
+def test_base_layer_stress_is_linear_through_thickness():
+    """
+    電極の無いベース層: 曲げひずみは (z - z0) に比例
+    """
+    plate = RectPlate(a=1.5e-3, b=1.5e-3)
+    stack = make_test_stack(0.5)
+    solver = StaticPlateSolver(plate, stack, 31, 31, edges="CCCC")
+    z0 = stack.properties().z0
+
+    bottom = PlateStress.from_static(solver, z="bottom", component="xx").fields(20.0)
+    inter = PlateStress.from_static(solver, z=stack.t_base, component="xx").fields(20.0)
+
+    assert np.abs(bottom).max() > 0.0
+    assert np.allclose(bottom, inter * (0.0 - z0) / (stack.t_base - z0), rtol=1e-12, atol=0.0)
+
+
+def test_voltage_batch_and_fused_metrics_match_direct(monkeypatch):
+    """
+    電圧バッチ = 電圧ごとの計算、ブロック分割したメトリクス = 素直な計算
+    """
+    plate = RectPlate(a=1.5e-3, b=1.5e-3)
+    stack = make_test_stack(0.5)
+    solver = StaticPlateSolver(plate, stack, 31, 31, edges="CCCC")
+    ps = PlateStress.from_static(solver)
+
+    V = np.array([0.0, 15.0, 30.0, 15.0, -30.0])
+    vm = ps.fields(V)
+    assert vm.shape == (5, 31, 31)
+    assert np.all(vm[0] == 0.0)
+    assert np.allclose(vm[2], 2.0 * vm[1], rtol=1e-12, atol=0.0)
+    assert np.allclose(vm[4], vm[2], rtol=1e-12, atol=0.0)
+
+    # ε_zz = -ν/E (σ_xx + σ_yy)
+    s = ps.tensor(V)
+    ezz = ps.strain(V, "zz")
+    assert np.allclose(ezz, -stack.base.nu / stack.base.E * (s[:, 0] + s[:, 1]))
+
+    th = np.array([0.5, 1.0]) * vm[2].mean()
+    w = solver.grid.node_weights() / plate.area()
+    monkeypatch.setattr(stress_mod, "_BLOCK_VALUES", 2 * 3 * 31 * 31)  # 2 voltages per block
+    m = ps.metrics(V, th)
+
+    assert np.allclose(m.max_abs, vm.max(axis=(1, 2)))
+    assert np.allclose(m.mean_abs, (vm * w).sum(axis=(1, 2)) / w.sum())
+    for j, t in enumerate(th):
+        assert np.allclose(m.area_fraction[:, j], ((vm > t) * w).sum(axis=(1, 2)) / w.sum())
+    assert m.area_fraction.shape == (5, 2)
+    assert np.isclose(m.concentration[2], vm[2].max() / ((vm[2] * w).sum() / w.sum()))
+    assert m.concentration[0] == 0.0
+    assert ps.metrics(V, th[0]).area_fraction.shape == (5,)
+
+
+def test_modal_stress_tiles_match_static_ssss():
+    """
+    modal_field_tiles の応力 (静的, 全面電極) が SSSS 有限差分の PlateStress と一致し、
+    設計 (t_pzt) ごとに物理的なスケールで変わる
+    """
+    plate = RectPlate(a=1.5e-3, b=1.0e-3)
+    base = make_test_stack()
+    stacks = [Stack(base.base, 8e-6, base.piezo, t, 1.0) for t in (1e-6, 3e-6)]
+    batch = RectPlateROMBatch(
+        RectPlateBatch(a=np.full(2, plate.a), b=np.full(2, plate.b)),
+        StackBatch.from_stacks(stacks),
+        modes=ModeSet.lowest(400, plate),
+    )
+    V_rms = 10.0
+    inner = (slice(4, -4), slice(4, -4))  # 級数の Gibbs 振動が大きい縁の数行を除く
+
+    for comp in ("xx", "von_mises"):
+        tiles = list(modal_field_tiles(batch, V_rms, nx=41, ny=41, component=comp, tile_values=41 * 20))
+        sig = np.concatenate([t[2] for t in tiles], axis=1).reshape(2, 41, 41)
+        for i, stack in enumerate(stacks):
+            solver = StaticPlateSolver(plate, stack, 41, 41, edges="SSSS")
+            ref = PlateStress.from_static(solver, np.ones((41, 41)), component=comp).fields(V_rms * np.sqrt(2.0))[0]
+            scale = np.abs(ref[inner]).max()
+            assert np.max(np.abs(sig[i][inner] - ref[inner])) < 0.06 * scale
+            assert np.isclose(sig[i][20, 20], ref[20, 20], rtol=2e-2)
+        assert not np.isclose(sig[0][20, 20], sig[1][20, 20], rtol=0.5)
+
+
+def test_dynamic_von_mises_is_peak_over_cycle():
+    """
+    位相のずれた応力フェーザの von Mises = 時間波形 Re(S e^{jθ}) の 1 周期中の最大値
+    （各成分の振幅から作った値ではない）。位相が揃っていれば実数場の値と同じ
+    """
+    rng = np.random.default_rng(0)
+    S = rng.standard_normal((3, 500)) + 1j * rng.standard_normal((3, 500))
+    theta = np.linspace(0.0, np.pi, 4001)[:, None]
+    ph = np.exp(1j * theta)
+    brute = stress_mod._von_mises(*((c * ph).real for c in S)).max(axis=0)
+    peak = stress_mod._von_mises_peak(*S)
+    assert np.allclose(peak, brute, rtol=1e-6)
+    assert not np.allclose(peak, stress_mod._von_mises(*np.abs(S)), rtol=1e-2)
+
+    real = rng.standard_normal((3, 50))
+    assert np.allclose(stress_mod._von_mises_peak(*(real * np.exp(0.7j))), stress_mod._von_mises(*real), rtol=1e-12)
+
+    # タイル: 共振間の動的駆動でも有限で、静的に近い低周波では静的な値に一致
+    plate = RectPlate(a=1.5e-3, b=1.0e-3)
+    batch = RectPlateROMBatch(
+        RectPlateBatch(a=np.array([plate.a]), b=np.array([plate.b])),
+        StackBatch.from_stacks([make_test_stack(0.5)]),
+        modes=ModeSet.lowest(12, plate),
+    )
+    static = next(modal_field_tiles(batch, 10.0, 0.0, nx=21, ny=21, tile_values=1 << 20))[2]
+    slow = next(modal_field_tiles(batch, 10.0, 1.0, 0.02, nx=21, ny=21, tile_values=1 << 20))[2]
+    assert np.allclose(slow, static, rtol=1e-6)
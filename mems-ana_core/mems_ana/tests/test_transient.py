@@ -0,0 +1,53 @@
+import numpy as np
+
+from mems_ana.geometry.plate import RectPlate
+from mems_ana.materials.stack import Stack
+from mems_ana.materials.elastic import IsoElastic
+from mems_ana.materials.piezo import PiezoMaterial
+from mems_ana.rom.modal_system import ModalSystem
+from mems_ana.rom.plate_rom import RectPlateROM
+from mems_ana.solver.transient import ModalTransient, simulate_chunks
+
+
+def make_test_rom() -> RectPlateROM:
+    plate = RectPlate(a=1.5e-3, b=1.5e-3)
+    si = IsoElastic(E=170e9, nu=0.28, rho=2330)
+    pzt = PiezoMaterial(E=60e9, nu=0.31, rho=7500, eps_r=1200, d31=-180e-12, tan_delta=0.02)
+    stack = Stack(si, 8e-6, pzt, 2e-6, 0.8)
+    return RectPlateROM(plate, stack)
+
+
+def test_sine_steady_state_matches_frf():
+    """
+    正弦駆動の定常振幅が FRF (ピーク uz, RMS I) と一致すること
+    """
+    rom = make_test_rom()
+    f0 = rom.modal_omegas()[0] / (2.0 * np.pi)
+    f_drive, V_rms, dt = 0.97 * f0, 10.0, 1e-7
+    sim = ModalTransient.from_rom(rom, dt, zeta=0.02)
+
+    V_pk = np.sqrt(2.0) * V_rms
+    drive = lambda t: V_pk * np.sin(2.0 * np.pi * f_drive * t)
+    *_, (t, uz, I) = simulate_chunks(sim, drive, n_steps=100_000, chunk_size=20_000)
+
+    uz_ref, I_ref = rom.frf_center_spectrum(V_rms, f_drive, 0.02)
+    assert np.isclose(np.abs(uz).max(), abs(uz_ref), rtol=1e-3)
+    assert np.isclose(np.abs(I).max() / np.sqrt(2.0), abs(I_ref), rtol=1e-3)
+
+
+def test_chunking_does_not_change_response():
+    rom = make_test_rom()
+    v = np.random.default_rng(0).normal(size=50_000)
+
+    uz_once, I_once = ModalTransient.from_rom(rom, 1e-7).process(v)
+    chunks = list(simulate_chunks(ModalTransient.from_rom(rom, 1e-7), v, chunk_size=7_777))
+
+    assert np.allclose(np.concatenate([c[1] for c in chunks]), uz_once, rtol=0, atol=1e-12 * np.abs(uz_once).max())
+    assert np.array_equal(np.concatenate([c[2] for c in chunks]), I_once)
+    assert np.allclose(np.concatenate([c[0] for c in chunks]), np.arange(v.size) * 1e-7)
+
+
+def test_static_limit_for_any_damping():
+    sim = ModalTransient(ModalSystem([1e5, 1e5, 1e5], [0.5, 1.0, 2.0], [1.0, 1.0, 1.0], [1.0, 1.0, 1.0]), 1e-7)
+    uz, _ = sim.process(np.ones(400_000))
+    assert np.isclose(uz[-1], 3.0 / 1e5**2, rtol=1e-9)
@@ -0,0 +1,68 @@
+import numpy as np
+
+from mems_ana.geometry.plate import RectPlate
+from mems_ana.materials.stack import Stack
+from mems_ana.materials.elastic import IsoElastic
+from mems_ana.materials.piezo import PiezoMaterial
+from mems_ana.rom.plate_rom import RectPlateROM, ModeSet
+from mems_ana.physics.piezo_coupling import PiezoCoupling
+from mems_ana.physics.plate_theory import omega_mn_simply_supported
+from mems_ana.solver.static import StaticPlateSolver
+
+
+def make_test_rom(K_W: float = 8.0, elec_area_ratio: float = 0.6) -> RectPlateROM:
+    plate = RectPlate(a=1.5e-3, b=1.0e-3)
+    si = IsoElastic(E=170e9, nu=0.28, rho=2330)
+    pzt = PiezoMaterial(E=60e9, nu=0.31, rho=7500, eps_r=1200, d31=-180e-12, tan_delta=0.02)
+    stack = Stack(si, 8e-6, pzt, 2e-6, elec_area_ratio)
+    return RectPlateROM(plate, stack, ModeSet.lowest(12, plate, stack), K_W=K_W)
+
+
+def test_coupled_current_independent_of_kw():
+    """
+    K_W は uz のみをスケールし、結合込みの電流 I は変えない
+    """
+    f = np.linspace(1e3, 400e3, 800)
+    uz1, I1 = make_test_rom(K_W=1.0).frf_center_spectrum(5.0, f, coupled=True)
+    uz2, I2 = make_test_rom(K_W=2.0).frf_center_spectrum(5.0, f, coupled=True)
+    uz0, I0 = make_test_rom(K_W=1.0).frf_center_spectrum(5.0, f)
+
+    assert np.allclose(I1, I2, rtol=1e-12)
+    assert np.allclose(uz2, 2.0 * uz1, rtol=1e-12)
+    assert np.allclose(uz1, uz0, rtol=1e-12)
+    assert np.abs(I1 - I0).max() > 1e-3 * np.abs(I0).max()
+
+
+def test_admittance_limits():
+    """
+    低周波: Im(Y)/ω → 自由容量 C0 + Σθ²/K、共振–反共振の間隔 ≈ k_eff^2
+    """
+    rom = make_test_rom()
+    c = rom.coupling()
+
+    Y_low = c.admittance(10.0, zeta=1e-4)
+    assert np.isclose(Y_low.imag / (2.0 * np.pi * 10.0), c.free_capacitance(), rtol=1e-6)
+
+    f_r = c.omega_n[0] / (2.0 * np.pi)
+    f = np.linspace(0.98 * f_r, 1.1 * f_r, 200_001)
+    Y = np.abs(PiezoCoupling(c.omega_n, c.theta, c.modal_mass, c.C0).admittance(f, zeta=1e-5))
+    f_res, f_anti = f[np.argmax(Y)], f[np.argmin(Y)]
+    k2 = 1.0 - (f_res / f_anti) ** 2
+    assert np.isclose(k2, c.k_eff2()[0], rtol=5e-2)
+
+
+def test_modal_force_matches_static_fd_solver():
+    """
+    θ_k から組んだ静的モード和 (SS 振動数) が有限差分 SSSS 解と一致すること
+    """
+    rom = make_test_rom()
+    rom = RectPlateROM(rom.plate, rom.stack, ModeSet.lowest(300, rom.plate, rom.stack))
+    c = rom.coupling()
+
+    props = rom.stack.properties()
+    w_ss = omega_mn_simply_supported(props.D, props.areal_mass, rom.plate.a, rom.plate.b,
+                                     rom.modes.m.astype(float), rom.modes.n.astype(float))
+    w_modal = np.sum(c.theta / (c.modal_mass * w_ss**2) * rom.center_participation())
+
+    w_fd = StaticPlateSolver(rom.plate, rom.stack, 81, 81, edges="SSSS").unit_deflections()[0][40, 40]
+    assert np.isclose(w_modal, w_fd, rtol=2e-2)
@@ -0,0 +1,143 @@
+# examples/animate_uz_map_d33.py
+# -*- coding: utf-8 -*-
+"""
+animate_uz_map_d33.py
+
+Purpose:
+- animate_uz_midplane_typical_d33.py と同じ駆動・同じ ABSOLUTE uz(V) を、
+  上から見た uz(x,y) ヒートマップ（固定カラースケール 0..500 nm）としてアニメーション化する。
+- 描画は mems_ana.viz.FieldRaster（カラーマップ LUT → RGB、Pillow で注記とカラーバー）。
+  matplotlib の 3D 描画を通さないので、1 フレーム数 ms（10 サイクル 1401 フレームで 10 秒弱、GIF は固定パレットで減色）。
+
+Annotation (analysis-items.md §9):
+- 電圧・枝・サイクル番号を各フレームに表示（例: Vtop=+15.00 V (rising) | cycle 4 / 10）
+
+Output:
+- ANIM_FORMAT = ".gif" | ".mp4"（ffmpeg が必要）| ".png"（連番 PNG: <stem>_00000.png, ...）
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import time
+
+import numpy as np
+
+# ---- import safety ----
+try:
+    from mems_ana.ferroelectric import HysteresisLUT, make_closed_loop
+    from mems_ana.viz import FieldRaster, open_writer, render_animation
+except ModuleNotFoundError:  # pragma: no cover
+    import sys
+    repo_root = Path(__file__).resolve().parents[1]
+    sys.path.insert(0, str(repo_root / "src"))
+    from mems_ana.ferroelectric import HysteresisLUT, make_closed_loop
+    from mems_ana.viz import FieldRaster, open_writer, render_animation
+
+
+# =========================
+# Geometry / grid（animate_uz_midplane_typical_d33.py と統一）
+# =========================
+Lx = 200e-6      # [m]
+Wy = 500e-6      # [m]
+t_pzt = 1.2e-6   # [m]
+nx, ny = 120, 160
+
+Vmax = 30.0
+Vmid = 15.0
+n_cycles = 10
+N_SEG = 14
+
+Pm_uC_cm2 = 42.0
+Pr_target_uC_cm2 = 30.0
+Ec_V_per_m = 5e6
+
+d33 = 250e-12      # [m/V]
+Q = 0.03           # [m^4/C^2]
+
+UZ_MAX_NM = 500.0
+TARGET_PEAK_NM = 500.0
+
+# =========================
+# Output
+# =========================
+ANIM_FORMAT = ".gif"
+FRAME_MS = 110
+PIXELS_PER_CELL = 2
+
+
+def shape_xy(X: np.ndarray, Y: np.ndarray, Lx_: float, Wy_: float) -> np.ndarray:
+    """x端支持（sin^2）/ y端自由（弱いy変化のみ）"""
+    sx = np.sin(np.pi * X / Lx_) ** 2
+    a = 0.20
+    sy = 1.0 - a * (1.0 + np.cos(2.0 * np.pi * Y / Wy_)) / 2.0
+    return sx * sy
+
+
+def make_path_from_keys(keys: list[float], n_seg: int) -> np.ndarray:
+    out = [np.linspace(a, b, n_seg, endpoint=False) for a, b in zip(keys[:-1], keys[1:])]
+    out.append(np.array([keys[-1]]))
+    return np.concatenate(out)
+
+
+def main() -> None:
+    out_anims = Path("outputs") / "anims"
+    out_anims.mkdir(parents=True, exist_ok=True)
+    anim_path = out_anims / f"uz_map_d33_10cycles{ANIM_FORMAT}"
+
+    x = np.linspace(0, Lx, nx)
+    y = np.linspace(0, Wy, ny)
+    X, Y = np.meshgrid(x, y, indexing="xy")
+    S = shape_xy(X, Y, Lx, Wy)
+
+    Ez_max = Vmax / t_pzt
+    loop = make_closed_loop(
+        np.linspace(-Ez_max, +Ez_max, 3000),
+        Ec_V_per_m=Ec_V_per_m,
+        Pm_uC_cm2=Pm_uC_cm2,
+        Pr_target_uC_cm2=Pr_target_uC_cm2,
+        Es_V_per_m=None,
+        n_jump=160,
+    )
+    lut = HysteresisLUT.from_loop(loop, t_pzt_m=t_pzt, Pm_uC_cm2=Pm_uC_cm2, d33_m_per_V=d33, Q_m4_per_C2=Q)
+    G = TARGET_PEAK_NM / (float(lut.uz_nm(+Vmax, True)) * float(S.max()))
+
+    # 1 cycle: -30 -> Vc(up) -> +30 -> Vc(down) -> -30（typical と同じ key 列）
+    keys_one_cycle = [-Vmax, -Vmid, lut.Vc_up, 0.0, +Vmid, +Vmax, +Vmid, lut.Vc_down, 0.0, -Vmid, -Vmax]
+    V_one = make_path_from_keys(keys_one_cycle, N_SEG)
+    n_one = len(V_one) - 1
+    V_seq = np.concatenate([V_one] + [V_one[1:]] * (n_cycles - 1))
+    d = np.diff(V_seq)
+    up_seq = np.append(d, d[-1]) >= 0
+    cycle_seq = np.minimum(np.maximum(np.arange(len(V_seq)) - 1, 0) // n_one, n_cycles - 1) + 1
+
+    # 全フレームのピーク uz を一括評価（場は u0 * S）
+    u0_nm_seq = lut.uz_nm(V_seq, up_seq) * G
+
+    raster = FieldRaster(
+        S.shape,
+        vmin=0.0, vmax=UZ_MAX_NM,
+        scale=PIXELS_PER_CELL,
+        label="uz [nm]",
+        ticks=[0, 100, 200, 300, 400, 500],
+        title=f"uz(x,y) top view | {Lx*1e6:.0f} × {Wy*1e6:.0f} µm\nColor: 0–{UZ_MAX_NM:.0f} nm (fixed)",
+        n_text_lines=1,
+    )
+
+    def render(i: int) -> np.ndarray:
+        U_nm = np.clip(u0_nm_seq[i] * S, 0.0, None)
+        branch = "rising" if up_seq[i] else "falling"
+        return raster.render(U_nm, f"Vtop={V_seq[i]:+.2f} V ({branch}) | cycle {cycle_seq[i]} / {n_cycles}")
+
+    # 固定パレットは GIF のみ（他のライターに渡すと TypeError）
+    options = {"palette": raster.palette} if ANIM_FORMAT == ".gif" else {}
+
+    t0 = time.perf_counter()
+    with open_writer(anim_path, fps=1000.0 / FRAME_MS, **options) as writer:
+        n = render_animation(range(len(V_seq)), render, writer)
+    print(f"{n} frames in {time.perf_counter() - t0:.2f} s")
+    print(f"Saved: {anim_path.resolve()}")
+
+
+if __name__ == "__main__":
+    main()
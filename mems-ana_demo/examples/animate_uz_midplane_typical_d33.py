@@ -9,7 +9,7 @@ Purpose:
 - モデル式（8枚と統一）:
     S(E) = d33*(P/Pm)*E + Q*P(E)^2
     uz(V) ≈ S(E)*t_pzt
-  ※ P(E) は make_closed_loop の up/down 枝を使用
+  ※ P(E) は make_closed_loop の up/down 枝を使用（HysteresisLUT で全フレーム一括評価）
 
 Display (8枚と統一):
 - 正のみ表示: U_nm = clip(U_nm, 0, +inf)
@@ -18,28 +18,38 @@ Display (8枚と統一):
 - x-edges supported / y-edges free の shape_xy を使用
 - V–I: 電流 I はモデル化しない（Vのみ）
 
+Hysteresis (HYSTERESIS):
+- "loop"    : make_closed_loop の up/down 枝を傾きの符号で選択（既定、公開 GIF と同じ）
+- "preisach": PreisachModel で V(t) の履歴から P を逐次計算（部分反転・マイナーループも正しく扱う）
+              ※ Preisach のループは反時計回り（物理的な向き）なので Vc(up) の符号が "loop" と逆。
+                掃引のキー電圧 Vc(up/down) も Preisach の主ループから取る
+
+Render / output:
+- mems_ana.viz: 図は 1 つを使い回し（曲面の頂点と色だけ更新）、フレームは逐次 GIF/MP4 へ
+  エンコード（全フレームをメモリに溜めない）。WORKERS>1 でチャンク並列描画。
+- 同じ (V, 枝) 状態のフレームは 1 回だけ描画・エンコードして再利用（frame_key）
+  → 描画コストは「サイクル数 × フレーム数」ではなくユニーク状態数に比例
+
 Drive (V側):
 - 1サイクルを「上り→下り」で連続に掃引（10サイクル）
-- Vc(up), Vc(down) は P=0 になる電圧（up/down枝別）をループから自動推定して使用
+- Vc(up), Vc(down) は P=0 になる電圧（up/down枝別）を、使うヒステリシスモデルのループから自動推定して使用
 """
 
 from __future__ import annotations
 
 from pathlib import Path
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib as mpl
-from matplotlib.colors import Normalize
-from PIL import Image
 
 # ---- import safety ----
 try:
-    from mems_ana.ferroelectric import make_closed_loop
+    from mems_ana.ferroelectric import HysteresisLUT, PreisachModel, make_closed_loop, strain_from_P
+    from mems_ana.viz import SurfaceRenderer, open_writer, render_animation
 except ModuleNotFoundError:  # pragma: no cover
     import sys
     repo_root = Path(__file__).resolve().parents[1]
     sys.path.insert(0, str(repo_root / "src"))
-    from mems_ana.ferroelectric import make_closed_loop
+    from mems_ana.ferroelectric import HysteresisLUT, PreisachModel, make_closed_loop, strain_from_P
+    from mems_ana.viz import SurfaceRenderer, open_writer, render_animation
 
 
 # =========================
@@ -58,6 +68,8 @@ Vmid = 15.0
 
 n_cycles = 10
 
+HYSTERESIS = "loop"  # "loop" | "preisach"
+
 # 連続スイープの滑らかさ（増やすほど滑らか・重くなる）
 N_SEG = 14  # 1区間あたりの分割
 
@@ -86,6 +98,14 @@ Z_EXAG = 60.0
 VIEW_ELEV = 28
 VIEW_AZIM = -60
 
+# =========================
+# Output
+# =========================
+ANIM_FORMAT = ".gif"  # ".gif" | ".mp4"（mp4 は ffmpeg が必要）
+FRAME_MS = 110
+WORKERS = 1           # >1 でフレームをチャンクごとに並列描画（None = 全コア）
+U_KEY_NM = 1e-3       # 同一フレームとみなす uz ピーク差（状態キーの量子化幅）
+
 
 def shape_xy(X: np.ndarray, Y: np.ndarray, Lx_: float, Wy_: float) -> np.ndarray:
     """
@@ -111,7 +131,6 @@ def build_loop() -> dict[str, np.ndarray]:
         Es_V_per_m=None,
         n_jump=160,
     )
-    loop["Ez_sweep_V_per_m"] = Ez_sweep
 
     print(f"Ec = {Ec_V_per_m/1e6:.2f} MV/m, Es = {loop['Es_V_per_m']/1e6:.2f} MV/m")
     print(f"Pr (rising)  @E≈0 = {loop['Pr_rising_uC_cm2']:.2f} µC/cm²")
@@ -119,65 +138,14 @@ def build_loop() -> dict[str, np.ndarray]:
     return loop
 
 
-def interp_P_uC_cm2(Ez: float, loop: dict[str, np.ndarray], branch: str) -> float:
-    Ez_grid = loop["Ez_sweep_V_per_m"]
-    if branch == "up":
-        return float(np.interp(Ez, Ez_grid, loop["P_up_uC_cm2"]))
-    if branch == "down":
-        return float(np.interp(Ez, Ez_grid, loop["P_down_uC_cm2"]))
-    raise ValueError("branch must be 'up' or 'down'")
-
-
-def find_Vc_from_P0(loop: dict[str, np.ndarray], branch: str) -> float:
-    """
-    P(E)=0 となる電圧 Vc を、枝ごとに推定する。
-    （8枚の Vc(up), Vc(down) に合わせるため）
-    """
-    Ez = loop["Ez_sweep_V_per_m"]
-    if branch == "up":
-        P = loop["P_up_uC_cm2"]
-    elif branch == "down":
-        P = loop["P_down_uC_cm2"]
-    else:
-        raise ValueError("branch must be 'up' or 'down'")
-
-    s = np.sign(P)
-    idx = np.where(np.diff(s) != 0)[0]
-    if len(idx) == 0:
-        # 交差が取れない場合は 0V 扱い
-        return 0.0
-
-    i = int(idx[np.argmin(np.abs(Ez[idx]))])  # 0付近の交差を優先
-    # 線形補間で P=0
-    E0, E1 = Ez[i], Ez[i + 1]
-    P0, P1 = P[i], P[i + 1]
-    if abs(P1 - P0) < 1e-30:
-        Ez0 = E0
-    else:
-        Ez0 = E0 + (0.0 - P0) * (E1 - E0) / (P1 - P0)
-
-    Vc = Ez0 * t_pzt
-    return float(Vc)
-
-
-def uz_abs_nm_from_V(V: float, loop: dict[str, np.ndarray], branch: str) -> float:
+def build_lut(loop: dict[str, np.ndarray]) -> HysteresisLUT:
     """
     ABSOLUTE uz(V)（8枚/バタフライと統一）
-      S = d33*(P/Pm)*E + Q*P^2
+      S = d33*(P/Pm)*E + Q*P^2      ★Q*P^2（Ez^2ではない）
       uz = S*t_pzt
+    Vc(up), Vc(down)（P=0 となる電圧）も LUT 側で推定済み。
     """
-    Ez = V / t_pzt
-
-    P_uC_cm2 = interp_P_uC_cm2(Ez, loop, branch)
-    P = P_uC_cm2 * 0.01         # 1 µC/cm² = 0.01 C/m²
-    Pm = Pm_uC_cm2 * 0.01
-
-    d33_eff = d33 * (P / Pm)
-    S_lin = d33_eff * Ez
-    S_q = Q * (P * P)           # ★ここが重要：Q*P^2（Ez^2ではない）
-
-    uz_m = (S_lin + S_q) * t_pzt
-    return float(uz_m * 1e9)    # [nm]
+    return HysteresisLUT.from_loop(loop, t_pzt_m=t_pzt, Pm_uC_cm2=Pm_uC_cm2, d33_m_per_V=d33, Q_m4_per_C2=Q)
 
 
 def make_path_from_keys(keys: list[float], n_seg: int) -> np.ndarray:
@@ -191,37 +159,94 @@ def make_path_from_keys(keys: list[float], n_seg: int) -> np.ndarray:
     return np.concatenate(out)
 
 
-def pick_branch_by_slope(V_prev: float, V_now: float, V_next: float | None) -> str:
+def rising_by_slope(V_seq: np.ndarray) -> np.ndarray:
     """
-    フレームの枝判定（上り/下り）：
+    フレームの枝判定（上り=True / 下り=False）：
     - 次があれば (V_next - V_now) の符号
     - 次が無ければ (V_now - V_prev) の符号
     """
-    if V_next is None:
-        d = V_now - V_prev
-    else:
-        d = V_next - V_now
-    return "up" if d >= 0 else "down"
+    d = np.diff(V_seq)
+    return np.append(d, d[-1]) >= 0
+
+
+def grid_xy() -> tuple[np.ndarray, np.ndarray]:
+    x = np.linspace(0, Lx, nx)
+    y = np.linspace(0, Wy, ny)
+    return np.meshgrid(x, y, indexing="xy")
+
+
+_RENDER: dict = {}  # プロセスごとに 1 回だけ作る（図・shape）
+
+
+def render_frame(spec: tuple[float, float, bool]) -> np.ndarray:
+    """
+    spec = (u0_nm, Vtop, rising) → RGB フレーム。
+    モジュール関数なので並列ワーカーでも使えます（各ワーカーが自分の図を持つ）。
+    """
+    if not _RENDER:
+        X, Y = grid_xy()
+        _RENDER["S"] = shape_xy(X, Y, Lx, Wy)
+        _RENDER["renderer"] = SurfaceRenderer(
+            X * 1e6, Y * 1e6,
+            vmin=0.0, vmax=UZ_MAX_NM,
+            z_scale=Z_EXAG / 1000.0,  # 描画Z（nm->µm、さらにZ_EXAG倍）、ラベルは nm
+            zticks=[0, 250, 500],
+            xlabel="x [µm]", ylabel="y [µm]", zlabel="uz [nm]",
+            box_aspect=(1.0, (Wy / Lx), 0.35),  # 効く環境では y/x 比を保持
+            view=(VIEW_ELEV, VIEW_AZIM),
+            figsize=(6.2, 4.8),
+        )
+
+    u0_nm, V, up = spec
+    U_nm = u0_nm * _RENDER["S"]
+    if POSITIVE_ONLY:
+        U_nm = np.clip(U_nm, 0.0, None)
+
+    # タイトル（V–I表記を含める）
+    branch_str = "rising" if up else "falling"
+    title = (
+        "d33-dominated uz(x,y) (positive-only) | ABSOLUTE uz(V) consistent with butterfly\n"
+        f"S=d33*(P/Pm)*E + Q*P^2 | Color: 0–{UZ_MAX_NM:.0f} nm | z(true): 0–{UZ_MAX_NM:.0f} nm | Z_EXAG={Z_EXAG:.0f}\n"
+        f"V–I: current I not modeled | Vtop={V:+.2f} V ({branch_str})"
+    )
+    return _RENDER["renderer"].render(U_nm, title)
+
+
+def frame_key(spec: tuple[float, float, bool]) -> tuple[str, bool, int]:
+    """
+    フレームの状態キー（量子化した物理状態）。
+    同じ電圧・同じ枝なら同じ応力/変位場（analysis-items.md §9）なので、
+    2 サイクル目以降の同一状態は 1 サイクル目の描画を再利用します。
+    - V: タイトル表示と同じ 0.01 V
+    - u0: U_KEY_NM 刻み（preisach で初回サイクルだけ状態が違う場合も区別される）
+    """
+    u0_nm, V, up = spec
+    return f"{V:+.2f}", bool(up), int(round(u0_nm / U_KEY_NM))
 
 
 def main() -> None:
     out_anims = Path("outputs") / "anims"
     out_anims.mkdir(parents=True, exist_ok=True)
-    gif_path = out_anims / "uz_midplane_typical_d33_10cycles.gif"
+    anim_path = out_anims / f"uz_midplane_typical_d33_10cycles{ANIM_FORMAT}"
 
     # grid
-    x = np.linspace(0, Lx, nx)
-    y = np.linspace(0, Wy, ny)
-    X, Y = np.meshgrid(x, y, indexing="xy")
-    X_um = X * 1e6
-    Y_um = Y * 1e6
+    X, Y = grid_xy()
 
     # FE loop
-    loop = build_loop()
+    lut = build_lut(build_loop())
 
-    # Vc 推定（P=0）
-    Vc_up = find_Vc_from_P0(loop, branch="up")
-    Vc_down = find_Vc_from_P0(loop, branch="down")
+    # Vc 推定（P=0）: 使うモデルの主ループから
+    if HYSTERESIS == "preisach":
+        model = PreisachModel.from_tanh(
+            Ec_V_per_m=Ec_V_per_m, Pm_uC_cm2=Pm_uC_cm2, Pr_target_uC_cm2=Pr_target_uC_cm2,
+            E_max_V_per_m=Vmax / t_pzt,
+        )
+        Ec_up, Ec_down = model.coercive_fields()
+        Vc_up, Vc_down = Ec_up * t_pzt, Ec_down * t_pzt
+    elif HYSTERESIS == "loop":
+        Vc_up, Vc_down = lut.Vc_up, lut.Vc_down
+    else:
+        raise ValueError("HYSTERESIS must be 'loop' or 'preisach'")
     print(f"Vc(up)   (P=0) = {Vc_up:+.2f} V")
     print(f"Vc(down) (P=0) = {Vc_down:+.2f} V")
 
@@ -230,7 +255,7 @@ def main() -> None:
     Smax = float(S.max())
 
     # gain calibration（8枚と同一思想：shape最大点で +30V(rising) を 500nm に合わせる）
-    raw_u0_nm = uz_abs_nm_from_V(+Vmax, loop, branch="up")
+    raw_u0_nm = float(lut.uz_nm(+Vmax, True))
     raw_peak_nm = raw_u0_nm * Smax
     if raw_peak_nm <= 0:
         G = 1.0
@@ -257,96 +282,24 @@ def main() -> None:
         V_seq.append(V_one[1:])
     V_seq = np.concatenate(V_seq)
 
+    # 全フレームの枝と ABSOLUTE uz(V) (nm) を一括評価
+    up_seq = rising_by_slope(V_seq)
+    if HYSTERESIS == "preisach":
+        Ez_seq = V_seq / t_pzt
+        _, S3_seq = strain_from_P(Ez_seq, model.process(Ez_seq), Pm_uC_cm2=Pm_uC_cm2, d33_m_per_V=d33, Q_m4_per_C2=Q)
+        u0_nm_seq = S3_seq * t_pzt * 1e9 * G
+    else:
+        u0_nm_seq = lut.uz_nm(V_seq, up_seq) * G
+
     # =========================
-    # Display settings (8枚と統一)
+    # Render + encode (図は使い回し、フレームは逐次エンコーダへ)
     # =========================
-    cmap = mpl.colormaps["viridis"]
-    norm = Normalize(vmin=0.0, vmax=UZ_MAX_NM)
-
-    # zlim（真値0..500nm を、描画Z_EXAG込みの µm に変換）
-    zmax_plot_um = (UZ_MAX_NM / 1000.0) * Z_EXAG
-    tick_nm = [0, 250, 500]
-    tick_um_plot = [(t / 1000.0) * Z_EXAG for t in tick_nm]
-
-    frames: list[Image.Image] = []
-
-    for i, V in enumerate(V_seq):
-        V_prev = V_seq[i - 1] if i > 0 else V_seq[0]
-        V_next = V_seq[i + 1] if i < len(V_seq) - 1 else None
-        branch = pick_branch_by_slope(V_prev, V, V_next)
-
-        # ABSOLUTE uz(V) (nm)
-        u0_nm = uz_abs_nm_from_V(float(V), loop, branch=branch) * G
-        U_nm = (u0_nm * S)
-        if POSITIVE_ONLY:
-            U_nm = np.clip(U_nm, 0.0, None)
-
-        # 描画Z（nm->µm、さらにZ_EXAG倍）
-        Z_plot_um = (U_nm / 1000.0) * Z_EXAG
-        facecolors = cmap(norm(U_nm))
-
-        fig = plt.figure(figsize=(6.2, 4.8))
-        ax = fig.add_subplot(111, projection="3d")
-
-        ax.plot_surface(
-            X_um, Y_um, Z_plot_um,
-            facecolors=facecolors,
-            linewidth=0,
-            antialiased=True,
-            shade=False,
-        )
-
-        # 軸
-        ax.set_xlabel("x [µm]")
-        ax.set_ylabel("y [µm]")
-        ax.set_xlim(0, Lx * 1e6)
-        ax.set_ylim(0, Wy * 1e6)
-
-        ax.set_zlim(0.0, zmax_plot_um)
-        ax.set_zticks(tick_um_plot)
-        ax.set_zticklabels([str(t) for t in tick_nm])
-        ax.set_zlabel("uz [nm]")
-
-        # aspect（効く環境では y/x 比を保持）
-        try:
-            ax.set_box_aspect((1.0, (Wy / Lx), 0.35))
-        except Exception:
-            pass
-
-        ax.view_init(elev=VIEW_ELEV, azim=VIEW_AZIM)
-
-        # タイトル（V–I表記を含める）
-        branch_str = "rising" if branch == "up" else "falling"
-        fig.suptitle(
-            "d33-dominated uz(x,y) (positive-only) | ABSOLUTE uz(V) consistent with butterfly\n"
-            f"S=d33*(P/Pm)*E + Q*P^2 | Color: 0–{UZ_MAX_NM:.0f} nm | z(true): 0–{UZ_MAX_NM:.0f} nm | Z_EXAG={Z_EXAG:.0f}\n"
-            f"V–I: current I not modeled | frame {i+1}/{len(V_seq)} | Vtop={V:+.2f} V ({branch_str})",
-            fontsize=9.5,
-        )
-
-        # tight_layout は警告を出しやすいので避け、余白を固定
-        fig.subplots_adjust(left=0.00, right=1.00, bottom=0.00, top=0.78)
-
-        # frame capture
-        fig.canvas.draw()
-        w, h = fig.canvas.get_width_height()
-        buf = np.frombuffer(fig.canvas.buffer_rgba(), dtype=np.uint8).reshape(h, w, 4)[..., :3]
-        img = Image.fromarray(buf, "RGB").convert("P", palette=Image.ADAPTIVE)
-        frames.append(img)
-
-        plt.close(fig)
-
-    # save gif
-    frames[0].save(
-        gif_path,
-        save_all=True,
-        append_images=frames[1:],
-        duration=110,  # ms
-        loop=0,
-        optimize=True,
-    )
+    n = len(V_seq)
+    frames = ((float(u0_nm_seq[i]), float(V_seq[i]), bool(up_seq[i])) for i in range(n))
+    with open_writer(anim_path, fps=1000.0 / FRAME_MS) as writer:
+        render_animation(frames, render_frame, writer, key=frame_key, workers=WORKERS)
 
-    print(f"Saved: {gif_path.resolve()}")
+    print(f"Saved: {anim_path.resolve()}")
 
 
 if __name__ == "__main__":
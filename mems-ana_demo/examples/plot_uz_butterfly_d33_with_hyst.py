@@ -24,12 +24,12 @@ import matplotlib.pyplot as plt
 
 # ---- import safety: editable install無しでも動く ----
 try:
-    from mems_ana.ferroelectric import make_closed_loop
+    from mems_ana.ferroelectric import HysteresisLUT, make_closed_loop
 except ModuleNotFoundError:
     import sys
     repo_root = Path(__file__).resolve().parents[1]
     sys.path.insert(0, str(repo_root / "src"))
-    from mems_ana.ferroelectric import make_closed_loop
+    from mems_ana.ferroelectric import HysteresisLUT, make_closed_loop
 
 
 def main() -> None:
@@ -54,9 +54,8 @@ def main() -> None:
     V_up = np.linspace(-Vmax, +Vmax, n_half)  # rising
     V_dn = np.linspace(+Vmax, -Vmax, n_half)  # falling
     V_path = np.concatenate([V_up, V_dn[1:]])  # 重複点除去
-
-    Ez_path = V_path / t_pzt
     n_up = len(V_up)
+    up_path = np.arange(len(V_path)) < n_up  # 上り/下りで枝を切替
 
     # ============================
     # P(Ez) hysteresis parameters
@@ -77,33 +76,15 @@ def main() -> None:
         n_jump=200,
     )
 
-    P_up_uC_cm2 = loop["P_up_uC_cm2"]
-    P_dn_uC_cm2 = loop["P_down_uC_cm2"]
-
-    def interp_P(branch: np.ndarray, Ez_query: np.ndarray) -> np.ndarray:
-        return np.interp(Ez_query, Ez_sweep, branch)
-
-    # 上り/下りで枝を切替
-    P_up_path = interp_P(P_up_uC_cm2, Ez_path[:n_up])
-    P_dn_path = interp_P(P_dn_uC_cm2, Ez_path[n_up - 1 :])
-    P_path_uC_cm2 = np.concatenate([P_up_path, P_dn_path[1:]])
-
-    # 単位変換：1 µC/cm² = 0.01 C/m²
-    P_path_C_m2 = P_path_uC_cm2 * 0.01
-    Pm_C_m2 = Pm_uC_cm2 * 0.01
-
     # ============================
     # uz model (schematic)  ※元の形を維持
+    #   S3 = d33_0*(P/Pm)*Ez + Q*P^2 を全点まとめて評価（|P| <= Pm）
     # ============================
     d33_0 = 250e-12  # [m/V]
     Q = 0.03         # [m^4/C^2]
 
-    pol = np.clip(P_path_C_m2 / Pm_C_m2, -1.0, 1.0)
-    S_lin = d33_0 * pol * Ez_path
-    S_q = Q * (P_path_C_m2 ** 2)
-
-    uz_m = (S_lin + S_q) * t_pzt
-    uz_nm = uz_m * 1e9  # [nm]
+    lut = HysteresisLUT.from_loop(loop, t_pzt_m=t_pzt, Pm_uC_cm2=Pm_uC_cm2, d33_m_per_V=d33_0, Q_m4_per_C2=Q)
+    uz_nm = lut.uz_nm(V_path, up_path)  # [nm]
 
     # ============================
     # ここが今回の「簡単な要求」：縦軸を 0..500 nm に合わせる
@@ -13,7 +13,7 @@ Column order (match butterfly reading):
 Model (schematic, consistent with butterfly):
 - Vbot = 0 (GND), ΔV = Vtop - Vbot = Vtop      [V]
 - Ez = ΔV / t_pzt                              [V/m]
-- P(Ez) from hysteresis branches (make_closed_loop)
+- P(Ez) from hysteresis branches (make_closed_loop, evaluated via HysteresisLUT)
 - Strain (schematic):
     S3(E) = d33*(P/Pm)*Ez + Q*P^2
 - Displacement amplitude (unit-shape max):
@@ -34,6 +34,10 @@ Display:
 
 V–I note:
 - This script uses V only; current I is not modeled.
+
+Cache:
+- The loop and the 8 surfaces are stored in mems_ana.cache (keyed on every
+  parameter below); a re-run with the same parameters loads them via mmap.
 """
 
 from __future__ import annotations
@@ -46,12 +50,14 @@ from matplotlib.colors import Normalize
 
 # ---- import safety: editable install無しでも動く ----
 try:
-    from mems_ana.ferroelectric import make_closed_loop
+    from mems_ana.cache import ResultCache
+    from mems_ana.ferroelectric import HysteresisLUT, make_closed_loop
 except ModuleNotFoundError:
     import sys
     repo_root = Path(__file__).resolve().parents[1]
     sys.path.insert(0, str(repo_root / "src"))
-    from mems_ana.ferroelectric import make_closed_loop
+    from mems_ana.cache import ResultCache
+    from mems_ana.ferroelectric import HysteresisLUT, make_closed_loop
 
 
 # =========================
@@ -115,86 +121,66 @@ def shape_xy(X: np.ndarray, Y: np.ndarray, Lx_: float, Wy_: float) -> np.ndarray
     return sx * sy
 
 
-def build_loop() -> dict[str, np.ndarray]:
-    Ez_max = Vmax / t_pzt
-    Ez_sweep = np.linspace(-Ez_max, +Ez_max, 5000)
-
-    loop = make_closed_loop(
-        Ez_sweep,
-        Ec_V_per_m=Ec_V_per_m,
-        Pm_uC_cm2=Pm_uC_cm2,
-        Pr_target_uC_cm2=Pr_target_uC_cm2,
-        Es_V_per_m=None,
-        n_jump=200,
+def loop_params() -> dict[str, float]:
+    return dict(
+        Ez_max=Vmax / t_pzt, n_sweep=5000, n_jump=200,
+        Ec=Ec_V_per_m, Pm=Pm_uC_cm2, Pr_target=Pr_target_uC_cm2,
     )
-    loop["Ez_sweep_V_per_m"] = Ez_sweep
 
-    print(f"Ec = {Ec_V_per_m/1e6:.2f} MV/m, Es = {loop['Es_V_per_m']/1e6:.2f} MV/m")
-    print(f"Pr (rising)  @E≈0 = {loop['Pr_rising_uC_cm2']:.2f} µC/cm²")
-    print(f"Pr (falling) @E≈0 = {loop['Pr_falling_uC_cm2']:.2f} µC/cm²")
+
+def build_loop(cache: ResultCache) -> dict[str, np.ndarray]:
+    prm = loop_params()
+
+    def compute() -> dict[str, np.ndarray]:
+        Ez_sweep = np.linspace(-prm["Ez_max"], +prm["Ez_max"], prm["n_sweep"])
+        return make_closed_loop(
+            Ez_sweep,
+            Ec_V_per_m=Ec_V_per_m,
+            Pm_uC_cm2=Pm_uC_cm2,
+            Pr_target_uC_cm2=Pr_target_uC_cm2,
+            Es_V_per_m=None,
+            n_jump=prm["n_jump"],
+        )
+
+    loop = cache.get_or_compute(cache.key("make_closed_loop", prm), compute)
+
+    print(f"Ec = {Ec_V_per_m/1e6:.2f} MV/m, Es = {float(loop['Es_V_per_m'])/1e6:.2f} MV/m")
+    print(f"Pr (rising)  @E≈0 = {float(loop['Pr_rising_uC_cm2']):.2f} µC/cm²")
+    print(f"Pr (falling) @E≈0 = {float(loop['Pr_falling_uC_cm2']):.2f} µC/cm²")
     return loop
 
 
-def interp_P_uC_cm2(Ez: float, loop: dict[str, np.ndarray], branch: str) -> float:
-    Ez_grid = loop["Ez_sweep_V_per_m"]
-    if branch == "up":
-        P = loop["P_up_uC_cm2"]
-    elif branch == "down":
-        P = loop["P_down_uC_cm2"]
-    else:
-        raise ValueError("branch must be 'up' or 'down'")
-    return float(np.interp(Ez, Ez_grid, P))
+def build_lut(loop: dict[str, np.ndarray]) -> HysteresisLUT:
+    """P / d33_eff / S3 / uz lookups and Vc(up), Vc(down) on the loop's uniform Ez grid."""
+    return HysteresisLUT.from_loop(loop, t_pzt_m=t_pzt, Pm_uC_cm2=Pm_uC_cm2, d33_m_per_V=d33, Q_m4_per_C2=Q)
 
 
-def find_Vc_for_branch(loop: dict[str, np.ndarray], branch: str) -> float:
-    """
-    Find Vc for each branch where P(E)=0 (linear interpolation).
-    Returns Vtop [V] such that P≈0 on that branch.
+def compute_surfaces(lut: HysteresisLUT, X: np.ndarray, Y: np.ndarray) -> dict[str, np.ndarray]:
     """
-    Ez_grid = loop["Ez_sweep_V_per_m"]
-    if branch == "up":
-        P = loop["P_up_uC_cm2"]
-    elif branch == "down":
-        P = loop["P_down_uC_cm2"]
-    else:
-        raise ValueError("branch must be 'up' or 'down'")
-
-    # find sign change (or exact zero)
-    s = np.sign(P)
-    idx = np.where(s[:-1] * s[1:] <= 0)[0]
-    if len(idx) == 0:
-        # fallback: choose minimum |P|
-        i = int(np.argmin(np.abs(P)))
-        Ez0 = float(Ez_grid[i])
-        return float(Ez0 * t_pzt)
-
-    i = int(idx[0])
-    E1, E2 = float(Ez_grid[i]), float(Ez_grid[i + 1])
-    P1, P2 = float(P[i]), float(P[i + 1])
-
-    # linear interpolation to P=0
-    Ez0 = E1 + (0.0 - P1) * (E2 - E1) / (P2 - P1 + 1e-30)
-    return float(Ez0 * t_pzt)
-
-
-def uz_abs_nm_from_V(V: float, loop: dict[str, np.ndarray], branch: str) -> float:
+    Vc, gain G and the 8 surfaces [nm]:
+      U_top (4, ny, nx): rising  @ Vc(up),   0, +Vmid, +Vmax
+      U_bot (4, ny, nx): falling @ Vc(down), 0, -Vmid, -Vmax
     """
-    Absolute uz amplitude [nm] at unit-shape max (before shape(x,y)).
-    Consistent with butterfly: S3 = d33*(P/Pm)*E + Q*P^2
-    """
-    Ez = V / t_pzt
-    P_uC_cm2 = interp_P_uC_cm2(Ez, loop, branch)
-
-    # 1 µC/cm² = 0.01 C/m²
-    P = P_uC_cm2 * 0.01
-    Pm = Pm_uC_cm2 * 0.01
-
-    d33_eff = d33 * (P / Pm)   # P=0 -> d33_eff=0
-    S_lin = d33_eff * Ez
-    S_q = Q * (P ** 2)         # P=0 -> 0
+    # shape
+    S = shape_xy(X, Y, Lx, Wy)
+    Smax = float(np.max(S))
 
-    uz_m = (S_lin + S_q) * t_pzt
-    return float(uz_m * 1e9)   # [nm]
+    # ---- mechanical gain calibration (match butterfly scaling)
+    # peak on surface at (+30V, rising) should be TARGET_PEAK_NM (at shape max)
+    raw_peak_surface_nm = float(lut.uz_nm(+Vmax, True)) * Smax
+    G = 1.0 if raw_peak_surface_nm <= 0 else TARGET_PEAK_NM / raw_peak_surface_nm
+
+    # ---- all 8 amplitudes in one call, then surfaces in nm
+    V = np.array([lut.Vc_up, 0.0, +Vmid, +Vmax, lut.Vc_down, 0.0, -Vmid, -Vmax])
+    up = np.repeat([True, False], 4)
+    U_nm = (lut.uz_nm(V, up) * G)[:, None, None] * S
+    if POSITIVE_ONLY:
+        np.clip(U_nm, 0.0, None, out=U_nm)
+
+    return dict(
+        Vc_up=lut.Vc_up, Vc_dn=lut.Vc_down, G=G, raw_peak_surface_nm=raw_peak_surface_nm,
+        U_top=U_nm[:4], U_bot=U_nm[4:],
+    )
 
 
 def main() -> None:
@@ -211,45 +197,32 @@ def main() -> None:
     Lx_um = Lx * 1e6
     Wy_um = Wy * 1e6
 
-    # loop + Vc
-    loop = build_loop()
-    Vc_up = find_Vc_for_branch(loop, "up")
-    Vc_dn = find_Vc_for_branch(loop, "down")
+    # loop + surfaces (cached on all model / grid parameters)
+    cache = ResultCache()
+    loop = build_loop(cache)
+    prm = dict(
+        loop=loop_params(), Lx=Lx, Wy=Wy, t_pzt=t_pzt, nx=nx, ny=ny, Vmax=Vmax, Vmid=Vmid,
+        d33=d33, Q=Q, positive_only=POSITIVE_ONLY, target_peak_nm=TARGET_PEAK_NM,
+    )
+    surf = cache.get_or_compute(cache.key("static8_surfaces", prm), lambda: compute_surfaces(build_lut(loop), X, Y))
+
+    Vc_up = float(surf["Vc_up"])
+    Vc_dn = float(surf["Vc_dn"])
+    G = float(surf["G"])
+    if float(surf["raw_peak_surface_nm"]) <= 0:
+        print("WARN: raw peak <= 0, gain=1.0")
 
     # column order: Vc -> 0 -> 15 -> 30
     voltages_top = [Vc_up, 0.0, +Vmid, +Vmax]
     voltages_bot = [Vc_dn, 0.0, -Vmid, -Vmax]
 
-    # shape
-    S = shape_xy(X, Y, Lx, Wy)
-    Smax = float(np.max(S))
-
-    # ---- mechanical gain calibration (match butterfly scaling)
-    # peak on surface at (+30V, rising) should be TARGET_PEAK_NM (at shape max)
-    raw_u0_peak_nm = uz_abs_nm_from_V(+Vmax, loop, branch="up")
-    raw_peak_surface_nm = raw_u0_peak_nm * Smax
-
-    if raw_peak_surface_nm <= 0:
-        G = 1.0
-        print("WARN: raw peak <= 0, gain=1.0")
-    else:
-        G = TARGET_PEAK_NM / raw_peak_surface_nm
-
     print(f"Vc(up)   = {Vc_up:+.3f} V  (P_up=0)")
     print(f"Vc(down) = {Vc_dn:+.3f} V  (P_down=0)")
-    print(f"Raw peak surface (+{Vmax:.0f} V, rising) = {raw_peak_surface_nm:.3f} nm (before gain)")
+    print(f"Raw peak surface (+{Vmax:.0f} V, rising) = {float(surf['raw_peak_surface_nm']):.3f} nm (before gain)")
     print(f"Mechanical gain G = {G:.3f} -> target peak {TARGET_PEAK_NM:.1f} nm")
 
-    # ---- compute all surfaces in nm
-    def surface_nm(branch: str, V: float) -> np.ndarray:
-        u0_nm = uz_abs_nm_from_V(V, loop, branch=branch) * G
-        U_nm = u0_nm * S
-        if POSITIVE_ONLY:
-            U_nm = np.clip(U_nm, 0.0, None)
-        return U_nm
-
-    U_top = [surface_nm("up", V) for V in voltages_top]
-    U_bot = [surface_nm("down", V) for V in voltages_bot]
+    U_top = surf["U_top"]
+    U_bot = surf["U_bot"]
 
     # ---- color scale 0..500 nm
     cmap = mpl.colormaps["viridis"]
@@ -6,9 +6,26 @@ Lightweight, explainable (schematic) MEMS analysis utilities.
 Not FEM. Purpose is to "see the shape" and compare tendencies.
 """
 
-from .ferroelectric import make_branches, make_closed_loop
+__version__ = "0.1.0"
+
+from .cache import ResultCache
+from .ferroelectric import (
+    HysteresisLUT,
+    PreisachModel,
+    make_branches,
+    make_branches_batch,
+    make_closed_loop,
+    make_closed_loop_batch,
+    strain_from_P,
+)
 
 __all__ = [
+    "HysteresisLUT",
+    "PreisachModel",
+    "ResultCache",
     "make_branches",
+    "make_branches_batch",
     "make_closed_loop",
+    "make_closed_loop_batch",
+    "strain_from_P",
 ]
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+cache.py
+
+Purpose:
+- 同じパラメータでの再計算を避けるための、内容アドレス型のディスクキャッシュ
+- キー = 入力（スカラー / 配列 / dict）+ ライブラリ版数 のハッシュ
+- ヒット時は .npy を mmap_mode="r" で返す（コピーなし）
+
+Notes:
+- 1 エントリ = <root>/<key>/ ディレクトリ（配列ごとに 1 つの .npy）
+- 書き込みは一時ディレクトリ → rename（並行ジョブでも壊れたエントリは見えない）
+- 合計サイズが max_bytes を超えたら、最も古く使われたエントリから削除（LRU）
+  （合計サイズは書き込みごとに加算した概算で持ち、上限を超えたときだけディレクトリを走査）
+- mems-ana_core の io/cache.py と同じ形式・同じ方針（パッケージが別なので実装を複製）
+- 既定の場所: $MEMS_ANA_CACHE/results（未設定なら ~/.cache/mems_ana/results）
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+import shutil
+from typing import Any, Callable
+
+import numpy as np
+
+from . import __version__
+
+DEFAULT_MAX_BYTES = 2 * 1024**3
+
+
+class ResultCache:
+    """
+    名前付き配列 dict のキャッシュ。
+
+    cache = ResultCache()
+    loop = cache.get_or_compute(cache.key("loop", params), lambda: make_closed_loop(...))
+    """
+
+    def __init__(self, root: str | Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive.")
+        self.root = Path(root) if root is not None else _default_cache_dir()
+        self.max_bytes = int(max_bytes)
+        self._size: int | None = None  # 合計サイズの概算（上限超過時に走査し直す）
+
+    def key(self, *parts: Any) -> str:
+        return input_hash(*parts)
+
+    def get(self, key: str) -> dict[str, np.ndarray] | None:
+        path = self.root / key
+        try:
+            names = sorted(p for p in os.listdir(path) if p.endswith(".npy"))
+            out = {n[:-4]: np.load(path / n, mmap_mode="r") for n in names}
+            os.utime(path)  # LRU: 使われた時刻を更新
+        except FileNotFoundError:
+            return None
+        return out
+
+    def put(self, key: str, arrays: dict[str, Any]) -> dict[str, np.ndarray]:
+        """配列（スカラーは 0 次元配列）として保存し、mmap で読み直して返します。"""
+        path = self.root / key
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / f".{key}.{os.getpid()}.tmp"
+        tmp.mkdir(exist_ok=True)
+        for name, a in arrays.items():
+            np.save(tmp / f"{name}.npy", np.asarray(a), allow_pickle=False)
+        nbytes = _dir_bytes(tmp)
+        try:
+            os.replace(tmp, path)
+        except OSError:  # 他プロセスが先に保存済み
+            shutil.rmtree(tmp, ignore_errors=True)
+        else:
+            if self._size is not None:
+                self._size += nbytes
+        out = self.get(key)
+        if self._size is None or self._size > self.max_bytes:  # 走査は初回と上限超過時のみ
+            self.evict(keep=key)
+        return out if out is not None else {k: np.asarray(v) for k, v in arrays.items()}
+
+    def get_or_compute(self, key: str, compute: Callable[[], dict[str, Any]]) -> dict[str, np.ndarray]:
+        out = self.get(key)
+        return out if out is not None else self.put(key, compute())
+
+    def evict(self, max_bytes: int | None = None, keep: str | None = None) -> int:
+        """合計サイズが上限以下になるまで古いエントリを削除。削除したバイト数を返します。"""
+        limit = self.max_bytes if max_bytes is None else int(max_bytes)
+        entries = []
+        for p in self.root.iterdir() if self.root.exists() else ():
+            if p.is_dir() and not p.name.startswith("."):
+                try:
+                    entries.append((p.stat().st_mtime, _dir_bytes(p), p))
+                except FileNotFoundError:
+                    continue
+        total = sum(e[1] for e in entries)
+        freed = 0
+        for _, nbytes, p in sorted(entries, key=lambda e: e[0]):
+            if total - freed <= limit:
+                break
+            if p.name == keep:
+                continue
+            shutil.rmtree(p, ignore_errors=True)
+            freed += nbytes
+        self._size = total - freed
+        return freed
+
+    def size_bytes(self) -> int:
+        """現在の合計サイズ（走査して数える）。"""
+        if not self.root.exists():
+            return 0
+        return sum(_dir_bytes(p) for p in self.root.iterdir() if p.is_dir() and not p.name.startswith("."))
+
+    def clear(self) -> None:
+        self.evict(max_bytes=0)
+
+
+def input_hash(*parts: Any) -> str:
+    """版数 + 入力の SHA-256。配列は dtype / shape / 生バイトで区別します。"""
+    h = hashlib.sha256(f"mems_ana {__version__}".encode())
+    for p in parts:
+        _feed(h, p)
+    return h.hexdigest()[:32]
+
+
+def _feed(h: Any, obj: Any) -> None:
+    if obj is None or isinstance(obj, (bool, int, float, complex, str, bytes)):
+        h.update(repr(obj).encode())
+    elif isinstance(obj, (np.ndarray, np.generic)):
+        a = np.ascontiguousarray(obj)
+        h.update(repr((a.dtype.str, a.shape)).encode())
+        h.update(a.tobytes())
+    elif isinstance(obj, dict):
+        h.update(b"{")
+        for k in sorted(obj, key=str):
+            _feed(h, k)
+            _feed(h, obj[k])
+        h.update(b"}")
+    elif isinstance(obj, (list, tuple)):
+        h.update(b"(")
+        for v in obj:
+            _feed(h, v)
+        h.update(b")")
+    else:
+        raise TypeError(f"Cannot hash cache input of type {type(obj).__name__}.")
+
+
+def _dir_bytes(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.iterdir())
+
+
+def _default_cache_dir() -> Path:
+    root = os.environ.get("MEMS_ANA_CACHE")
+    return (Path(root) if root else Path.home() / ".cache" / "mems_ana") / "results"
@@ -5,6 +5,9 @@ ferroelectric.py
 Purpose:
 - "形を見る" ための簡易 P–E ヒステリシス生成
 - rising/falling 枝と、閉ループ列を返す
+- *_batch 版はパラメータ配列 (N,) をまとめて処理し (N, n_E) を返す
+- HysteresisLUT: 枝の表から P / d33_eff / S3 / uz を電圧配列で一括評価
+- PreisachModel: 履歴依存（マイナーループ対応）の逐次ヒステリシス
 
 Notes:
 - これは材料モデルの厳密解ではありません。
@@ -17,18 +20,29 @@ from dataclasses import dataclass
 import numpy as np
 
 
-def _solve_Es_from_Pr(Pm: float, Pr_target: float, Ec: float) -> float:
+def _solve_Es_from_Pr(Pm, Pr_target, Ec):
     """
     Pr_target / Pm = tanh(Ec / Es) を満たす Es を計算します。
     tanh^{-1}(r) = 0.5 ln((1+r)/(1-r))
+
+    スカラー / 配列どちらも可（配列は要素ごと）。
     """
-    r = Pr_target / Pm
-    if abs(r) >= 1.0:
+    r = np.asarray(Pr_target, dtype=float) / Pm
+    if np.any(np.abs(r) >= 1.0):
         raise ValueError("Pr_target must satisfy |Pr_target| < Pm.")
 
     arctanh_r = 0.5 * np.log((1.0 + r) / (1.0 - r))
     # Ec/Es = arctanh(r) → Es = Ec / arctanh(r)
-    return Ec / arctanh_r
+    Es = Ec / arctanh_r
+    return float(Es) if np.ndim(Es) == 0 else Es
+
+
+def _params(*values) -> list[np.ndarray]:
+    """パラメータを共通の 1 次元形状 (N,) にブロードキャストします。"""
+    arrs = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=float)) for v in values))
+    if arrs[0].ndim != 1:
+        raise ValueError("Loop parameters must be scalars or 1D arrays.")
+    return arrs
 
 
 def make_branches(
@@ -47,29 +61,71 @@ def make_branches(
     返り値:
       (P_up_uC_cm2, P_down_uC_cm2)
     """
+    P_up, P_dn = make_branches_batch(
+        np.asarray(E_V_per_m, dtype=float).ravel(),
+        Ec_V_per_m=Ec_V_per_m, Es_V_per_m=Es_V_per_m, Pm_uC_cm2=Pm_uC_cm2,
+    )
+    shape = np.shape(E_V_per_m)
+    return P_up[0].reshape(shape), P_dn[0].reshape(shape)
+
+
+def make_branches_batch(
+    E_V_per_m: np.ndarray,
+    *,
+    Ec_V_per_m: float | np.ndarray,
+    Es_V_per_m: float | np.ndarray,
+    Pm_uC_cm2: float | np.ndarray,
+    out: tuple[np.ndarray, np.ndarray] | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    make_branches のパラメータ一括版。
+
+    入力:
+      E_V_per_m: 1 次元 (n_E,)
+      Ec, Es, Pm: スカラーまたは (N,)（互いにブロードキャスト）
+      out: (P_up, P_down) の出力バッファ（各 (N, n_E)、ビュー可）
+
+    返り値:
+      (P_up_uC_cm2, P_down_uC_cm2)  各 (N, n_E)
+
+    端点の ±Pm 揃え（_scale）は符号を保つ正の倍率なので、
+    正側・負側それぞれ行ごとの倍率をバッファ上で直接掛けます（中間コピーなし）。
+    """
     E = np.asarray(E_V_per_m, dtype=float)
-    Ec = float(Ec_V_per_m)
-    Es = float(Es_V_per_m)
-    Pm = float(Pm_uC_cm2)
+    if E.ndim != 1:
+        raise ValueError("E_V_per_m must be 1D array.")
+    Ec, Es, Pm = (a[:, None] for a in _params(Ec_V_per_m, Es_V_per_m, Pm_uC_cm2))
+
+    shape = (Ec.shape[0], E.shape[0])
+    if out is None:
+        out = (np.empty(shape), np.empty(shape))
+    P_up, P_dn = out
+    if P_up.shape != shape or P_dn.shape != shape:
+        raise ValueError(f"out buffers must have shape {shape}.")
 
-    P_up = Pm * np.tanh((E + Ec) / Es)
-    P_dn = Pm * np.tanh((E - Ec) / Es)
+    for P, sign in ((P_up, 1.0), (P_dn, -1.0)):
+        np.add(E, sign * Ec, out=P)
+        np.divide(P, Es, out=P)
+        np.tanh(P, out=P)
+        np.multiply(Pm, P, out=P)
 
     # 端点の ±Pm を揃える（見た目の対称性を保つ）
-    P_pos = 0.5 * (np.max(P_up) + np.max(P_dn))
-    P_neg = 0.5 * (np.min(P_up) + np.min(P_dn))
-
-    def _scale(P: np.ndarray) -> np.ndarray:
-        P = P.copy()
-        pos_mask = P >= 0
-        if np.any(pos_mask):
-            P[pos_mask] *= (P_pos / np.max(P[pos_mask]))
-        neg_mask = ~pos_mask
-        if np.any(neg_mask):
-            P[neg_mask] *= (P_neg / np.min(P[neg_mask]))
-        return P
+    mx_up, mx_dn = P_up.max(axis=1), P_dn.max(axis=1)
+    mn_up, mn_dn = P_up.min(axis=1), P_dn.min(axis=1)
+    P_pos = 0.5 * (mx_up + mx_dn)
+    P_neg = 0.5 * (mn_up + mn_dn)
+
+    mask = np.empty(shape, dtype=bool)
+    for P, mx, mn in ((P_up, mx_up, mn_up), (P_dn, mx_dn, mn_dn)):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            f_pos = (P_pos / mx)[:, None]
+            f_neg = (P_neg / mn)[:, None]
+        np.less(P, 0.0, out=mask)
+        np.multiply(P, f_neg, out=P, where=mask)
+        np.logical_not(mask, out=mask)
+        np.multiply(P, f_pos, out=P, where=mask)
 
-    return _scale(P_up), _scale(P_dn)
+    return P_up, P_dn
 
 
 def make_closed_loop(
@@ -96,46 +152,499 @@ def make_closed_loop(
       - Es_V_per_m
       - Pr_rising_uC_cm2, Pr_falling_uC_cm2（E≈0の値）
     """
+    loop = make_closed_loop_batch(
+        E_V_per_m,
+        Ec_V_per_m=float(Ec_V_per_m),
+        Pm_uC_cm2=float(Pm_uC_cm2),
+        Pr_target_uC_cm2=float(Pr_target_uC_cm2),
+        Es_V_per_m=None if Es_V_per_m is None else float(Es_V_per_m),
+        n_jump=n_jump,
+    )
+    return {
+        "P_up_uC_cm2": loop["P_up_uC_cm2"][0],
+        "P_down_uC_cm2": loop["P_down_uC_cm2"][0],
+        "Eloop_V_per_m": loop["Eloop_V_per_m"],
+        "Ploop_uC_cm2": loop["Ploop_uC_cm2"][0],
+        "Es_V_per_m": float(loop["Es_V_per_m"][0]),
+        "Pr_rising_uC_cm2": float(loop["Pr_rising_uC_cm2"][0]),
+        "Pr_falling_uC_cm2": float(loop["Pr_falling_uC_cm2"][0]),
+    }
+
+
+def make_closed_loop_batch(
+    E_V_per_m: np.ndarray,
+    *,
+    Ec_V_per_m: float | np.ndarray,
+    Pm_uC_cm2: float | np.ndarray,
+    Pr_target_uC_cm2: float | np.ndarray,
+    Es_V_per_m: float | np.ndarray | None = None,
+    n_jump: int = 120,
+    out: np.ndarray | None = None,
+) -> dict[str, np.ndarray]:
+    """
+    make_closed_loop のパラメータ一括版（Ec, Pm, Pr_target, Es は (N,) にブロードキャスト）。
+
+    out: Ploop の出力バッファ (N, 2*n_E + 2*n_jump)。
+         P_up / P_down はこのバッファのビューとして直接書き込まれます。
+
+    出力(dict):
+      - P_up_uC_cm2, P_down_uC_cm2        (N, n_E)  ※ Ploop のビュー
+      - Eloop_V_per_m                     (2*n_E + 2*n_jump,)  全パラメータ共通
+      - Ploop_uC_cm2                      (N, 2*n_E + 2*n_jump)
+      - Es_V_per_m, Pr_rising_uC_cm2, Pr_falling_uC_cm2   (N,)
+    """
     E = np.asarray(E_V_per_m, dtype=float)
     if E.ndim != 1:
         raise ValueError("E_V_per_m must be 1D array.")
 
-    Ec = float(Ec_V_per_m)
-    Pm = float(Pm_uC_cm2)
-    Prt = float(Pr_target_uC_cm2)
-
     if Es_V_per_m is None:
+        Ec, Pm, Prt = _params(Ec_V_per_m, Pm_uC_cm2, Pr_target_uC_cm2)
         Es = _solve_Es_from_Pr(Pm=Pm, Pr_target=Prt, Ec=Ec)
     else:
-        Es = float(Es_V_per_m)
-
-    P_up, P_dn = make_branches(E, Ec_V_per_m=Ec, Es_V_per_m=Es, Pm_uC_cm2=Pm)
+        # Es も含めて 4 つを一度にブロードキャスト（Es だけが (N,) の場合も N を正しく取る）
+        Ec, Pm, Prt, Es = _params(Ec_V_per_m, Pm_uC_cm2, Pr_target_uC_cm2, Es_V_per_m)
 
-    # Pr（E≈0）
-    idx0 = int(np.argmin(np.abs(E)))
-    Pr_r = float(P_up[idx0])
-    Pr_f = float(P_dn[idx0])
+    n, nj = E.shape[0], int(n_jump)
+    shape = (Ec.shape[0], 2 * n + 2 * nj)
+    Ploop = np.empty(shape) if out is None else out
+    if Ploop.shape != shape:
+        raise ValueError(f"out buffer must have shape {shape}.")
 
     # 閉ループを構成：左→右 (rising) → 右端ジャンプ → 右→左 (falling) → 左端ジャンプ
-    E1, P1 = E, P_up
-
-    Ej1 = np.full(n_jump, E[-1], dtype=float)
-    Pj1 = np.linspace(P_up[-1], P_dn[-1], n_jump)
+    P_up = Ploop[:, :n]
+    P_dn = Ploop[:, n + nj:2 * n + nj][:, ::-1]
+    make_branches_batch(E, Ec_V_per_m=Ec, Es_V_per_m=Es, Pm_uC_cm2=Pm, out=(P_up, P_dn))
 
-    E2, P2 = E[::-1], P_dn[::-1]
+    Ploop[:, n:n + nj] = np.linspace(P_up[:, -1], P_dn[:, -1], nj, axis=1)
+    Ploop[:, 2 * n + nj:] = np.linspace(P_dn[:, 0], P_up[:, 0], nj, axis=1)
 
-    Ej2 = np.full(n_jump, E[0], dtype=float)
-    Pj2 = np.linspace(P_dn[0], P_up[0], n_jump)
+    Eloop = np.concatenate([E, np.full(nj, E[-1]), E[::-1], np.full(nj, E[0])])
 
-    Eloop = np.concatenate([E1, Ej1, E2, Ej2])
-    Ploop = np.concatenate([P1, Pj1, P2, Pj2])
+    # Pr（E≈0）
+    idx0 = int(np.argmin(np.abs(E)))
 
     return {
         "P_up_uC_cm2": P_up,
         "P_down_uC_cm2": P_dn,
         "Eloop_V_per_m": Eloop,
         "Ploop_uC_cm2": Ploop,
-        "Es_V_per_m": float(Es),
-        "Pr_rising_uC_cm2": Pr_r,
-        "Pr_falling_uC_cm2": Pr_f,
+        "Es_V_per_m": np.array(Es),
+        "Pr_rising_uC_cm2": P_up[:, idx0].copy(),
+        "Pr_falling_uC_cm2": P_dn[:, idx0].copy(),
     }
+
+
+def strain_from_P(
+    Ez_V_per_m: np.ndarray,
+    P_uC_cm2: np.ndarray,
+    *,
+    Pm_uC_cm2: float,
+    d33_m_per_V: float,
+    Q_m4_per_C2: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (d33_eff, S3) を返します（demo 共通の d33 支配モデル）。
+      d33_eff = d33 * (P / Pm)
+      S3      = d33_eff * Ez + Q * P^2      (P [C/m²])
+    """
+    P = np.asarray(P_uC_cm2, dtype=float) * 0.01  # 1 µC/cm² = 0.01 C/m²
+    d33_eff = d33_m_per_V * (P / (Pm_uC_cm2 * 0.01))
+    return d33_eff, d33_eff * Ez_V_per_m + Q_m4_per_C2 * (P * P)
+
+
+class HysteresisLUT:
+    """
+    make_closed_loop の枝を一様 E グリッド上の表として持ち、
+    電圧配列 + 枝フラグ配列をまとめて評価します（二分探索なし・添字計算のみ）。
+
+    モデル（butterfly / static8 / animation と共通）:
+      Ez      = V / t_pzt
+      d33_eff = d33 * (P / Pm)
+      S3      = d33_eff * Ez + Q * P^2      (P [C/m²])
+      uz      = S3 * t_pzt
+
+    枝フラグ up: True = rising (P_up), False = falling (P_down)。
+    グリッド外の E は端点値（np.interp と同じ扱い）。
+    """
+
+    def __init__(
+        self,
+        E_V_per_m: np.ndarray,
+        P_up_uC_cm2: np.ndarray,
+        P_down_uC_cm2: np.ndarray,
+        *,
+        t_pzt_m: float,
+        Pm_uC_cm2: float,
+        d33_m_per_V: float = 0.0,
+        Q_m4_per_C2: float = 0.0,
+    ) -> None:
+        E = np.asarray(E_V_per_m, dtype=float)
+        n = E.shape[0]
+        if E.ndim != 1 or n < 2:
+            raise ValueError("E_V_per_m must be 1D array with at least 2 points.")
+        dE = (E[-1] - E[0]) / (n - 1)
+        if dE <= 0.0 or np.max(np.abs(np.diff(E) - dE)) > 1e-6 * dE:
+            raise ValueError("HysteresisLUT needs a uniform, increasing E grid.")
+
+        # 行 0 = falling, 行 1 = rising（bool フラグをそのまま行番号に使う）
+        self.P_table = np.stack([np.asarray(P_down_uC_cm2, dtype=float), np.asarray(P_up_uC_cm2, dtype=float)])
+        if self.P_table.shape != (2, n):
+            raise ValueError("P_up / P_down must match the E grid.")
+        self.dP_table = np.diff(self.P_table, axis=1)
+
+        self.E0 = float(E[0])
+        self.dE = float(dE)
+        self.n = n
+        self.t_pzt = float(t_pzt_m)
+        self.Pm = float(Pm_uC_cm2)
+        self.d33 = float(d33_m_per_V)
+        self.Q = float(Q_m4_per_C2)
+
+        # Vc: 各枝で P=0 となる電圧（0 V に最も近い交差、線形補間）
+        self.Vc_up = _zero_crossing(E, self.P_table[1]) * self.t_pzt
+        self.Vc_down = _zero_crossing(E, self.P_table[0]) * self.t_pzt
+
+    @classmethod
+    def from_loop(
+        cls,
+        loop: dict,
+        *,
+        t_pzt_m: float,
+        Pm_uC_cm2: float,
+        d33_m_per_V: float = 0.0,
+        Q_m4_per_C2: float = 0.0,
+    ) -> "HysteresisLUT":
+        """make_closed_loop の出力から作ります（E グリッドは Eloop の先頭 n_E 点）。"""
+        n = len(loop["P_up_uC_cm2"])
+        return cls(
+            loop["Eloop_V_per_m"][:n], loop["P_up_uC_cm2"], loop["P_down_uC_cm2"],
+            t_pzt_m=t_pzt_m, Pm_uC_cm2=Pm_uC_cm2, d33_m_per_V=d33_m_per_V, Q_m4_per_C2=Q_m4_per_C2,
+        )
+
+    # ---------- evaluation ----------
+    def P_uC_cm2(self, V: np.ndarray, up: np.ndarray | bool) -> np.ndarray:
+        """P(V) [µC/cm²]。V と up はブロードキャスト。"""
+        x = np.clip((np.asarray(V, dtype=float) / self.t_pzt - self.E0) / self.dE, 0.0, self.n - 1)
+        i = np.minimum(x.astype(np.intp), self.n - 2)
+        b = np.asarray(up, dtype=np.intp)
+        return self.P_table[b, i] + (x - i) * self.dP_table[b, i]
+
+    def evaluate(self, V: np.ndarray, up: np.ndarray | bool) -> dict[str, np.ndarray]:
+        """
+        P, d33_eff, S3, uz を一度に評価します。
+
+        出力(dict):
+          - P_uC_cm2, d33_eff_m_per_V, strain, uz_nm
+        """
+        Ez = np.asarray(V, dtype=float) / self.t_pzt
+        P_uC = self.P_uC_cm2(V, up)
+        d33_eff, S3 = strain_from_P(Ez, P_uC, Pm_uC_cm2=self.Pm, d33_m_per_V=self.d33, Q_m4_per_C2=self.Q)
+        return {
+            "P_uC_cm2": P_uC,
+            "d33_eff_m_per_V": d33_eff,
+            "strain": S3,
+            "uz_nm": S3 * self.t_pzt * 1e9,
+        }
+
+    def uz_nm(self, V: np.ndarray, up: np.ndarray | bool) -> np.ndarray:
+        """uz [nm]（shape 最大点、形状関数を掛ける前）。"""
+        return self.evaluate(V, up)["uz_nm"]
+
+
+class PreisachModel:
+    """
+    履歴依存の Preisach 型ヒステリシス（マイナーループ対応）。
+
+      P(t) = ±Ps + 2 Σ_k ±F(α_k, β_k)
+
+    - F(α, β): Everett 関数（α ≥ β の三角形上の密度積分）。一様 E グリッド上の表として
+      事前計算し、双一次補間（添字計算のみ）で評価します。
+    - 履歴は交互に並ぶ極値のスタック（wiping-out 性質で過去の小さい極値を消去）
+      と、その部分和で保持します。
+    - process() は任意長の E(t) をチャンク単位で逐次処理します。単調区間ごとに
+      まとめてベクトル評価し、スタック操作は 1 サンプルあたり償却 O(1)。
+
+    Notes（向きについて）:
+    - 正の密度をもつ Preisach モデルのループは常に反時計回り（物理的な向き）で、
+      rising 枝は E = +Ec 付近で P = 0 を横切ります。
+    - make_closed_loop の表示用の枝（P_up = Pm tanh((E + Ec)/Es)）は時計回りで、
+      rising 枝が E = -Ec で P = 0 になります。Vc(up) の符号などが逆になるので、
+      両者を混ぜて比較しないでください。
+    """
+
+    _SHORT_RUN = 16  # これより短い単調区間はスカラー処理
+
+    def __init__(
+        self,
+        E_V_per_m: np.ndarray,
+        everett: np.ndarray,
+        *,
+        Ps_uC_cm2: float,
+        initial: int = -1,
+    ) -> None:
+        """
+        E_V_per_m: 一様グリッド (n,)（入力はこの範囲にクリップ）
+        everett:   F[i, j] = F(α=E[i], β=E[j])（i ≥ j のみ使用）、F(E[-1], E[0]) = Ps に正規化済み
+        initial:   -1 = 負飽和から開始, +1 = 正飽和から開始
+        """
+        E = np.asarray(E_V_per_m, dtype=float)
+        n = E.shape[0]
+        if E.ndim != 1 or n < 2:
+            raise ValueError("E_V_per_m must be 1D array with at least 2 points.")
+        dE = (E[-1] - E[0]) / (n - 1)
+        if dE <= 0.0 or np.max(np.abs(np.diff(E) - dE)) > 1e-6 * dE:
+            raise ValueError("PreisachModel needs a uniform, increasing E grid.")
+        F = np.asarray(everett, dtype=float)
+        if F.shape != (n, n):
+            raise ValueError("everett table must have shape (n, n) on the E grid.")
+
+        self.E_lo = float(E[0])
+        self.E_hi = float(E[-1])
+        self.dE = float(dE)
+        self.n = n
+        self.F = np.ascontiguousarray(F)
+        self._F_rows = self.F.tolist()  # 短い区間のスカラー評価用
+        self.Ps = float(Ps_uC_cm2)
+        self.reset(initial)
+
+    @classmethod
+    def from_tanh(
+        cls,
+        *,
+        Ec_V_per_m: float,
+        Pm_uC_cm2: float,
+        E_max_V_per_m: float,
+        Es_V_per_m: float | None = None,
+        Pr_target_uC_cm2: float | None = None,
+        n_grid: int = 401,
+        initial: int = -1,
+    ) -> "PreisachModel":
+        """
+        make_closed_loop と同じパラメータから作る因子化密度:
+
+          μ(α, β) ∝ sech²((α - Ec)/Es) · sech²((β + Ec)/Es)   (α ≥ β)
+
+        Es が None の場合は、この Preisach 主ループの |P(E=0)| が Pr_target になるよう
+        Es を数値的に合わせます（make_closed_loop の tanh 式とは Pr(Es) が異なるため、
+        同じ Pr_target でも Es は一致しません）。Pr は Es → ∞ で約 Pm/2 に下がるので、
+        それ以下の Pr_target は ValueError。
+        Ec ≫ Es では主ループの rising 枝 ≈ Pm tanh((E - Ec)/Es)（反時計回り）。
+        E_max は飽和に十分な大きさ（|E| ≤ E_max の外側は端点値）。
+        """
+        Ec = float(Ec_V_per_m)
+        Pm = float(Pm_uC_cm2)
+        E = np.linspace(-E_max_V_per_m, E_max_V_per_m, int(n_grid))
+        if Es_V_per_m is None:
+            if Pr_target_uC_cm2 is None:
+                raise ValueError("Give Es_V_per_m or Pr_target_uC_cm2.")
+            Es = _solve_Es_preisach(E, Pm=Pm, Pr_target=float(Pr_target_uC_cm2), Ec=Ec)
+        else:
+            Es = float(Es_V_per_m)
+
+        return cls(E, _tanh_everett(E, Ec, Es) * Pm, Ps_uC_cm2=Pm, initial=initial)
+
+    # ---------- major loop ----------
+    def major_loop(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        飽和間の主ループ（履歴に依存しない）を E グリッド上で返します。
+
+          rising  (負飽和から): P_up(u) = -Ps + 2F(u, E_lo)
+          falling (正飽和から): P_dn(u) = +Ps - 2F(E_hi, u)
+
+        出力: (E, P_up, P_down) [V/m, µC/cm², µC/cm²]
+        """
+        E = self.E_lo + self.dE * np.arange(self.n)
+        return E, 2.0 * self.F[:, 0] - self.Ps, self.Ps - 2.0 * self.F[-1, :]
+
+    def coercive_fields(self) -> tuple[float, float]:
+        """主ループの rising / falling 枝で P = 0 となる E [V/m]（反時計回りなので Ec_up > 0）。"""
+        E, P_up, P_dn = self.major_loop()
+        return _zero_crossing(E, P_up), _zero_crossing(E, P_dn)
+
+    # ---------- state ----------
+    def reset(self, initial: int = -1) -> None:
+        """飽和状態から履歴をやり直します。"""
+        if initial not in (-1, 1):
+            raise ValueError("initial must be -1 or +1.")
+        e0 = self.E_lo if initial < 0 else self.E_hi
+        self._ext = [e0]                 # 確定した極値（先頭は飽和端、以後 max/min 交互）
+        self._pre = [initial * self.Ps]  # _pre[k] = ext[0..k] までの出力
+        self._live = e0                  # 現在の入力（未確定の極値）
+        self._dir = 0                    # ext[-1] → live の向き
+
+    @property
+    def depth(self) -> int:
+        """保持している極値の数（飽和端を含む）。"""
+        return len(self._ext)
+
+    # ---------- Everett ----------
+    def everett(self, alpha: np.ndarray, beta: np.ndarray) -> np.ndarray:
+        """F(α, β)（双一次補間）。α, β はブロードキャスト、α ≥ β を想定。"""
+        xa = np.clip((np.asarray(alpha, dtype=float) - self.E_lo) / self.dE, 0.0, self.n - 1)
+        xb = np.clip((np.asarray(beta, dtype=float) - self.E_lo) / self.dE, 0.0, self.n - 1)
+        i = np.minimum(xa.astype(np.intp), self.n - 2)
+        j = np.minimum(xb.astype(np.intp), self.n - 2)
+        ta = xa - i
+        tb = xb - j
+        F = self.F
+        f0 = F[i, j] + tb * (F[i, j + 1] - F[i, j])
+        f1 = F[i + 1, j] + tb * (F[i + 1, j + 1] - F[i + 1, j])
+        return f0 + ta * (f1 - f0)
+
+    def _everett1(self, alpha: float, beta: float) -> float:
+        """everett() のスカラー版（Python float のみ、numpy 呼び出しなし）。"""
+        xa = min(max((alpha - self.E_lo) / self.dE, 0.0), self.n - 1.0)
+        xb = min(max((beta - self.E_lo) / self.dE, 0.0), self.n - 1.0)
+        i = min(int(xa), self.n - 2)
+        j = min(int(xb), self.n - 2)
+        ta = xa - i
+        tb = xb - j
+        r0, r1 = self._F_rows[i], self._F_rows[i + 1]
+        f0 = r0[j] + tb * (r0[j + 1] - r0[j])
+        f1 = r1[j] + tb * (r1[j + 1] - r1[j])
+        return f0 + ta * (f1 - f0)
+
+    def _term1(self, e: float, u: float) -> float:
+        return 2.0 * self._everett1(u, e) if u >= e else -2.0 * self._everett1(e, u)
+
+    def _term(self, e: np.ndarray | float, u: np.ndarray | float) -> np.ndarray:
+        """極値 e から u への区間の寄与: 上りは +2F(u, e), 下りは -2F(e, u)。"""
+        up = np.asarray(u) >= e
+        return np.where(up, 2.0, -2.0) * self.everett(np.where(up, u, e), np.where(up, e, u))
+
+    # ---------- streaming ----------
+    def process(self, E_V_per_m: np.ndarray) -> np.ndarray:
+        """
+        E(t) の 1 チャンクを処理し P(t) [µC/cm²] を返します。
+        状態は呼び出し間で引き継がれるので、長い波形は分割して順に渡せます。
+        """
+        u = np.clip(np.asarray(E_V_per_m, dtype=float).ravel(), self.E_lo, self.E_hi)
+        P = np.empty_like(u)
+        if u.size == 0:
+            return P
+
+        # 各サンプルの向き（変化 0 は直前の向きを継続）
+        s = np.sign(np.diff(u, prepend=self._live))
+        nz = np.flatnonzero(s)
+        if nz.size:
+            fill = np.maximum.accumulate(np.where(s != 0, np.arange(u.size), -1))
+            s = np.where(fill >= 0, s[np.maximum(fill, 0)], self._dir)
+        else:
+            s[:] = self._dir
+        bounds = np.concatenate([[0], np.flatnonzero(np.diff(s)) + 1, [u.size]])
+
+        ext, pre = self._ext, self._pre
+        for a, b in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+            if b - a < self._SHORT_RUN:
+                # 短い単調区間（ノイズ等）はサンプルごとのスカラー処理の方が速い
+                for k in range(a, b):
+                    P[k] = self._step(float(u[k]))
+                continue
+
+            d = int(s[a])
+            ur = u[a:b]
+            if d != 0 and self._dir != 0 and d != self._dir:
+                # 折り返し: 現在値を極値として確定
+                pre.append(pre[-1] + self._term1(ext[-1], self._live))
+                ext.append(self._live)
+            if d != 0:
+                self._dir = d
+
+            # wiping-out: この単調区間の終点が越える過去の極値対をまとめて消去
+            end = float(ur[-1])
+            levels_pre = [pre[-1]]
+            levels_ext = [ext[-1]]
+            th = []
+            while d != 0 and len(ext) >= 3 and d * (end - ext[-2]) >= 0.0:
+                th.append(d * ext[-2])
+                del ext[-2:], pre[-2:]
+                levels_pre.append(pre[-1])
+                levels_ext.append(ext[-1])
+
+            k = np.searchsorted(np.array(th), d * ur, side="right") if th else 0
+            e = np.asarray(levels_ext)[k]
+            P[a:b] = np.asarray(levels_pre)[k] + self._term(e, ur)
+            self._live = end
+
+        return P
+
+    def _step(self, x: float) -> float:
+        """1 サンプル分の状態更新（process と同じ規則）。"""
+        ext, pre = self._ext, self._pre
+        d = (x > self._live) - (x < self._live)
+        if d != 0:
+            if self._dir != 0 and d != self._dir:
+                pre.append(pre[-1] + self._term1(ext[-1], self._live))
+                ext.append(self._live)
+            self._dir = d
+            while len(ext) >= 3 and d * (x - ext[-2]) >= 0.0:
+                del ext[-2:], pre[-2:]
+        self._live = x
+        return pre[-1] + self._term1(ext[-1], x)
+
+    def process_stream(self, chunks):
+        """E(t) チャンクの反復子を受け取り、P(t) チャンクを逐次返すジェネレータ。"""
+        for c in chunks:
+            yield self.process(c)
+
+
+def _zero_crossing(E: np.ndarray, P: np.ndarray) -> float:
+    """P(E) = 0 となる E（0 に最も近い交差、線形補間）。"""
+    idx = np.where(np.sign(P[:-1]) * np.sign(P[1:]) <= 0)[0]
+    if len(idx) == 0:
+        # 交差が無い場合は |P| 最小点
+        return float(E[int(np.argmin(np.abs(P)))])
+    i = int(idx[np.argmin(np.abs(E[idx]))])
+    E1, E2 = float(E[i]), float(E[i + 1])
+    P1, P2 = float(P[i]), float(P[i + 1])
+    return E1 + (0.0 - P1) * (E2 - E1) / (P2 - P1 + 1e-30)
+
+
+def _tanh_everett(E: np.ndarray, Ec: float, Es: float) -> np.ndarray:
+    """PreisachModel.from_tanh の因子化密度の Everett 表（F[-1, 0] = 1）。"""
+    a = np.cosh((E - Ec) / Es) ** -2  # α 方向
+    b = np.cosh((E + Ec) / Es) ** -2  # β 方向
+    return _everett_table(np.outer(a, b))
+
+
+def _solve_Es_preisach(E: np.ndarray, *, Pm: float, Pr_target: float, Ec: float, iters: int = 40) -> float:
+    """
+    主ループの残留分極 Pr = Pm (1 - 2 F(E_max, 0)) が Pr_target になる Es（log Es の二分法）。
+
+    tanh 枝用の _solve_Es_from_Pr は Preisach の主ループには当てはまりません
+    （Es が大きいと Pr は Pm ではなく約 Pm/2 に近づく）。Pr は Es に対して単調減少なので、
+    [Ec·1e-2, E_max·1e3] の両端で挟めない Pr_target は ValueError。
+    """
+    j0 = int(np.argmin(np.abs(E)))
+
+    def pr(Es: float) -> float:
+        return Pm * (1.0 - 2.0 * float(_tanh_everett(E, Ec, Es)[-1, j0]))
+
+    lo, hi = np.log(Ec * 1e-2), np.log(float(E[-1]) * 1e3)
+    pr_max, pr_min = pr(float(np.exp(lo))), pr(float(np.exp(hi)))
+    if not pr_min < Pr_target < pr_max:
+        raise ValueError(
+            f"Pr_target_uC_cm2 must lie in ({pr_min:.2f}, {pr_max:.2f}) for this Preisach density, got {Pr_target}."
+        )
+    for _ in range(iters):
+        mid = 0.5 * (lo + hi)
+        if pr(float(np.exp(mid))) > Pr_target:
+            lo = mid
+        else:
+            hi = mid
+    return float(np.exp(0.5 * (lo + hi)))
+
+
+def _everett_table(mu: np.ndarray) -> np.ndarray:
+    """
+    グリッド上の密度 μ[i, j] = μ(α_i, β_j) から Everett 表を作ります。
+
+      F[i, j] = Σ_{j ≤ l ≤ k ≤ i} μ[k, l]     （F[-1, 0] = 1 に正規化）
+    """
+    m = np.tril(mu)
+    m[np.diag_indices_from(m)] *= 0.5
+    R = np.cumsum(m[:, ::-1], axis=1)[:, ::-1]  # R[k, j] = Σ_{l ≥ j} m[k, l]
+    C = np.cumsum(R, axis=0)                     # C[i, j] = Σ_{k ≤ i} R[k, j]
+    C_prev = np.concatenate([[0.0], C[np.arange(len(C) - 1), np.arange(1, len(C))]])  # C[j-1, j]
+    F = np.tril(C - C_prev[None, :])
+    return F / F[-1, 0]
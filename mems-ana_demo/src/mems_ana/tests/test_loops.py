@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from mems_ana.ferroelectric import make_branches, make_branches_batch, make_closed_loop, make_closed_loop_batch
+
+E = np.linspace(-25e6, 25e6, 101)
+EC = np.array([4e6, 5e6, 6e6])
+ES = np.array([1.5e6, 2e6, 3e6])
+PM = np.array([40.0, 42.0, 45.0])
+PRT = np.array([30.0, 35.0, 38.0])
+
+
+def test_scalar_branches_match_batch_rows():
+    """
+    make_branches（スカラー版）が make_branches_batch の各行と一致する
+    """
+    P_up, P_dn = make_branches_batch(E, Ec_V_per_m=EC, Es_V_per_m=ES, Pm_uC_cm2=PM)
+    for i in range(len(EC)):
+        up, dn = make_branches(E, Ec_V_per_m=EC[i], Es_V_per_m=ES[i], Pm_uC_cm2=PM[i])
+        np.testing.assert_allclose(up, P_up[i], rtol=0, atol=1e-12)
+        np.testing.assert_allclose(dn, P_dn[i], rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize("given_Es", [False, True])
+def test_scalar_closed_loop_matches_batch_rows(given_Es):
+    """
+    make_closed_loop（スカラー版）が make_closed_loop_batch の各行と一致する（Es 自動決定 / 指定の両方）
+    """
+    Es = ES if given_Es else None
+    loop = make_closed_loop_batch(E, Ec_V_per_m=EC, Pm_uC_cm2=PM, Pr_target_uC_cm2=PRT, Es_V_per_m=Es, n_jump=20)
+    for i in range(len(EC)):
+        one = make_closed_loop(
+            E, Ec_V_per_m=EC[i], Pm_uC_cm2=PM[i], Pr_target_uC_cm2=PRT[i],
+            Es_V_per_m=None if Es is None else Es[i], n_jump=20,
+        )
+        np.testing.assert_array_equal(one["Eloop_V_per_m"], loop["Eloop_V_per_m"])
+        for k in ("P_up_uC_cm2", "P_down_uC_cm2", "Ploop_uC_cm2"):
+            np.testing.assert_allclose(one[k], loop[k][i], rtol=0, atol=1e-12)
+        for k in ("Es_V_per_m", "Pr_rising_uC_cm2", "Pr_falling_uC_cm2"):
+            assert one[k] == pytest.approx(loop[k][i], rel=1e-12)
+
+
+def test_closed_loop_batch_broadcasts_array_Es_against_scalars():
+    """
+    Es だけが (N,) で Ec / Pm / Pr_target がスカラーでも N 行のループになる
+    """
+    loop = make_closed_loop_batch(E, Ec_V_per_m=5e6, Pm_uC_cm2=42.0, Pr_target_uC_cm2=35.0, Es_V_per_m=ES, n_jump=20)
+    assert loop["Ploop_uC_cm2"].shape == (len(ES), 2 * len(E) + 40)
+    np.testing.assert_array_equal(loop["Es_V_per_m"], ES)
+    for i in range(len(ES)):
+        up, _ = make_branches(E, Ec_V_per_m=5e6, Es_V_per_m=ES[i], Pm_uC_cm2=42.0)
+        np.testing.assert_allclose(loop["P_up_uC_cm2"][i], up, rtol=0, atol=1e-12)
+
+
+def test_out_buffers_are_filled_in_place():
+    """
+    out= に渡したバッファ（ビューを含む）へ直接書き込まれ、返り値はそのバッファを指す
+    """
+    P_up, P_dn = make_branches_batch(E, Ec_V_per_m=EC, Es_V_per_m=ES, Pm_uC_cm2=PM)
+    buf = np.full((len(EC), 2, len(E)), np.nan)
+    up, dn = make_branches_batch(E, Ec_V_per_m=EC, Es_V_per_m=ES, Pm_uC_cm2=PM, out=(buf[:, 0], buf[:, 1, ::-1]))
+    assert np.shares_memory(up, buf) and np.shares_memory(dn, buf)
+    np.testing.assert_array_equal(buf[:, 0], P_up)
+    np.testing.assert_array_equal(buf[:, 1, ::-1], P_dn)
+
+    ref = make_closed_loop_batch(E, Ec_V_per_m=EC, Pm_uC_cm2=PM, Pr_target_uC_cm2=PRT, n_jump=20)
+    Ploop = np.full(ref["Ploop_uC_cm2"].shape, np.nan)
+    loop = make_closed_loop_batch(E, Ec_V_per_m=EC, Pm_uC_cm2=PM, Pr_target_uC_cm2=PRT, n_jump=20, out=Ploop)
+    assert loop["Ploop_uC_cm2"] is Ploop
+    assert np.shares_memory(loop["P_up_uC_cm2"], Ploop) and np.shares_memory(loop["P_down_uC_cm2"], Ploop)
+    np.testing.assert_array_equal(Ploop, ref["Ploop_uC_cm2"])
+
+    with pytest.raises(ValueError):
+        make_closed_loop_batch(E, Ec_V_per_m=EC, Pm_uC_cm2=PM, Pr_target_uC_cm2=PRT, n_jump=20, out=Ploop[:2])
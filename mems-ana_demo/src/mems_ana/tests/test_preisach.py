@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+from mems_ana.ferroelectric import PreisachModel
+
+EC, PM, EMAX = 5e6, 42.0, 25e6
+
+
+def make_model(n_grid=201, Es=2e6, initial=-1):
+    return PreisachModel.from_tanh(
+        Ec_V_per_m=EC, Pm_uC_cm2=PM, E_max_V_per_m=EMAX, Es_V_per_m=Es, n_grid=n_grid, initial=initial
+    )
+
+
+def drive(n=3000, seed=0):
+    """
+    飽和・部分反転・ノイズ（短い単調区間）を含む E(t)
+    """
+    t = np.linspace(0.0, 1.0, n)
+    rng = np.random.default_rng(seed)
+    E = EMAX * (0.9 * np.sin(2 * np.pi * 3 * t) * (1.0 - 0.6 * t) + 0.3 * np.sin(2 * np.pi * 17 * t))
+    return E + 0.02 * EMAX * rng.standard_normal(n)
+
+
+def relay_reference(E, n_grid, Es, initial=-1):
+    """
+    独立な参照: グリッド上のリレー（hysteron）集合を 1 サンプルずつ直接切り替える
+    """
+    g = np.linspace(-EMAX, EMAX, n_grid)
+    mu = np.outer(np.cosh((g - EC) / Es) ** -2, np.cosh((g + EC) / Es) ** -2)
+    w = np.tril(mu)
+    w[np.diag_indices_from(w)] *= 0.5
+    w /= w.sum()
+    alpha, beta = np.meshgrid(g, g, indexing="ij")
+    s = np.full(w.shape, float(initial))
+    out = np.empty(len(E))
+    for k, u in enumerate(np.clip(E, -EMAX, EMAX)):
+        s[alpha <= u] = 1.0
+        s[beta >= u] = -1.0
+        out[k] = PM * np.sum(w * s)
+    return out
+
+
+def test_streaming_matches_per_sample_and_chunks():
+    """
+    一括・1 サンプルずつ・ランダム長チャンクの処理結果が完全に一致する
+    """
+    E = drive()
+    whole = make_model().process(E)
+
+    m = make_model()
+    single = np.concatenate([m.process(E[k:k + 1]) for k in range(len(E))])
+
+    m = make_model()
+    cuts = np.sort(np.random.default_rng(1).choice(np.arange(1, len(E)), 40, replace=False))
+    chunked = np.concatenate(list(m.process_stream(np.split(E, cuts))))
+
+    np.testing.assert_array_equal(single, whole)
+    np.testing.assert_array_equal(chunked, whole)
+
+
+def test_return_point_memory():
+    """
+    マイナーループを閉じると元の枝の同じ点に戻り、その後の経路も変わらない
+    """
+    up = np.linspace(-EMAX, 0.4 * EMAX, 200)
+    minor = np.concatenate([np.linspace(0.4 * EMAX, -0.1 * EMAX, 100), np.linspace(-0.1 * EMAX, 0.4 * EMAX, 100)])
+    rest = np.linspace(0.4 * EMAX, EMAX, 100)
+
+    a = make_model()
+    P_direct = a.process(np.concatenate([up, rest]))
+    b = make_model()
+    P_minor = b.process(np.concatenate([up, minor, rest]))
+
+    assert np.isclose(P_minor[len(up) + len(minor) - 1], P_direct[len(up) - 1], rtol=0, atol=1e-9)
+    np.testing.assert_allclose(P_minor[-len(rest):], P_direct[-len(rest):], rtol=0, atol=1e-9)
+    assert b.depth == a.depth
+
+
+def test_matches_brute_force_relays():
+    """
+    グリッドノード上の入力では、Everett 表による評価がリレーを直接数える参照と一致する
+    """
+    g = np.linspace(-EMAX, EMAX, 161)
+    E = g[np.clip(np.rint((drive(n=400) + EMAX) / (g[1] - g[0])).astype(int), 0, len(g) - 1)]  # ノード上の入力
+    P = make_model(n_grid=161).process(E)
+    ref = relay_reference(E, 161, 2e6)
+    assert np.max(np.abs(P - ref)) < 1e-3
+
+
+def test_pr_target_fits_major_loop():
+    """
+    Pr_target を与えると主ループの |P(E=0)| がその値になり、Vc は反時計回りの符号
+    """
+    m = PreisachModel.from_tanh(Ec_V_per_m=EC, Pm_uC_cm2=PM, E_max_V_per_m=EMAX, Pr_target_uC_cm2=30.0, initial=1)
+    P = m.process(np.linspace(EMAX, 0.0, 300))
+    assert abs(P[-1] - 30.0) < 1e-6
+
+    E, P_up, P_dn = m.major_loop()
+    j0 = int(np.argmin(np.abs(E)))
+    assert abs(P_up[j0] + 30.0) < 1e-6
+
+    Ec_up, Ec_down = m.coercive_fields()
+    assert Ec_up > 0.0 and np.isclose(Ec_down, -Ec_up)
+
+    # Es → ∞ でも Pr は約 Pm/2 までしか下がらない
+    with pytest.raises(ValueError):
+        PreisachModel.from_tanh(Ec_V_per_m=EC, Pm_uC_cm2=PM, E_max_V_per_m=EMAX, Pr_target_uC_cm2=20.0)
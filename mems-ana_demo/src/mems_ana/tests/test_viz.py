@@ -0,0 +1,111 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+from functools import partial
+
+import numpy as np
+import pytest
+from PIL import Image, ImageSequence
+
+from mems_ana.viz import FieldRaster, GifWriter, PngWriter, SurfaceRenderer, open_writer, render_animation
+
+
+def surface_grid():
+    X, Y = np.meshgrid(np.linspace(0, 200, 60), np.linspace(0, 500, 80), indexing="xy")
+    S = np.sin(np.pi * X / 200) ** 2
+    return X, Y, S
+
+
+def make_renderer(X, Y):
+    return SurfaceRenderer(X, Y, vmin=0.0, vmax=500.0, z_scale=0.06, zticks=[0, 250, 500], figsize=(4.0, 3.2))
+
+
+def test_surface_update_is_pixel_identical_to_plot_surface():
+    """
+    set_verts による曲面の差し替えが、新しい図に plot_surface で描いた画像と画素単位で一致する
+    """
+    X, Y, S = surface_grid()
+    reused = make_renderer(X, Y)
+    reused.render(100.0 * S, "first")
+    for u0 in (250.0, 480.0):
+        fresh = make_renderer(X, Y).render(u0 * S, f"u0={u0}")
+        np.testing.assert_array_equal(reused.render(u0 * S, f"u0={u0}"), fresh)
+
+
+def decode(path):
+    with Image.open(path) as im:
+        return [np.asarray(f.convert("RGB")) for f in ImageSequence.Iterator(im)]
+
+
+def test_gif_round_trip(tmp_path):
+    """
+    差分矩形で書いた GIF を復号すると、フレーム数と各フレームの画素が減色後の入力と一致する
+    （同一フレームの連続・全面変化・固定パレットを含む）
+    """
+    r = FieldRaster((30, 40), vmin=0.0, vmax=1.0, scale=2, title="field")
+    x = np.linspace(0.0, 1.0, 40)[None, :] * np.ones((30, 1))
+    frames = [r.render(x * s, f"s={s:.1f}") for s in (0.2, 0.2, 0.5, 0.9)]
+    rng = np.random.default_rng(0)
+    frames.append(rng.integers(0, 256, frames[0].shape, dtype=np.uint8))  # 全面が変化
+    frames.append(frames[2])
+
+    for palette in (None, r.palette):
+        path = tmp_path / f"anim_{palette is None}.gif"
+        with GifWriter(path, duration_ms=50, palette=palette) as w:
+            expected = []
+            for rgb in frames:
+                idx, pal = w.encode(rgb)
+                expected.append(pal[idx])
+                w.write_encoded((idx, pal))
+        got = decode(path)
+        assert w.n_frames == len(got) == len(frames)
+        for a, b in zip(got, expected):
+            np.testing.assert_array_equal(a, b)
+
+
+def test_open_writer_rejects_options_of_other_writers(tmp_path):
+    """
+    選ばれたライターが受け取らない options は黙って捨てずに TypeError
+    """
+    with open_writer(tmp_path / "a.png", compress_level=0) as w:
+        assert isinstance(w, PngWriter) and w.compress_level == 0
+    with pytest.raises(TypeError, match="palette"):
+        open_writer(tmp_path / "a.png", palette=np.zeros((4, 3), dtype=np.uint8))
+    with pytest.raises(TypeError, match="crf"):
+        open_writer(tmp_path / "a.gif", crf=18)
+    assert not (tmp_path / "a.gif").exists()
+
+
+def counting_render(log, spec):
+    """
+    描画回数をファイルに記録する安価な render（ワーカープロセスからも数えられる）
+    """
+    with open(log, "a") as f:
+        f.write(f"{spec}\n")
+    return np.full((4, 6, 3), 40 * spec, dtype=np.uint8)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_render_animation_memoises_repeated_keys(tmp_path, workers):
+    """
+    key 指定時は同じキーのフレームを 1 回だけ描画し、書き出すフレーム列はメモ化なしと一致する
+    """
+    specs = [(i // 2) % 5 for i in range(60)]  # 5 状態の周期駆動（各状態 2 フレームずつ）
+    runs = {}
+    for memo in (False, True):
+        log = tmp_path / f"calls_{memo}.txt"
+        writer = PngWriter(tmp_path / f"memo_{memo}" / "f.png")
+        writer.path.parent.mkdir()
+        n = render_animation(
+            specs, partial(counting_render, log), writer,
+            key=(lambda s: s) if memo else None, workers=workers, chunk_size=7,
+        )
+        assert n == writer.n_frames == len(specs)
+        runs[memo] = ([p.read_bytes() for p in writer.paths], log.read_text().split())
+
+    (plain, plain_calls), (memod, memo_calls) = runs[False], runs[True]
+    assert len(plain_calls) == len(specs)
+    assert sorted(memo_calls) == [str(k) for k in range(5)]
+    assert memod == plain
+
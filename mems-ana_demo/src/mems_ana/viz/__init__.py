@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+"""
+mems_ana.viz
+
+Animation / rendering helpers for the demo scripts.
+"""
+
+from .animation import SurfaceRenderer, render_animation
+from .raster import FieldRaster, colormap_lut
+from .writers import GifWriter, Mp4Writer, PngWriter, open_writer
+
+__all__ = [
+    "FieldRaster",
+    "GifWriter",
+    "Mp4Writer",
+    "PngWriter",
+    "SurfaceRenderer",
+    "colormap_lut",
+    "open_writer",
+    "render_animation",
+]
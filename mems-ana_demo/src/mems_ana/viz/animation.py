@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+viz/animation.py
+
+Purpose:
+- uz(x,y) 3D 表示のフレームを「図を作り直さずに」描く SurfaceRenderer
+- フレーム列をチャンク単位で並列描画し、順番どおりにライターへ流す render_animation
+
+Notes:
+- 描画は Agg キャンバス直接（pyplot の状態を持たないのでワーカープロセスでも安全）
+- メモリは同時に処理中のチャンク数ぶんだけ（全フレームを保持しない）
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ProcessPoolExecutor
+import os
+from typing import Any, Callable, Hashable, Iterable, Sequence
+
+import numpy as np
+import matplotlib as mpl
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import Normalize
+from matplotlib.figure import Figure
+
+
+class SurfaceRenderer:
+    """
+    固定の図・軸・装飾を 1 回だけ作り、フレームごとに曲面とタイトルだけ差し替えます。
+
+    Z: (ny, nx) 表示値（色は Z、描画高さは Z * z_scale）
+
+    曲面は plot_surface と同じ分割（rcount = ccount = 50 の stride）の多角形を、
+    X, Y 固定のまま頂点 z と面色だけ更新します（Poly3DCollection.set_verts）。
+    """
+
+    def __init__(
+        self,
+        X: np.ndarray,
+        Y: np.ndarray,
+        *,
+        vmin: float,
+        vmax: float,
+        cmap: str = "viridis",
+        z_scale: float = 1.0,
+        zticks: Sequence[float] | None = None,
+        xlabel: str = "x",
+        ylabel: str = "y",
+        zlabel: str = "z",
+        box_aspect: tuple[float, float, float] | None = None,
+        view: tuple[float, float] = (28, -60),
+        figsize: tuple[float, float] = (6.2, 4.8),
+        dpi: float = 100,
+        title_fontsize: float = 9.5,
+        subplots_adjust: dict[str, float] | None = None,
+    ) -> None:
+        self.X = np.asarray(X, dtype=float)
+        self.Y = np.asarray(Y, dtype=float)
+        self.z_scale = float(z_scale)
+        self.cmap = mpl.colormaps[cmap]
+        self.norm = Normalize(vmin=vmin, vmax=vmax)
+
+        self.fig = Figure(figsize=figsize, dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.fig)
+        ax = self.fig.add_subplot(111, projection="3d")
+        self.ax = ax
+
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+        ax.set_xlim(float(self.X.min()), float(self.X.max()))
+        ax.set_ylim(float(self.Y.min()), float(self.Y.max()))
+        ax.set_zlim(vmin * self.z_scale, vmax * self.z_scale)
+        if zticks is not None:
+            ax.set_zticks([t * self.z_scale for t in zticks])
+            ax.set_zticklabels([f"{t:g}" for t in zticks])
+        ax.set_zlabel(zlabel)
+        if box_aspect is not None:
+            try:
+                ax.set_box_aspect(box_aspect)
+            except Exception:
+                pass
+        ax.view_init(elev=view[0], azim=view[1])
+
+        self.title = self.fig.suptitle("", fontsize=title_fontsize)
+        self.fig.subplots_adjust(**(subplots_adjust or dict(left=0.00, right=1.00, bottom=0.00, top=0.78)))
+        self._surf = None
+        self._perims, self._corners = _patch_indices(self.X.shape)
+
+    def render(self, Z: np.ndarray, title: str = "") -> np.ndarray:
+        """1 フレームを描画して RGB (h, w, 3) uint8 を返します。"""
+        Z = np.asarray(Z, dtype=float)
+        colors = self.cmap(self.norm(Z))
+        if self._surf is None or not np.isfinite(Z).all():
+            # 初回（または NaN を含む場合）は plot_surface に任せる
+            if self._surf is not None:
+                self._surf.remove()
+            self._surf = self.ax.plot_surface(
+                self.X, self.Y, Z * self.z_scale,
+                facecolors=colors,
+                linewidth=0,
+                antialiased=True,
+                shade=False,
+            )
+        else:
+            xyz = np.stack([self.X.ravel(), self.Y.ravel(), Z.ravel() * self.z_scale], axis=1)
+            self._surf.set_verts([xyz[p] for p in self._perims])
+            c = colors.reshape(-1, 4)[self._corners]
+            self._surf.set_facecolor(c)
+            self._surf.set_edgecolor(c)
+        self.title.set_text(title)
+        self.canvas.draw()
+        return np.asarray(self.canvas.buffer_rgba())[..., :3].copy()
+
+
+def render_animation(
+    frames: Iterable[Any],
+    render: Callable[[Any], np.ndarray],
+    writer,
+    *,
+    key: Callable[[Any], Hashable] | None = None,
+    workers: int | None = 1,
+    chunk_size: int = 16,
+) -> int:
+    """
+    frames の各要素（フレーム仕様）を render で RGB にし、writer へ順番どおりに流します。
+
+    - workers=1: 同一プロセスで逐次（render 側で SurfaceRenderer を使い回す）
+    - workers>1 / None: chunk_size 枚ずつワーカープロセスで描画 + エンコード。
+      処理中のチャンクは 2*workers 個までなのでメモリは一定。
+    - render と frames の要素は picklable であること（モジュール関数 + 値）。
+    - key: フレーム仕様 → 状態キー（例: 量子化した (V, 枝)）。同じキーのフレームは
+      最初の 1 枚だけ描画・エンコードし、以降はエンコード済みデータを再利用します。
+      周期駆動なら描画コストはサイクル数ではなくユニーク状態数に比例します
+      （保持するのはユニーク状態ぶんのエンコード済みフレーム）。
+
+    返り値: 書き出したフレーム数
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive.")
+    encode = writer.encoder
+    memo: dict[Hashable, Any] = {}
+    n = 0
+
+    if workers == 1:
+        for spec in frames:
+            if key is None:
+                writer.write_encoded(encode(render(spec)))
+            else:
+                k = key(spec)
+                if k not in memo:
+                    memo[k] = encode(render(spec))
+                writer.write_encoded(memo[k])
+            n += 1
+        return n
+
+    n_workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        # (チャンク内の各フレームのキー（key=None なら None）, 新規キー, 描画結果の Future)
+        pending: list[tuple[list | None, list, Future]] = []
+        submitted: set[Hashable] = set()
+        chunk: list[Any] = []
+
+        def submit() -> None:
+            keys = new = None
+            todo = chunk
+            if key is not None:
+                keys, new, todo = [], [], []
+                for spec in chunk:
+                    k = key(spec)
+                    keys.append(k)
+                    if k not in submitted:  # 先行チャンクで描画中 / 済みのキーは投げない
+                        submitted.add(k)
+                        new.append(k)
+                        todo.append(spec)
+            pending.append((keys, new, pool.submit(_render_chunk, render, encode, todo)))
+
+        def drain(limit: int) -> None:
+            nonlocal n
+            while len(pending) > limit:
+                keys, new, fut = pending.pop(0)
+                data = fut.result()
+                if keys is not None:
+                    memo.update(zip(new, data))
+                    data = [memo[k] for k in keys]
+                for d in data:
+                    writer.write_encoded(d)
+                    n += 1
+
+        for spec in frames:
+            chunk.append(spec)
+            if len(chunk) == chunk_size:
+                submit()
+                chunk = []
+                drain(2 * n_workers)
+        if chunk:
+            submit()
+        drain(0)
+    return n
+
+
+def _patch_indices(shape: tuple[int, int], rcount: int = 50, ccount: int = 50) -> tuple[list[np.ndarray], np.ndarray]:
+    """
+    plot_surface（facecolors 指定時）と同じ patch 分割の、各 patch 外周の平坦化インデックスと
+    面色を取る角 (rs, cs) のインデックス。
+    """
+    rows, cols = shape
+    rstride = int(max(np.ceil(rows / rcount), 1))
+    cstride = int(max(np.ceil(cols / ccount), 1))
+    row_inds = list(range(0, rows - 1, rstride)) + [rows - 1]
+    col_inds = list(range(0, cols - 1, cstride)) + [cols - 1]
+    idx = np.arange(rows * cols).reshape(rows, cols)
+
+    perims, corners = [], []
+    for rs, rs_next in zip(row_inds[:-1], row_inds[1:]):
+        for cs, cs_next in zip(col_inds[:-1], col_inds[1:]):
+            a = idx[rs:rs_next + 1, cs:cs_next + 1]
+            # 上辺 → 右辺 → 下辺（逆順）→ 左辺（逆順）
+            perims.append(np.concatenate([a[0, :-1], a[:-1, -1], a[-1, :0:-1], a[:0:-1, 0]]))
+            corners.append(idx[rs, cs])
+    return perims, np.array(corners)
+
+
+def _render_chunk(render: Callable[[Any], np.ndarray], encode: Callable[[np.ndarray], Any], specs: list) -> list:
+    return [encode(render(s)) for s in specs]
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+viz/raster.py
+
+Purpose:
+- 2D 場（uz(x,y), σzz(x,y) など）をヒートマップ画像にする軽量レンダラ FieldRaster
+- 値 → 色は 256 色のカラーマップ LUT を固定正規化で引くだけ（matplotlib の描画は使わない）
+- 注記テキストとカラーバーは Pillow の ImageDraw で描画
+
+Notes:
+- 固定タイトル・カラーバー・目盛・ラベルはテンプレート画像に 1 回だけ描き、フレームごとには
+  「テンプレートのコピー + 場の色付け + 可変の注記テキスト」だけを行う
+  （1 枚数 ms、matplotlib 描画の数十分の一。文字描画が一番重いので固定部分は title へ）
+- 色は matplotlib の cmap(Normalize(vmin, vmax)(field)) と同じ（範囲外は両端色、NaN は bad_color）
+- 出力は RGB (h, w, 3) uint8。viz.writers のライター（GIF / MP4 / PNG 連番）や
+  render_animation にそのまま渡せます。GIF は palette（固定パレット）を使うと減色も速い。
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+import matplotlib as mpl
+from matplotlib import font_manager
+from PIL import Image, ImageDraw, ImageFont
+
+N_COLORS = 256
+N_PALETTE_CMAP = 240  # GIF パレットのうちカラーマップに割り当てる色数（残りは灰色階調）
+
+
+def colormap_lut(cmap: str = "viridis", n: int = N_COLORS) -> np.ndarray:
+    """matplotlib カラーマップの (n, 3) uint8 LUT。"""
+    return mpl.colormaps[cmap].resampled(n)(np.arange(n), bytes=True)[:, :3].copy()
+
+
+class FieldRaster:
+    """
+    固定レイアウトのヒートマップレンダラ。
+
+    r = FieldRaster((ny, nx), vmin=0, vmax=500, label="uz [nm]", scale=3, title="uz(x,y) top view")
+    rgb = r.render(U_nm, "Vtop=+15.00 V | cycle 4 / 10")
+
+    shape: 場の配列形状 (ny, nx)（行 = y）
+    scale: 1 セルを scale×scale 画素に拡大（最近傍）
+    origin: "lower" なら y=0 を下に描く（imshow(origin="lower") と同じ向き）
+    title: 全フレーム共通の注記（テンプレートに 1 回だけ描画、改行可）
+    n_text_lines: title の下の可変注記欄の行数（render の text の行数に合わせる）
+    """
+
+    def __init__(
+        self,
+        shape: tuple[int, int],
+        *,
+        vmin: float,
+        vmax: float,
+        cmap: str = "viridis",
+        scale: int = 1,
+        origin: str = "lower",
+        label: str = "",
+        title: str = "",
+        ticks: Sequence[float] | None = None,
+        tick_format: str = "{:g}",
+        n_text_lines: int = 1,
+        font_size: int = 12,
+        colorbar: bool = True,
+        background: tuple[int, int, int] = (255, 255, 255),
+        bad_color: tuple[int, int, int] = (255, 255, 255),
+    ) -> None:
+        if not vmax > vmin:
+            raise ValueError("vmax must be greater than vmin.")
+        if scale < 1:
+            raise ValueError("scale must be >= 1.")
+        if origin not in ("lower", "upper"):
+            raise ValueError("origin must be 'lower' or 'upper'.")
+
+        self.shape = (int(shape[0]), int(shape[1]))
+        self.vmin = float(vmin)
+        self.vmax = float(vmax)
+        self.scale = int(scale)
+        self.origin = origin
+        self.cmap = cmap
+        # 末尾に bad 色（NaN 用）を追加した LUT
+        self.lut = np.vstack([colormap_lut(cmap), np.asarray(bad_color, dtype=np.uint8)])
+        self.font = _font(font_size)
+
+        # ---------- layout ----------
+        pad = max(4, font_size // 2)
+        line_h = _text_height(self.font) + 3
+        h = self.shape[0] * self.scale
+        w = self.shape[1] * self.scale
+        title_h = (title.count("\n") + 1) * line_h if title else 0
+        self.text_xy = (pad, pad + title_h)
+        self.text_h = pad + title_h + n_text_lines * line_h  # 可変注記欄の下端
+        self.field_xy = (pad, self.text_h + pad)
+
+        ticks = list(np.linspace(self.vmin, self.vmax, 5)) if ticks is None else list(ticks)
+        tick_labels = [tick_format.format(t) for t in ticks]
+        cb_w = 14 if colorbar else 0
+        cb_x = self.field_xy[0] + w + 2 * pad
+        tick_w = max((self.font.getlength(s) for s in tick_labels), default=0) if colorbar else 0
+        label_w = self.font.getlength(label) if colorbar and label else 0
+        width = int(cb_x + max(cb_w + 4 + tick_w, label_w) + pad) if colorbar else self.field_xy[0] + w + pad
+        height = self.field_xy[1] + h + pad + (line_h if label_w else 0)
+        if title:
+            width = max(width, int(2 * pad + max(self.font.getlength(t) for t in title.split("\n"))))
+
+        template = Image.new("RGB", (width, height), tuple(background))
+        if title:
+            ImageDraw.Draw(template).multiline_text((pad, pad), title, fill=(0, 0, 0), font=self.font, spacing=3)
+        if colorbar:
+            x0, y0 = cb_x, self.field_xy[1]
+            # 上が vmax
+            grad = np.linspace(self.vmax, self.vmin, h)[:, None].repeat(cb_w, axis=1)
+            template.paste(Image.fromarray(self.colorize(grad), "RGB"), (x0, y0))
+            draw = ImageDraw.Draw(template)
+            draw.rectangle([x0 - 1, y0 - 1, x0 + cb_w, y0 + h], outline=(0, 0, 0))
+            for t, s in zip(ticks, tick_labels):
+                if not self.vmin <= t <= self.vmax:
+                    continue
+                y = y0 + (h - 1) * (self.vmax - t) / (self.vmax - self.vmin)
+                draw.line([x0 + cb_w, y, x0 + cb_w + 3, y], fill=(0, 0, 0))
+                draw.text((x0 + cb_w + 5, y), s, fill=(0, 0, 0), font=self.font, anchor="lm")
+            if label_w:
+                draw.text((x0, y0 + h + pad), label, fill=(0, 0, 0), font=self.font, anchor="lt")
+        self.template = np.asarray(template).copy()
+
+    @property
+    def palette(self) -> np.ndarray:
+        """
+        GIF 用の固定パレット (256, 3) uint8: カラーマップ 240 色 + 白→黒 16 階調（注記文字用）。
+        GifWriter(palette=...) に渡すと、フレームごとの適応減色が不要になります。
+        """
+        grays = np.linspace(255, 0, N_COLORS - N_PALETTE_CMAP).round().astype(np.uint8)
+        return np.vstack([colormap_lut(self.cmap, N_PALETTE_CMAP), np.repeat(grays[:, None], 3, axis=1)])
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """画像サイズ (width, height)。"""
+        return self.template.shape[1], self.template.shape[0]
+
+    def colorize(self, field: np.ndarray) -> np.ndarray:
+        """場 (...) → RGB (..., 3) uint8（任意形状・複数フレームを一括でも可）。"""
+        field = np.asarray(field, dtype=float)
+        idx = (field - self.vmin) * (N_COLORS / (self.vmax - self.vmin))
+        np.clip(idx, 0, N_COLORS - 1, out=idx)
+        nan = np.isnan(idx)
+        if nan.any():
+            idx[nan] = N_COLORS  # bad 色
+        return self.lut[idx.astype(np.intp)]
+
+    def render(self, field: np.ndarray, text: str = "") -> np.ndarray:
+        """1 フレーム（注記 + ヒートマップ + カラーバー）を RGB (h, w, 3) uint8 で返します。"""
+        field = np.asarray(field)
+        if field.shape != self.shape:
+            raise ValueError(f"field shape {field.shape} does not match renderer shape {self.shape}.")
+        if self.origin == "lower":
+            field = field[::-1]
+        img = self.colorize(field)
+
+        out = self.template.copy()
+        ny, nx = self.shape
+        s = self.scale
+        x0, y0 = self.field_xy
+        # 最近傍拡大は (ny, s, nx, s, 3) のビューへのブロードキャスト代入（中間配列なし）
+        view = out[y0:y0 + ny * s, x0:x0 + nx * s]
+        view.shape = (ny, s, nx, s, 3)
+        view[...] = img[:, None, :, None, :]
+        if text:
+            y1 = self.text_xy[1]
+            band = Image.fromarray(out[y1:self.text_h])
+            ImageDraw.Draw(band).multiline_text((self.text_xy[0], 0), text, fill=(0, 0, 0), font=self.font, spacing=3)
+            out[y1:self.text_h] = np.asarray(band)
+        return out
+
+
+def _font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    """matplotlib 同梱の DejaVu Sans（µ, σ, Δ を含む）。無ければ Pillow の既定フォント。"""
+    try:
+        return ImageFont.truetype(font_manager.findfont("DejaVu Sans", fallback_to_default=True), size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+def _text_height(font: ImageFont.FreeTypeFont | ImageFont.ImageFont) -> int:
+    left, top, right, bottom = font.getbbox("Ag|µσΔ")
+    return int(bottom)
@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+"""
+viz/writers.py
+
+Purpose:
+- アニメーションのフレームを 1 枚ずつエンコーダへ流す（全フレームをメモリに溜めない）
+- GIF: Pillow の GIF エンコーダをフレーム単位で使用（ヘッダ → フレーム → 終端）。
+  2 枚目以降は前フレームから変化した矩形だけを書く（3D 曲面の動画は軸・ラベルが静止）
+- MP4: ffmpeg へ rawvideo をパイプ（ffmpeg が PATH にある場合のみ）
+- PNG: 連番ファイル（<stem>_00000.png, ...）。設計レビュー用の大量マップ出力向け
+
+Notes:
+- encode() と write_encoded() を分けてあるので、エンコードは並列ワーカー側で行い、
+  同じ状態のフレームはエンコード済みデータを再利用できます（viz.animation 参照）。
+"""
+
+from __future__ import annotations
+
+from functools import partial
+import io
+from pathlib import Path
+import shutil
+import subprocess
+from typing import Any, Callable
+
+import numpy as np
+from PIL import GifImagePlugin, Image
+
+
+class GifWriter:
+    """
+    フレームを逐次書き出す GIF ライター（各フレームは適応パレット + ローカルカラーテーブル）。
+
+    2 枚目以降は、表示中の画像（直前フレーム）と色が変わった画素を囲む矩形だけを
+    オフセット付きで書き出します（disposal=1 = 前の画像の上に重ねる）。矩形内の変化して
+    いない画素は、変化した画素が使っていないパレット番号を透明色にして塗り、LZW の連長を
+    稼ぎます。復号した各フレームは全画面で書いた場合と同じ画素になります。
+
+    with GifWriter(path, duration_ms=110) as w:
+        for rgb in frames:
+            w.write(rgb)
+
+    palette: (n<=256, 3) uint8 の固定パレット（例: FieldRaster.palette）。
+      指定すると減色は最近傍色への割り当てだけになり、適応パレットより 1 桁以上速い。
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        duration_ms: int = 100,
+        loop: int = 0,
+        palette: np.ndarray | None = None,
+    ) -> None:
+        self.path = Path(path)
+        self.duration_ms = int(duration_ms)
+        self.loop = int(loop)
+        self.palette = None
+        if palette is not None:
+            self.palette = np.asarray(palette, dtype=np.uint8).reshape(-1, 3)
+            if not 1 <= self.palette.shape[0] <= 256:
+                raise ValueError("GIF palette must have 1..256 colors.")
+        self.n_frames = 0
+        self._prev: np.ndarray | None = None  # 表示中の画像（減色後の RGB）
+        self._fp = open(self.path, "wb")
+
+    @property
+    def encoder(self) -> Callable[[np.ndarray], Any]:
+        """RGB → エンコード済みフレーム（picklable、ワーカー側で使用可）。"""
+        return partial(_encode_gif_frame, palette=self.palette)
+
+    def encode(self, rgb: np.ndarray) -> Any:
+        return self.encoder(rgb)
+
+    def write_encoded(self, frame: Any) -> None:
+        idx, pal = frame
+        rgb = pal[idx]
+        h, w = idx.shape
+        unchanged = None
+        if self._prev is None:
+            # 論理画面サイズとループ指定のみ（色は各フレームのローカルカラーテーブル）
+            info = {"loop": self.loop, "duration": self.duration_ms}
+            self._fp.write(b"".join(GifImagePlugin.getheader(Image.new("P", (w, h)), info=info)[0]))
+            x0, y0, x1, y1 = 0, 0, w, h
+        elif rgb.shape != self._prev.shape:
+            raise ValueError("All GIF frames must have the same size.")
+        else:
+            changed = np.any(rgb != self._prev, axis=2)
+            rows = np.flatnonzero(changed.any(axis=1))
+            if rows.size == 0:
+                x0, y0, x1, y1 = 0, 0, 1, 1  # 変化なしでも表示時間のため 1 画素書く
+            else:
+                cols = np.flatnonzero(changed.any(axis=0))
+                x0, y0, x1, y1 = int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1
+                unchanged = ~changed[y0:y1, x0:x1]
+        self._prev = rgb
+
+        crop = idx[y0:y1, x0:x1]
+        params: dict[str, Any] = {}
+        if unchanged is not None:
+            # 変化した画素が使っていない番号を透明色に（前の画像がそのまま見える）
+            free = np.flatnonzero(np.bincount(crop[~unchanged], minlength=256) == 0)
+            if free.size:
+                t = int(free[0])
+                crop = np.where(unchanged, np.uint8(t), crop)
+                if t >= len(pal):
+                    pal = np.vstack([pal, np.zeros((t + 1 - len(pal), 3), dtype=np.uint8)])
+                params["transparency"] = t
+        im = Image.frombytes("P", (x1 - x0, y1 - y0), np.ascontiguousarray(crop).tobytes())
+        im.putpalette(pal.tobytes())
+        data = GifImagePlugin.getdata(
+            im, offset=(x0, y0), duration=self.duration_ms, disposal=1, include_color_table=True, **params
+        )
+        self._fp.write(b"".join(data))
+        self.n_frames += 1
+
+    def write(self, rgb: np.ndarray) -> None:
+        self.write_encoded(self.encode(rgb))
+
+    def close(self) -> None:
+        if self._fp.closed:
+            return
+        if self.n_frames:
+            self._fp.write(b";")  # trailer
+        self._fp.close()
+
+    def __enter__(self) -> "GifWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class Mp4Writer:
+    """ffmpeg (libx264, yuv420p) へフレームをパイプする MP4 ライター。"""
+
+    def __init__(self, path: str | Path, *, fps: float = 10.0, crf: int = 20) -> None:
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg is None:
+            raise RuntimeError("ffmpeg not found on PATH; write a .gif instead.")
+        self.path = Path(path)
+        self.fps = float(fps)
+        self.crf = int(crf)
+        self.n_frames = 0
+        self._ffmpeg = ffmpeg
+        self._proc: subprocess.Popen | None = None
+        self._size: tuple[int, int] | None = None
+
+    @property
+    def encoder(self) -> Callable[[np.ndarray], Any]:
+        return _encode_raw
+
+    def encode(self, rgb: np.ndarray) -> Any:
+        return _encode_raw(rgb)
+
+    def write_encoded(self, frame: Any) -> None:
+        if self._proc is None:
+            h, w = frame.shape[:2]
+            self._size = (w, h)
+            self._proc = subprocess.Popen(
+                [
+                    self._ffmpeg, "-y", "-loglevel", "error",
+                    "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{w}x{h}", "-r", f"{self.fps}", "-i", "-",
+                    "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",  # yuv420p は偶数サイズのみ
+                    "-vcodec", "libx264", "-pix_fmt", "yuv420p", "-crf", str(self.crf),
+                    str(self.path),
+                ],
+                stdin=subprocess.PIPE,
+            )
+        elif frame.shape[1::-1] != self._size:
+            raise ValueError("All MP4 frames must have the same size.")
+        self._proc.stdin.write(frame.tobytes())
+        self.n_frames += 1
+
+    def write(self, rgb: np.ndarray) -> None:
+        self.write_encoded(self.encode(rgb))
+
+    def close(self) -> None:
+        if self._proc is None or self._proc.stdin.closed:
+            return
+        self._proc.stdin.close()
+        if self._proc.wait() != 0:
+            raise RuntimeError(f"ffmpeg failed writing {self.path}.")
+
+    def __enter__(self) -> "Mp4Writer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class PngWriter:
+    """
+    フレームを連番 PNG として書き出すライター。
+
+    PngWriter("outputs/maps/uz.png") → uz_00000.png, uz_00001.png, ...
+    compress_level は zlib の圧縮レベル（小さいほど速い）。
+    """
+
+    def __init__(self, path: str | Path, *, compress_level: int = 1) -> None:
+        self.path = Path(path)
+        self.compress_level = int(compress_level)
+        self.n_frames = 0
+        self.paths: list[Path] = []
+
+    @property
+    def encoder(self) -> Callable[[np.ndarray], Any]:
+        return partial(_encode_png, compress_level=self.compress_level)
+
+    def encode(self, rgb: np.ndarray) -> Any:
+        return self.encoder(rgb)
+
+    def frame_path(self, i: int) -> Path:
+        return self.path.with_name(f"{self.path.stem}_{i:05d}{self.path.suffix}")
+
+    def write_encoded(self, frame: Any) -> None:
+        path = self.frame_path(self.n_frames)
+        path.write_bytes(frame)
+        self.paths.append(path)
+        self.n_frames += 1
+
+    def write(self, rgb: np.ndarray) -> None:
+        self.write_encoded(self.encode(rgb))
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "PngWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def open_writer(path: str | Path, *, fps: float = 10.0, **options: Any) -> GifWriter | Mp4Writer | PngWriter:
+    """
+    拡張子 (.gif / .mp4 / .png = 連番) からライターを選びます。
+    options はライター固有の引数（GIF の loop / palette、MP4 の crf、PNG の compress_level）で、
+    選ばれたライターが受け取らないものは TypeError（黙って捨てない）。
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix == ".gif":
+        return GifWriter(path, duration_ms=int(round(1000.0 / fps)), **_check(options, suffix, "loop", "palette"))
+    if suffix == ".mp4":
+        return Mp4Writer(path, fps=fps, **_check(options, suffix, "crf"))
+    if suffix == ".png":
+        return PngWriter(path, **_check(options, suffix, "compress_level"))
+    raise ValueError(f"Unsupported animation format: {suffix!r} (use .gif, .mp4 or .png).")
+
+
+def _check(options: dict[str, Any], suffix: str, *names: str) -> dict[str, Any]:
+    unknown = sorted(set(options) - set(names))
+    if unknown:
+        raise TypeError(f"open_writer got option(s) {unknown} not accepted by the {suffix} writer (accepts {list(names)}).")
+    return options
+
+
+def _encode_gif_frame(
+    rgb: np.ndarray,
+    *,
+    palette: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    RGB → 減色済みフレーム (インデックス (h, w) uint8, パレット (n, 3) uint8)。
+    減色（重い部分）はここ（ワーカー側）で行い、差分矩形の切り出しと LZW は
+    直前フレームを知っている GifWriter.write_encoded が行います。
+    """
+    im = Image.fromarray(np.ascontiguousarray(rgb[..., :3]), "RGB")
+    if palette is None:
+        im = im.convert("P", palette=Image.ADAPTIVE)
+        n = 256
+    else:
+        pal = Image.new("P", (1, 1))
+        pal.putpalette(palette.tobytes())
+        im = im.quantize(palette=pal, dither=Image.Dither.NONE)
+        n = len(palette)
+    idx = np.asarray(im, dtype=np.uint8)
+    colors = np.asarray(im.getpalette("RGB"), dtype=np.uint8).reshape(-1, 3)
+    n = max(min(n, len(colors)), int(idx.max()) + 1)
+    return idx, colors[:n]
+
+
+def _encode_png(rgb: np.ndarray, *, compress_level: int) -> bytes:
+    buf = io.BytesIO()
+    Image.fromarray(np.ascontiguousarray(rgb[..., :3]), "RGB").save(buf, format="PNG", compress_level=compress_level)
+    return buf.getvalue()
+
+
+def _encode_raw(rgb: np.ndarray) -> np.ndarray:
+    return np.ascontiguousarray(rgb[..., :3], dtype=np.uint8)